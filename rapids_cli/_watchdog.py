@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Run calls that may block indefinitely under a deadline."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class WatchdogTimeoutError(TimeoutError):
+    """Raised when a call guarded by ``call_with_timeout`` misses its deadline."""
+
+
+def call_with_timeout(
+    fn: Callable[..., T], timeout: float | None, *args: Any, **kwargs: Any
+) -> T:
+    """Call ``fn(*args, **kwargs)`` and wait at most ``timeout`` seconds for it.
+
+    The call runs in a daemon worker thread. Python cannot interrupt a thread
+    that is blocked inside a C library, so on timeout the worker is abandoned
+    rather than stopped; being a daemon thread it never keeps the process
+    alive.
+
+    Args:
+        fn: The callable to run.
+        timeout: Deadline in seconds. ``None`` calls ``fn`` directly.
+        *args: Positional arguments for ``fn``.
+        **kwargs: Keyword arguments for ``fn``.
+
+    Raises:
+        WatchdogTimeoutError: If ``fn`` did not return within ``timeout`` seconds.
+    """
+    if timeout is None:
+        return fn(*args, **kwargs)
+
+    outcome: dict[str, Any] = {}
+    done = threading.Event()
+
+    def _target() -> None:
+        try:
+            outcome["value"] = fn(*args, **kwargs)
+        except BaseException as e:
+            outcome["error"] = e
+        finally:
+            done.set()
+
+    name = getattr(fn, "__name__", "call")
+    threading.Thread(target=_target, name=f"watchdog-{name}", daemon=True).start()
+    if not done.wait(max(timeout, 0)):
+        raise WatchdogTimeoutError(f"{name} did not finish within {timeout:.3g}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
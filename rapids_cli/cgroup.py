@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Memory and CPU limits imposed on a process by Linux cgroups.
+
+Containers see the host's RAM and CPU count through ``/proc``, while the
+cgroup the container runs in may allow far less. Both cgroup v2 (a single
+unified hierarchy) and cgroup v1 (one hierarchy per controller) are read.
+
+The effective limit is the tightest one between the process's cgroup and the
+root of the hierarchy. Every function takes an optional ``root`` standing in
+for ``/sys/fs/cgroup`` so it can be pointed at a fixture tree, and an optional
+``pid`` of another process to read the limits of instead of this one; missing
+files mean no limit.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+PROC_SELF_CGROUP = Path("/proc/self/cgroup")
+
+# cgroup v1 reports "no limit" as the largest page-aligned 64-bit value rather
+# than a keyword; anything this large is treated as unlimited.
+_V1_UNLIMITED = 1 << 60
+
+
+def _read(path: Path) -> str | None:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def is_v2(root: Path | None = None) -> bool:
+    """Return whether ``root`` is a cgroup v2 (unified) hierarchy."""
+    return ((root or CGROUP_ROOT) / "cgroup.controllers").exists()
+
+
+def _process_cgroup(controller: str | None, pid: int | None = None) -> str:
+    """Return a process's cgroup path for a v1 ``controller``, or for v2 if ``None``."""
+    cgroups = PROC_SELF_CGROUP if pid is None else Path(f"/proc/{pid}/cgroup")
+    for line in (_read(cgroups) or "").splitlines():
+        _, controllers, path = line.split(":", 2)
+        if controller is None and controllers == "":
+            return path
+        if controller is not None and controller in controllers.split(","):
+            return path
+    return "/"
+
+
+def _hierarchy(base: Path, cgroup: str) -> list[Path]:
+    """Return the cgroup directories from the process's cgroup up to ``base``.
+
+    Inside a cgroup namespace the process's own cgroup is mounted at ``base``,
+    so a path that does not exist below it falls back to ``base`` alone.
+    """
+    directory = base / cgroup.lstrip("/")
+    if not directory.is_dir():
+        return [base]
+    relative = directory.relative_to(base)
+    return [base / parent for parent in (relative, *relative.parents)]
+
+
+def memory_limit_bytes(root: Path | None = None, pid: int | None = None) -> int | None:
+    """Return the cgroup memory limit in bytes, or ``None`` when unlimited."""
+    root = root or CGROUP_ROOT
+    if is_v2(root):
+        directories = _hierarchy(root, _process_cgroup(None, pid))
+        filename = "memory.max"
+    else:
+        directories = _hierarchy(root / "memory", _process_cgroup("memory", pid))
+        filename = "memory.limit_in_bytes"
+
+    limits = []
+    for directory in directories:
+        value = _read(directory / filename)
+        if value and value.isdigit() and int(value) < _V1_UNLIMITED:
+            limits.append(int(value))
+    return min(limits, default=None)
+
+
+def cpu_limit(root: Path | None = None, pid: int | None = None) -> float | None:
+    """Return the cgroup CPU limit in CPUs, or ``None`` when unlimited.
+
+    The limit is the CFS quota divided by its period, so it may be
+    fractional, e.g. ``2.5``.
+    """
+    root = root or CGROUP_ROOT
+    limits = []
+    if is_v2(root):
+        for directory in _hierarchy(root, _process_cgroup(None, pid)):
+            quota, _, period = (_read(directory / "cpu.max") or "max").partition(" ")
+            if quota.isdigit() and period.isdigit() and int(period):
+                limits.append(int(quota) / int(period))
+    else:
+        base = root / "cpu"
+        if not base.is_dir():
+            base = root / "cpu,cpuacct"
+        for directory in _hierarchy(base, _process_cgroup("cpu", pid)):
+            quota = _read(directory / "cpu.cfs_quota_us") or "-1"
+            period = _read(directory / "cpu.cfs_period_us") or "0"
+            if quota.isdigit() and period.isdigit() and int(period):
+                limits.append(int(quota) / int(period))
+    return min(limits, default=None)
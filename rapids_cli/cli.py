@@ -2,13 +2,125 @@
 # SPDX-License-Identifier: Apache-2.0
 """The Rapids CLI is a command-line interface for RAPIDS."""
 
+import re
+import sys
+
 import rich_click as click
-from rich.traceback import install
 
-from rapids_cli.debug import run_debug
-from rapids_cli.doctor import doctor_check
+# The doctor and debug modules are imported by the commands that use them, so
+# that e.g. 'rapids doctor --client' only imports what it needs.
+
+
+def _rich_excepthook(exc_type, exc_value, exc_traceback):
+    """Render an uncaught exception with rich, importing it only when one occurs."""
+    from rich.traceback import install
+
+    install(show_locals=True)
+    sys.excepthook(exc_type, exc_value, exc_traceback)
+
+
+sys.excepthook = _rich_excepthook
+
+
+class Duration(click.ParamType):
+    """A duration such as ``250ms``, ``2s`` or ``1m``, converted to seconds."""
+
+    name = "duration"
+    _UNITS = {"ms": 1e-3, "s": 1.0, "m": 60.0}
+
+    def convert(self, value, param, ctx):
+        """Parse ``value`` into a number of seconds."""
+        if isinstance(value, (int, float)):
+            return float(value)
+        match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*(ms|s|m)?\s*", value)
+        if not match:
+            self.fail(f"{value!r} is not a duration like '250ms' or '2s'", param, ctx)
+        return float(match.group(1)) * self._UNITS[match.group(2) or "s"]
+
+
+class ByteSize(click.ParamType):
+    """A memory size such as ``512M`` or ``2G``, converted to bytes."""
+
+    name = "size"
+    _UNITS = {"": 1, "K": 2**10, "M": 2**20, "G": 2**30, "T": 2**40}
+
+    def convert(self, value, param, ctx):
+        """Parse ``value`` into a number of bytes."""
+        if isinstance(value, int):
+            return value
+        match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)I?B?\s*", value.upper())
+        if not match:
+            self.fail(f"{value!r} is not a size like '512M' or '2G'", param, ctx)
+        return int(float(match.group(1)) * self._UNITS[match.group(2)])
+
+
+class DeviceList(click.ParamType):
+    """A comma-separated list of GPUs such as ``0,2``, in ``CUDA_VISIBLE_DEVICES`` form."""
+
+    name = "devices"
 
-install(show_locals=True)
+    def convert(self, value, param, ctx):
+        """Parse ``value`` into a list of device ordinals and UUIDs."""
+        if isinstance(value, list):
+            return value
+        entries = [part.strip() for part in value.split(",")]
+        if not all(
+            entry.isdigit() or entry.startswith(("GPU-", "MIG-")) for entry in entries
+        ):
+            self.fail(
+                f"{value!r} is not a list of GPU ordinals or UUIDs like '0,2'",
+                param,
+                ctx,
+            )
+        return list(dict.fromkeys(entries))
+
+
+class SectionList(click.ParamType):
+    """A comma-separated list of ``rapids debug`` section names."""
+
+    name = "sections"
+
+    def convert(self, value, param, ctx):
+        """Parse ``value`` into a list of section names."""
+        if isinstance(value, list):
+            return value
+        from rapids_cli.debug.debug import SECTIONS
+
+        names = [part.strip() for part in value.split(",") if part.strip()]
+        unknown = [name for name in names if name not in SECTIONS]
+        if unknown:
+            self.fail(
+                f"unknown section(s) {', '.join(unknown)}; choose from "
+                f"{', '.join(SECTIONS)}",
+                param,
+                ctx,
+            )
+        return names
+
+
+class ReportPath(click.Path):
+    """The path of an existing ``rapids debug`` report, or ``live`` for the running system."""
+
+    def __init__(self) -> None:
+        """Accept only existing files besides ``live``."""
+        super().__init__(exists=True, dir_okay=False)
+
+    def convert(self, value, param, ctx):
+        """Check that ``value`` is ``live`` or names an existing file."""
+        if value == "live":
+            return value
+        return super().convert(value, param, ctx)
+
+
+def _reject_options(mode: str, **options) -> None:
+    """Raise a UsageError naming the ``options`` that were given but do not apply to ``mode``."""
+    given = [
+        "check filters" if name == "filters" else f"--{name.replace('_', '-')}"
+        for name, value in options.items()
+        if value is not None and value is not False and value != ()
+    ]
+    if given:
+        raise click.UsageError(f"{mode} cannot be combined with {', '.join(given)}.")
 
 
 @click.group()
@@ -26,19 +138,201 @@ def rapids():
     is_flag=True,
     help="Perform a dry run without making any changes.",
 )
+@click.option(
+    "--daemon",
+    is_flag=True,
+    help="Keep providers and checks warm and serve results over a Unix socket.",
+)
+@click.option(
+    "--client",
+    is_flag=True,
+    help="Get results from a running 'rapids doctor --daemon'.",
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Unix socket used by --daemon and --client.",
+)
+@click.option(
+    "--budget",
+    type=Duration(),
+    default=None,
+    help="Time budget such as '250ms'. Checks that do not fit are reported as not run.",
+)
+@click.option(
+    "--isolate",
+    is_flag=True,
+    help="Run each check in a separate worker process so crashes cannot spread.",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes for --isolate. Defaults to the CPU count.",
+)
+@click.option(
+    "--check-timeout",
+    type=Duration(),
+    default=None,
+    help="Fail any single check that runs longer than this, e.g. '30s'.",
+)
+@click.option(
+    "--max-rss",
+    type=ByteSize(),
+    default=None,
+    help="Fail any check whose worker uses more memory than this, e.g. '2G'. Implies --isolate.",
+)
+@click.option(
+    "--fail-fast",
+    is_flag=True,
+    help="Stop after the first failing check and report the rest as cancelled.",
+)
+@click.option(
+    "--devices",
+    type=DeviceList(),
+    default=None,
+    help="Only check these GPUs, as ordinals or UUIDs, e.g. '0,2'. "
+    "Defaults to CUDA_VISIBLE_DEVICES.",
+)
 @click.argument("filters", nargs=-1)
-def doctor(verbose, dry_run, filters):
+def doctor(
+    verbose,
+    dry_run,
+    daemon,
+    client,
+    socket_path,
+    budget,
+    isolate,
+    jobs,
+    check_timeout,
+    max_rss,
+    fail_fast,
+    devices,
+    filters,
+):
     """Run health checks to ensure RAPIDS is installed correctly."""
-    status = doctor_check(verbose, dry_run, filters)
+    if daemon and client:
+        raise click.UsageError("--daemon and --client are mutually exclusive.")
+    if daemon:
+        _reject_options(
+            "--daemon",
+            filters=filters,
+            dry_run=dry_run,
+            budget=budget,
+            isolate=isolate,
+            jobs=jobs,
+            check_timeout=check_timeout,
+            max_rss=max_rss,
+            fail_fast=fail_fast,
+            devices=devices,
+        )
+        from rapids_cli.doctor.daemon import serve
+
+        serve(socket_path, verbose=verbose)
+        return
+    if client:
+        _reject_options(
+            "--client", dry_run=dry_run, isolate=isolate, jobs=jobs, max_rss=max_rss
+        )
+        from rapids_cli.doctor.daemon import DaemonError, run_client
+
+        try:
+            status = run_client(
+                verbose,
+                filters,
+                socket_path,
+                budget=budget,
+                check_timeout=check_timeout,
+                fail_fast=fail_fast,
+                devices=devices,
+            )
+        except DaemonError as e:
+            raise click.ClickException(str(e)) from e
+    else:
+        from rapids_cli.doctor import doctor_check
+
+        status = doctor_check(
+            verbose,
+            dry_run,
+            filters,
+            budget=budget,
+            isolate=isolate or max_rss is not None,
+            jobs=jobs,
+            check_timeout=check_timeout,
+            max_rss=max_rss,
+            fail_fast=fail_fast,
+            devices=devices,
+        )
     if not status:
         raise click.ClickException("Health checks failed.")
 
 
 @rapids.command()
 @click.option("--json", is_flag=True, help="Enable JSON mode for detailed output.")
-def debug(json):
+@click.option(
+    "--nvidia-smi",
+    "nvidia_smi",
+    is_flag=True,
+    help="Also include the raw output of nvidia-smi.",
+)
+@click.option(
+    "--only",
+    type=SectionList(),
+    default=None,
+    help="Only gather these sections, e.g. 'gpu,python'.",
+)
+@click.option(
+    "--skip",
+    type=SectionList(),
+    default=None,
+    help="Leave out these sections, e.g. 'conda,pip'.",
+)
+@click.option(
+    "--bundle",
+    type=click.Path(dir_okay=False, allow_dash=True),
+    default=None,
+    help="Write each section to its own file in this .tar.gz archive ('-' for stdout).",
+)
+@click.option(
+    "--diff",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Show what changed since this saved report, against NEW or the live system.",
+)
+@click.argument("new", required=False, type=ReportPath())
+def debug(json, nvidia_smi, only, skip, bundle, diff, new):
     """Gather debugging information for RAPIDS."""
-    run_debug(output_format="json" if json else "console")
+    if json and bundle is not None:
+        raise click.UsageError("--json and --bundle cannot be used together.")
+    if diff is not None:
+        if bundle is not None:
+            raise click.UsageError("--diff and --bundle cannot be used together.")
+        if nvidia_smi:
+            # The raw output is compared whenever the saved report has it.
+            raise click.UsageError("--diff and --nvidia-smi cannot be used together.")
+        from rapids_cli.debug import run_diff
+
+        run_diff(
+            diff,
+            new or "live",
+            output_format="json" if json else "console",
+            only=only,
+            skip=skip,
+        )
+        return
+    if new is not None:
+        raise click.UsageError("A report to compare with needs --diff.")
+    from rapids_cli.debug import run_debug
+
+    run_debug(
+        output_format="json" if json else "console",
+        nvidia_smi=nvidia_smi,
+        only=only,
+        skip=skip,
+        bundle=bundle,
+    )
 
 
 if __name__ == "__main__":
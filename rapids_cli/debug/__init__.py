@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 """This module contains the debug subcommand for the Rapids CLI."""
 
-from .debug import run_debug
+from .debug import SECTIONS, run_debug
+from .diff import run_diff
 
-__all__ = ["run_debug"]
+__all__ = ["SECTIONS", "run_debug", "run_diff"]
@@ -2,21 +2,72 @@
 # SPDX-License-Identifier: Apache-2.0
 """This module contains the debug subcommand for the Rapids CLI."""
 
+import io
 import json
+import os
 import platform
 import subprocess
 import sys
+import tarfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict
 from datetime import datetime
 from importlib.metadata import distributions, version
 from pathlib import Path
+from typing import Any
 
 from rich.console import Console
 from rich.table import Table
 
+from rapids_cli.gpudirect import (
+    GDS_MODULE,
+    PEERMEM_MODULES,
+    cufile_json_path,
+    gds_compat_mode_allowed,
+    loaded_modules,
+    rdma_ports,
+    read_cufile_json,
+)
+from rapids_cli.host_memory import (
+    hugepages,
+    memlock_limits,
+    shm_usage,
+    transparent_hugepage_mode,
+)
 from rapids_cli.providers import get_gpu_info, get_system_info
+from rapids_cli.topology import (
+    format_cpulist,
+    gpu_topology,
+    numa_nodes,
+    process_affinity,
+)
 
 console = Console()
 
+# One directory per GPU, named by PCI address, with an "information" file.
+NVIDIA_PROC_GPUS = Path("/proc/driver/nvidia/gpus")
+
+# Environment variables reported by gather_environment, by name or prefix.
+# Only these environment variables are reported, since reports are attached
+# to public bug reports. Values of those whose names suggest a credential are
+# redacted.
+ENVIRONMENT_PREFIXES = ("CUDA_", "NCCL_", "UCX_", "RAPIDS_")
+SECRET_NAME_PARTS = ("TOKEN", "KEY", "SECRET", "PASSWORD")
+REDACTED = "<redacted>"
+
+# DeviceInfo fields that describe current load rather than the device; they
+# are reported by gather_gpu_usage instead of gather_gpus.
+_USAGE_FIELDS = (
+    "memory_used_bytes",
+    "memory_free_bytes",
+    "gpu_utilization_percent",
+    "memory_utilization_percent",
+    "processes",
+)
+# The MigInstance fields among them.
+_MIG_USAGE_FIELDS = ("memory_used_bytes", "memory_free_bytes", "processes")
+
 
 def gather_cuda_version():
     """Return CUDA driver version as a string, similar to nvidia-smi output."""
@@ -31,6 +82,59 @@ def gather_cuda_version():
         return f"{major}.{minor}.{patch}"
 
 
+def read_driver_gpu_information(pci_bus_id: str, root: Path | None = None):
+    """Return the NVIDIA driver's ``information`` file for a GPU as a dict."""
+    path = (root or NVIDIA_PROC_GPUS) / pci_bus_id / "information"
+    try:
+        text = path.read_text()
+    except OSError:
+        return {}
+    information = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition(":")
+        if sep:
+            information[key.strip()] = value.strip()
+    return information
+
+
+def gather_gpus(root: Path | None = None):
+    """Return a structured report of every GPU, keyed by ``"GPU <index>"``.
+
+    Built from the GPU info provider and the driver's ``/proc`` entries, so it
+    needs neither ``nvidia-smi`` nor a second NVML session.
+    """
+    gpus = {}
+    for dev in get_gpu_info().devices:
+        gpu = asdict(dev)
+        for name in _USAGE_FIELDS:
+            del gpu[name]
+        for mig in gpu["mig_instances"]:
+            for name in _MIG_USAGE_FIELDS:
+                del mig[name]
+        if dev.pci_bus_id is not None:
+            gpu["driver_information"] = read_driver_gpu_information(
+                dev.pci_bus_id, root
+            )
+        gpus[f"GPU {dev.index}"] = gpu
+    return gpus
+
+
+def gather_gpu_usage():
+    """Return current memory use, utilization and compute processes of every GPU."""
+    usage = {}
+    for dev in get_gpu_info().devices:
+        gpu = {name: getattr(dev, name) for name in _USAGE_FIELDS}
+        gpu["processes"] = [asdict(process) for process in dev.processes]
+        if dev.mig_instances:
+            gpu["mig_instances"] = {}
+            for mig in dev.mig_instances:
+                instance = {name: getattr(mig, name) for name in _MIG_USAGE_FIELDS}
+                instance["processes"] = [asdict(process) for process in mig.processes]
+                gpu["mig_instances"][f"MIG {mig.index}"] = instance
+        usage[f"GPU {dev.index}"] = gpu
+    return usage
+
+
 def gather_package_versions():
     """Return package version."""
     installed_packages = sorted(
@@ -67,39 +171,283 @@ def gather_tools():
     }
 
 
-def run_debug(output_format="console"):
-    """Run debug."""
-    gpu_info = get_gpu_info()
-    system_info = get_system_info()
+def gather_numa_topology(root: Path | None = None):
+    """Return each GPU's NUMA node, the NUMA nodes and the process CPU affinity."""
+    topology = {}
+    for dev in get_gpu_info().devices:
+        if dev.pci_bus_id is None:
+            continue
+        gpu = gpu_topology(dev.index, dev.pci_bus_id, root)
+        if gpu is None:
+            continue
+        numa_node = "unknown" if gpu.numa_node is None else gpu.numa_node
+        topology[f"GPU {gpu.index}"] = (
+            f"NUMA node {numa_node} ({gpu.pci_bus_id}), "
+            f"local CPUs {format_cpulist(gpu.local_cpus) or 'unknown'}"
+        )
+    for node in numa_nodes(root):
+        memory = (
+            f"{node.memory_total_bytes / 1024**3:.1f} GiB"
+            if node.memory_total_bytes is not None
+            else "unknown memory"
+        )
+        topology[f"Node {node.node}"] = f"CPUs {format_cpulist(node.cpus)}, {memory}"
+    affinity = process_affinity()
+    if affinity is not None:
+        topology["Process affinity"] = format_cpulist(affinity)
+    return topology
 
-    debug_info = {
-        "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "platform": platform.platform(),
-        "nvidia_smi_output": gather_command_output(
-            ["nvidia-smi"], "Nvidia-smi not installed"
-        ),
-        "driver_version": gpu_info.driver_version,
-        "cuda_version": gather_cuda_version(),
-        "cuda_runtime_path": system_info.cuda_runtime_path,
-        "system_ctk": sorted(
-            [str(p) for p in Path("/usr/local").glob("cuda*") if p.is_dir()]
-        ),
-        "python_version_full": sys.version,
-        "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+
+def gather_host_memory():
+    """Return /dev/shm usage, memlock limits and hugepage settings."""
+    shm = shm_usage()
+    soft, hard = memlock_limits()
+    pool = hugepages()
+    return {
+        "dev_shm_size_bytes": shm[0] if shm else None,
+        "dev_shm_free_bytes": shm[1] if shm else None,
+        "memlock_soft_bytes": soft,
+        "memlock_hard_bytes": hard,
+        "transparent_hugepage": transparent_hugepage_mode(),
+        "hugepages_total": pool.get("total"),
+        "hugepages_free": pool.get("free"),
+        "hugepage_size_bytes": pool.get("page_size"),
+    }
+
+
+def gather_gpudirect():
+    """Return GPUDirect kernel modules, RDMA adapter ports and cuFile settings."""
+    modules = loaded_modules()
+    path = cufile_json_path()
+    try:
+        config = read_cufile_json(path)
+    except ValueError as e:
+        config, cufile = None, f"{path} (invalid: {e})"
+    else:
+        cufile = str(path) if config is not None else None
+    return {
+        "nvidia_peermem": bool(modules.intersection(PEERMEM_MODULES)),
+        "nvidia_fs": GDS_MODULE in modules,
+        "rdma_ports": ", ".join(
+            f"{port.device}/{port.port} ({port.link_layer}, {port.state})"
+            for port in rdma_ports()
+        )
+        or None,
+        "cufile_json": cufile,
+        "gds_compat_mode": gds_compat_mode_allowed(config) if config else None,
+    }
+
+
+def gather_os_info():
+    """Return the fields of ``/etc/os-release``."""
+    return {
+        v.split("=")[0]: v.split("=")[1].strip('"')
+        for v in Path("/etc/os-release").read_text().splitlines()
+    }
+
+
+def gather_environment():
+    """Return the environment variables that affect CUDA, RAPIDS and their transports."""
+    return {
+        name: (
+            REDACTED
+            if any(part in name.upper() for part in SECRET_NAME_PARTS)
+            else value
+        )
+        for name, value in sorted(os.environ.items())
+        if name.startswith(ENVIRONMENT_PREFIXES)
+    }
+
+
+def gather_system_ctk():
+    """Return the CUDA Toolkits installed under ``/usr/local``."""
+    return sorted([str(p) for p in Path("/usr/local").glob("cuda*") if p.is_dir()])
+
+
+# The sections of the debug report, in report order. Each maps the report keys
+# it contributes to functions that gather them, which are only called when the
+# section is selected. Gatherers are looked up when called so they can be
+# replaced at module level.
+SECTIONS: dict[str, dict[str, Callable[[], Any]]] = {
+    "platform": {
+        "date": lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "platform": lambda: platform.platform(),
+    },
+    "driver": {
+        "driver_version": lambda: get_gpu_info().driver_version,
+        "cuda_version": lambda: gather_cuda_version(),
+    },
+    "gpu": {"gpus": lambda: gather_gpus(), "gpu_usage": lambda: gather_gpu_usage()},
+    "cuda": {
+        "cuda_runtime_path": lambda: get_system_info().cuda_runtime_path,
+        "system_ctk": lambda: gather_system_ctk(),
+    },
+    "numa": {"numa_topology": lambda: gather_numa_topology()},
+    "limits": {
+        "cgroup_limits": lambda: {
+            "memory_limit_bytes": get_system_info().memory_limit_bytes,
+            "cpu_limit": get_system_info().cpu_limit,
+        },
+    },
+    "host_memory": {"host_memory": lambda: gather_host_memory()},
+    "gpudirect": {"gpudirect": lambda: gather_gpudirect()},
+    "python": {
+        "python_version_full": lambda: sys.version,
+        "python_version": lambda: f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
         # cast sys.hash_info to str as repr is most useful https://github.com/rapidsai/rapids-cli/pull/127#discussion_r2397926022
-        "python_hash_info": str(sys.hash_info),
-        "package_versions": gather_package_versions(),
-        "pip_packages": gather_command_output(["pip", "freeze"], "Pip not installed"),
-        "conda_packages": gather_command_output(
+        "python_hash_info": lambda: str(sys.hash_info),
+    },
+    "packages": {"package_versions": lambda: gather_package_versions()},
+    "pip": {
+        "pip_packages": lambda: gather_command_output(
+            ["pip", "freeze"], "Pip not installed"
+        ),
+    },
+    "conda": {
+        "conda_packages": lambda: gather_command_output(
             ["conda", "list"], "Conda not installed"
         ),
-        "conda_info": gather_command_output(["conda", "info"], "Conda not installed"),
-        "tools": gather_tools(),
-        "os_info": {
-            v.split("=")[0]: v.split("=")[1].strip('"')
-            for v in Path("/etc/os-release").read_text().splitlines()
-        },
+        "conda_info": lambda: gather_command_output(
+            ["conda", "info"], "Conda not installed"
+        ),
+    },
+    "tools": {"tools": lambda: gather_tools()},
+    "os": {"os_info": lambda: gather_os_info()},
+    "env": {"environment": lambda: gather_environment()},
+    "nvidia_smi": {
+        "nvidia_smi_output": lambda: gather_command_output(
+            ["nvidia-smi"], "Nvidia-smi not installed"
+        ),
+    },
+}
+
+# Sections left out unless asked for by name.
+OPTIONAL_SECTIONS = ("nvidia_smi",)
+
+# Directory holding the files of a debug bundle inside its archive.
+BUNDLE_DIRECTORY = "rapids-debug"
+
+
+def select_sections(only=None, skip=None, nvidia_smi=False):
+    """Return the names of the sections to gather, in report order.
+
+    Args:
+        only: Gather only these sections. Defaults to every section not in
+            ``OPTIONAL_SECTIONS``.
+        skip: Leave out these sections.
+        nvidia_smi: Also gather the raw ``nvidia-smi`` output.
+
+    Raises:
+        ValueError: If a section name is unknown.
+    """
+    unknown = [name for name in [*(only or []), *(skip or [])] if name not in SECTIONS]
+    if unknown:
+        raise ValueError(
+            f"Unknown debug section(s): {', '.join(unknown)}. "
+            f"Choose from {', '.join(SECTIONS)}."
+        )
+    selected = set(only) if only else set(SECTIONS) - set(OPTIONAL_SECTIONS)
+    if nvidia_smi:
+        selected.add("nvidia_smi")
+    selected -= set(skip or [])
+    return [name for name in SECTIONS if name in selected]
+
+
+def iter_sections(sections):
+    """Gather the given sections one at a time.
+
+    Yields:
+        ``(name, fields)`` for each section once its fields are gathered, so
+        callers can emit a section before the slower ones have run.
+    """
+    for name in sections:
+        yield name, {key: gather() for key, gather in SECTIONS[name].items()}
+
+
+def _add_bundle_file(tar, name, data):
+    info = tarfile.TarInfo(f"{BUNDLE_DIRECTORY}/{name}")
+    info.size = len(data)
+    info.mtime = int(time.time())
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(data))
+
+
+def write_bundle(path, sections):
+    """Write the given sections to a gzip-compressed tar archive.
+
+    Each section is written to ``<section>.json`` as soon as it is gathered,
+    so only one section is held in memory at a time. ``manifest.json`` is
+    written last and lists the sections in report order with the report keys
+    in each file, the seconds taken to gather it and its uncompressed size in
+    bytes.
+
+    Args:
+        path: Archive to write, or ``"-"`` to stream it to standard output.
+        sections: Names of the sections to gather, see ``select_sections``.
+    """
+    if path == "-":
+        tar = tarfile.open(fileobj=sys.stdout.buffer, mode="w|gz")
+    else:
+        tar = tarfile.open(path, mode="w:gz")
+    manifest = {
+        "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "sections": [],
     }
+    with tar:
+        start = time.perf_counter()
+        for name, fields in iter_sections(sections):
+            seconds = time.perf_counter() - start
+            data = (json.dumps(fields, indent=4) + "\n").encode()
+            _add_bundle_file(tar, f"{name}.json", data)
+            manifest["sections"].append(
+                {
+                    "name": name,
+                    "file": f"{name}.json",
+                    "keys": list(fields),
+                    "seconds": round(seconds, 6),
+                    "bytes": len(data),
+                }
+            )
+            start = time.perf_counter()
+        manifest["total_seconds"] = round(
+            sum(section["seconds"] for section in manifest["sections"]), 6
+        )
+        manifest["total_bytes"] = sum(
+            section["bytes"] for section in manifest["sections"]
+        )
+        _add_bundle_file(
+            tar, "manifest.json", (json.dumps(manifest, indent=4) + "\n").encode()
+        )
+    return manifest
+
+
+def run_debug(
+    output_format="console", nvidia_smi=False, only=None, skip=None, bundle=None
+):
+    """Run debug.
+
+    Args:
+        output_format: ``"console"`` or ``"json"``.
+        nvidia_smi: Also include the raw text output of ``nvidia-smi``, which
+            takes about a second on large nodes.
+        only: Names of the only sections to report, see ``SECTIONS``.
+        skip: Names of sections to leave out.
+        bundle: Write the report to this ``.tar.gz`` archive instead, see
+            ``write_bundle``. ``output_format`` is ignored.
+    """
+    sections = select_sections(only, skip, nvidia_smi)
+    if bundle is not None:
+        manifest = write_bundle(bundle, sections)
+        if bundle != "-":
+            console.print(
+                f"Wrote {len(manifest['sections'])} debug section(s) to {bundle} "
+                f"in {manifest['total_seconds']:.2f}s"
+            )
+        return
+
+    debug_info = {}
+    for _, fields in iter_sections(sections):
+        debug_info.update(fields)
 
     if output_format == "json":
         print(json.dumps(debug_info, indent=4))
@@ -112,6 +460,8 @@ def run_debug(output_format="console"):
             elif isinstance(value, dict):
                 table = Table(show_header=False, header_style="bold magenta")
                 for k, v in value.items():
+                    if isinstance(v, dict):
+                        v = "\n".join(f"{k2}: {v2}" for k2, v2 in v.items())
                     table.add_row(str(k), str(v))
                 console.print(table)
             else:
@@ -0,0 +1,203 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Compare two debug reports to see what changed between them.
+
+Reports are compared key by key rather than as text, so only the values that
+differ are visited and even reports listing thousands of packages diff
+quickly. The ``pip freeze`` and ``conda list`` outputs are parsed into
+package maps first so that a changed package shows up as a single entry.
+"""
+
+import json
+import tarfile
+
+from rich.table import Table
+
+from rapids_cli.debug.debug import SECTIONS, console, iter_sections
+
+# Report keys that differ between any two runs.
+IGNORED_KEYS = ("date", "gpu_usage")
+# Nested fields that change with load or temperature rather than configuration.
+VOLATILE_FIELDS = (
+    "temperature_c",
+    "sm_clock_mhz",
+    "memory_clock_mhz",
+    "clock_event_reasons",
+    "pcie_link_generation",
+    "pcie_link_width",
+    "dev_shm_free_bytes",
+    "hugepages_free",
+)
+
+
+def parse_pip_freeze(text):
+    """Return the packages in ``pip freeze`` output, mapped to their versions.
+
+    Packages installed from a URL map to the URL and editable installs map to
+    their own line with an empty version.
+    """
+    packages = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        for separator in ("==", " @ "):
+            name, found, version = line.partition(separator)
+            if found:
+                packages[name.strip()] = version.strip()
+                break
+        else:
+            packages[line] = ""
+    return packages
+
+
+def parse_conda_list(text):
+    """Return the packages in ``conda list`` output, mapped to their version, build and channel."""
+    packages = {}
+    for line in text.splitlines():
+        fields = line.split()
+        if len(fields) < 2 or fields[0].startswith("#"):
+            continue
+        packages[fields[0]] = " ".join(fields[1:])
+    return packages
+
+
+# Report keys holding command output that is compared as a package map.
+PACKAGE_LISTS = {
+    "pip_packages": parse_pip_freeze,
+    "conda_packages": parse_conda_list,
+}
+
+
+def load_report(path):
+    """Load a report written by ``rapids debug --json`` or ``--bundle``."""
+    if not tarfile.is_tarfile(path):
+        with open(path) as f:
+            return json.load(f)
+    report = {}
+    with tarfile.open(path) as tar:
+        for member in tar:
+            if member.name.endswith(".json") and not member.name.endswith(
+                "/manifest.json"
+            ):
+                report.update(json.load(tar.extractfile(member)))
+    return report
+
+
+def gather_report(keys):
+    """Gather the sections that report any of ``keys`` from the running system.
+
+    Values are passed through JSON so that they compare equal to the ones
+    loaded from a saved report.
+    """
+    sections = [name for name in SECTIONS if keys & SECTIONS[name].keys()]
+    report = {}
+    for _, fields in iter_sections(sections):
+        report.update(fields)
+    return json.loads(json.dumps(report))
+
+
+def _diff_mappings(old, new, path, delta):
+    for key in [*old, *(key for key in new if key not in old)]:
+        if key in VOLATILE_FIELDS:
+            continue
+        name = "/".join([*path, str(key)])
+        if key not in new:
+            delta["removed"][name] = old[key]
+        elif key not in old:
+            delta["added"][name] = new[key]
+        elif old[key] != new[key]:
+            if isinstance(old[key], dict) and isinstance(new[key], dict):
+                _diff_mappings(old[key], new[key], [*path, str(key)], delta)
+            else:
+                delta["changed"][name] = {"old": old[key], "new": new[key]}
+
+
+def diff_reports(old, new):
+    """Return what changed between two debug reports.
+
+    Returns:
+        A dict keyed by the report keys that differ. A key whose value is a
+        mapping in both reports, such as ``package_versions`` or ``gpus``,
+        maps to its ``added``, ``removed`` and ``changed`` entries, keyed by
+        their ``/``-separated path below it; a changed entry is an ``old`` and
+        ``new`` pair. Any other key maps to its ``old`` and ``new`` value,
+        leaving out the one from a report that does not have the key.
+    """
+    delta = {}
+    for key in [*old, *(key for key in new if key not in old)]:
+        if key in IGNORED_KEYS:
+            continue
+        values = {}
+        for side, report in (("old", old), ("new", new)):
+            if key in report:
+                value = report[key]
+                if key in PACKAGE_LISTS and isinstance(value, str):
+                    value = PACKAGE_LISTS[key](value)
+                values[side] = value
+        if values.get("old") == values.get("new") and len(values) == 2:
+            continue
+        if isinstance(values.get("old"), dict) and isinstance(values.get("new"), dict):
+            changes = {"added": {}, "removed": {}, "changed": {}}
+            _diff_mappings(values["old"], values["new"], [], changes)
+            changes = {kind: entries for kind, entries in changes.items() if entries}
+            if changes:
+                delta[key] = changes
+        else:
+            delta[key] = values
+    return delta
+
+
+def _format(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return "" if value is None else str(value)
+
+
+def run_diff(old, new="live", output_format="console", only=None, skip=None):
+    """Print what changed between two debug reports.
+
+    Args:
+        old: Path of a report written by ``rapids debug --json`` or
+            ``--bundle``.
+        new: Path of the report to compare it with, or ``"live"`` to gather
+            the sections present in ``old`` from the running system.
+        output_format: ``"console"`` or ``"json"``.
+        only: Names of the only sections to compare, see ``SECTIONS``.
+        skip: Names of sections to leave out.
+    """
+    left_out = {
+        key
+        for name, fields in SECTIONS.items()
+        if (only and name not in only) or name in (skip or ())
+        for key in fields
+    }
+    old_report = {k: v for k, v in load_report(old).items() if k not in left_out}
+    if new == "live":
+        new_report = gather_report(old_report.keys())
+    else:
+        new_report = {k: v for k, v in load_report(new).items() if k not in left_out}
+    delta = diff_reports(old_report, new_report)
+
+    if output_format == "json":
+        print(json.dumps(delta, indent=4))
+        return
+    console.print("[bold purple]RAPIDS Debug Diff[/bold purple]")
+    if not delta:
+        console.print("No differences")
+        return
+    for key, changes in delta.items():
+        console.print(f"[bold green]{key.replace('_', ' ').title()}[/bold green]")
+        table = Table(header_style="bold magenta")
+        for column in ("Key", "Old", "New"):
+            table.add_column(column)
+        if "old" in changes or "new" in changes:
+            table.add_row(key, _format(changes.get("old")), _format(changes.get("new")))
+        for name, value in changes.get("removed", {}).items():
+            table.add_row(name, _format(value), "")
+        for name, value in changes.get("added", {}).items():
+            table.add_row(name, "", _format(value))
+        for name, value in changes.get("changed", {}).items():
+            table.add_row(name, _format(value["old"]), _format(value["new"]))
+        console.print(table)
+        console.print()
@@ -2,6 +2,13 @@
 # SPDX-License-Identifier: Apache-2.0
 """This module contains the doctor subcommand for the Rapids CLI."""
 
-from .doctor import doctor_check
+from .doctor import CheckResult, doctor_check, iter_checks
+from .findings import Finding, FindingsCollector
 
-__all__ = ["doctor_check"]
+__all__ = [
+    "CheckResult",
+    "Finding",
+    "FindingsCollector",
+    "doctor_check",
+    "iter_checks",
+]
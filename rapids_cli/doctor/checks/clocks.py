@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Check for GPUs held back by thermal, power or clock limits."""
+
+from rapids_cli.doctor.findings import FindingsCollector
+from rapids_cli.hardware import HardwareInfoError
+from rapids_cli.providers import get_gpu_info
+
+# Bits of NVML's clocks event (formerly "throttle") reasons bitmask, see
+# nvmlClocksEventReasons in nvml.h.
+SW_POWER_CAP = 0x4
+HW_SLOWDOWN = 0x8
+SW_THERMAL_SLOWDOWN = 0x20
+HW_THERMAL_SLOWDOWN = 0x40
+HW_POWER_BRAKE_SLOWDOWN = 0x80
+
+
+def _mhz(current, maximum):
+    return f"{current} MHz of {maximum} MHz"
+
+
+def check_gpu_clocks(verbose=False, findings=None, **kwargs):
+    """Check that no GPU is thermally or power throttled or has its clocks capped."""
+    findings = findings if findings is not None else FindingsCollector()
+    gpu_info = get_gpu_info()
+    try:
+        # Clocks follow the load, and the provider may have been loaded long
+        # ago, e.g. in the doctor daemon.
+        gpu_info.refresh_usage()
+        devices = gpu_info.devices
+    except HardwareInfoError as e:
+        raise ValueError("GPU not found. Please ensure GPUs are installed.") from e
+
+    checked = 0
+    for dev in devices:
+        reasons = dev.clock_event_reasons
+        if reasons is None:
+            continue
+        checked += 1
+        metrics = {
+            "gpu": dev.index,
+            "clock_event_reasons": reasons,
+            "sm_clock_mhz": dev.sm_clock_mhz,
+            "sm_max_clock_mhz": dev.sm_max_clock_mhz,
+            "memory_clock_mhz": dev.memory_clock_mhz,
+            "memory_max_clock_mhz": dev.memory_max_clock_mhz,
+            "power_limit_mw": dev.power_limit_mw,
+            "default_power_limit_mw": dev.default_power_limit_mw,
+            "temperature_c": dev.temperature_c,
+        }
+        clocks = ""
+        if dev.sm_clock_mhz is not None and dev.sm_max_clock_mhz is not None:
+            clocks = f" (SM clock {_mhz(dev.sm_clock_mhz, dev.sm_max_clock_mhz)})"
+
+        if reasons & (SW_THERMAL_SLOWDOWN | HW_THERMAL_SLOWDOWN):
+            temperature = (
+                f" at {dev.temperature_c} C" if dev.temperature_c is not None else ""
+            )
+            findings.warn(
+                f"GPU {dev.index} is thermally throttled{temperature}{clocks}. "
+                "Check the cooling and airflow of the system.",
+                code="gpu-thermal-throttle",
+                metrics=metrics,
+            )
+        if reasons & (HW_SLOWDOWN | HW_POWER_BRAKE_SLOWDOWN):
+            findings.warn(
+                f"GPU {dev.index} clocks are held down by a hardware slowdown"
+                f"{clocks}. This usually points to the power supply or an "
+                "external power brake signal.",
+                code="gpu-hw-slowdown",
+                metrics=metrics,
+            )
+        # Reaching the power limit under load is normal; it only matters when
+        # the limit has been lowered below the board default.
+        if reasons & SW_POWER_CAP:
+            findings.info(
+                f"GPU {dev.index} is running at its power limit{clocks}.",
+                code="gpu-power-capped",
+                metrics=metrics,
+            )
+
+        limit, default = dev.power_limit_mw, dev.default_power_limit_mw
+        if limit is not None and default is not None and limit < default:
+            findings.warn(
+                f"GPU {dev.index} power limit is {limit / 1000:g} W, below its "
+                f"default of {default / 1000:g} W. Restore it with "
+                f"'nvidia-smi -i {dev.index} -pl {default / 1000:g}'.",
+                code="gpu-power-limit-lowered",
+                metrics=metrics,
+            )
+
+        for kind, app, app_default in (
+            ("SM", dev.sm_application_clock_mhz, dev.sm_default_application_clock_mhz),
+            (
+                "memory",
+                dev.memory_application_clock_mhz,
+                dev.memory_default_application_clock_mhz,
+            ),
+        ):
+            if app is not None and app_default is not None and app < app_default:
+                findings.warn(
+                    f"GPU {dev.index} {kind} application clock is locked at "
+                    f"{_mhz(app, app_default)} default. Reset it with "
+                    f"'nvidia-smi -i {dev.index} -rac'.",
+                    code="gpu-application-clocks-lowered",
+                    metrics={**metrics, "kind": kind.lower()},
+                )
+
+    if not checked:
+        return False
+    if verbose:
+        return f"Clocks and power limits checked on {checked} GPU(s)"
+    return True
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Check GPU persistence mode, compute mode and CUDA MPS."""
+
+from rapids_cli.doctor.findings import FindingsCollector
+from rapids_cli.hardware import HardwareInfoError
+from rapids_cli.providers import get_gpu_info, get_system_info
+
+# Name as nvidia-smi shows it and what may use the GPU at a time.
+_EXCLUSIVE_MODES = {
+    "exclusive_process": ("Exclusive Process", "one process"),
+    "exclusive_thread": ("Exclusive Thread", "one thread of one process"),
+}
+
+
+def _gpu_list(devices):
+    return ", ".join(str(dev.index) for dev in devices)
+
+
+def check_gpu_compute_mode(verbose=False, findings=None, **kwargs):
+    """Check persistence mode, compute mode and CUDA MPS on each GPU."""
+    findings = findings if findings is not None else FindingsCollector()
+    gpu_info = get_gpu_info()
+    try:
+        # Administrators change these modes on live nodes, and the provider may
+        # have been loaded long ago, e.g. in the doctor daemon.
+        gpu_info.refresh_usage()
+        devices = gpu_info.devices
+    except HardwareInfoError as e:
+        raise ValueError("GPU not found. Please ensure GPUs are installed.") from e
+    devices = [
+        dev
+        for dev in devices
+        if dev.persistence_mode is not None or dev.compute_mode is not None
+    ]
+    if not devices:
+        return False
+    mps = get_system_info().mps_pipe_directory
+
+    not_persistent = [dev for dev in devices if dev.persistence_mode is False]
+    if not_persistent:
+        findings.perf_advice(
+            f"Persistence mode is off on GPU {_gpu_list(not_persistent)}, so the "
+            "driver tears the GPUs down whenever no process uses them. Every new "
+            "process, such as each Dask worker, then waits up to several seconds "
+            "for driver initialization. Run nvidia-persistenced or enable it "
+            "with 'nvidia-smi -pm 1'.",
+            code="persistence-mode-off",
+            metrics={"gpus": [dev.index for dev in not_persistent]},
+        )
+
+    prohibited = [dev for dev in devices if dev.compute_mode == "prohibited"]
+    if prohibited:
+        findings.error(
+            f"GPU {_gpu_list(prohibited)} is in Prohibited compute mode, so no "
+            "process can create a CUDA context on it. Reset it with "
+            "'nvidia-smi -c DEFAULT'.",
+            code="gpu-compute-prohibited",
+            metrics={"gpus": [dev.index for dev in prohibited]},
+        )
+
+    exclusive = [dev for dev in devices if dev.compute_mode in _EXCLUSIVE_MODES]
+    if exclusive and mps is None:
+        for mode, (name, user) in _EXCLUSIVE_MODES.items():
+            gpus = [dev for dev in exclusive if dev.compute_mode == mode]
+            if not gpus:
+                continue
+            findings.perf_advice(
+                f"GPU {_gpu_list(gpus)} is in {name} compute mode without CUDA "
+                f"MPS, so only {user} at a time can use it. Other processes "
+                "fail with 'all CUDA-capable devices are busy' or wait their "
+                "turn. Start the MPS control daemon "
+                "(nvidia-cuda-mps-control -d) to share the GPU, or set "
+                "'nvidia-smi -c DEFAULT'.",
+                code=f"{mode.replace('_', '-')}-without-mps",
+                metrics={"gpus": [dev.index for dev in gpus]},
+            )
+    elif mps is not None:
+        findings.info(
+            f"A CUDA MPS control daemon is running ({mps}); CUDA processes on "
+            "the GPUs share them through MPS.",
+            code="mps-running",
+            metrics={
+                "pipe_directory": mps,
+                "exclusive_gpus": [dev.index for dev in exclusive],
+            },
+        )
+
+    if verbose:
+        return (
+            f"Compute mode checked on {len(devices)} GPU(s), "
+            f"MPS {'running' if mps else 'not running'}"
+        )
+    return True
@@ -156,11 +156,19 @@ def _check_path_version(label: str, path: Path, driver_major: int) -> None:
 
 
 def _gather_toolkit_info() -> CudaToolkitInfo:  # pragma: no cover
-    """Gather CUDA toolkit and driver information from the real system."""
+    """Gather CUDA toolkit and driver information from the real system.
+
+    Raises:
+        HardwareInfoError: If the driver version query does not return within
+            the probe timeout.
+    """
     import cuda.pathfinder
     from cuda.core.system import get_driver_version
     from cuda.pathfinder import DynamicLibNotFoundError
 
+    from rapids_cli._watchdog import WatchdogTimeoutError, call_with_timeout
+    from rapids_cli.hardware import HardwareInfoError, probe_timeout
+
     info = CudaToolkitInfo()
 
     # Discover libraries
@@ -173,8 +181,13 @@ def _gather_toolkit_info() -> CudaToolkitInfo:  # pragma: no cover
         except (DynamicLibNotFoundError, RuntimeError):
             info.missing_libs.append(soname)
 
+    timeout = probe_timeout()
     try:
-        info.driver_major = get_driver_version()[0]
+        info.driver_major = call_with_timeout(get_driver_version, timeout)[0]
+    except WatchdogTimeoutError as e:
+        raise HardwareInfoError(
+            f"CUDA driver version query timed out after {timeout:.3g}s"
+        ) from e
     except Exception:
         info.driver_major = None
 
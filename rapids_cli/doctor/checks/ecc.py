@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Check GPU memory for ECC errors, retired pages and row remapping problems."""
+
+from rapids_cli.doctor.findings import FindingsCollector
+from rapids_cli.hardware import HardwareInfoError
+from rapids_cli.providers import get_gpu_info
+
+# NVIDIA's dynamic page retirement guidance treats a GPU with this many
+# retired pages as due for replacement.
+RETIRED_PAGES_RMA_THRESHOLD = 60
+
+_HEALTH_FIELDS = (
+    "ecc_enabled",
+    "retired_pages_sbe",
+    "retired_pages_dbe",
+    "row_remap_pending",
+)
+
+
+def check_gpu_memory_errors(verbose=False, findings=None, **kwargs):
+    """Check that no GPU has uncorrectable memory errors or needs a reset or RMA."""
+    findings = findings if findings is not None else FindingsCollector()
+    gpu_info = get_gpu_info()
+    try:
+        # Error counts grow while the GPU runs, and the provider may have been
+        # loaded long ago, e.g. in the doctor daemon.
+        gpu_info.refresh_health()
+        devices = gpu_info.devices
+    except HardwareInfoError as e:
+        raise ValueError("GPU not found. Please ensure GPUs are installed.") from e
+
+    checked = 0
+    for dev in devices:
+        if all(getattr(dev, name) is None for name in _HEALTH_FIELDS):
+            continue
+        checked += 1
+        retired = (dev.retired_pages_sbe or 0) + (dev.retired_pages_dbe or 0)
+        metrics = {
+            "gpu": dev.index,
+            "ecc_uncorrected_volatile": dev.ecc_uncorrected_volatile,
+            "ecc_uncorrected_aggregate": dev.ecc_uncorrected_aggregate,
+            "ecc_corrected_volatile": dev.ecc_corrected_volatile,
+            "retired_pages": retired,
+            "retired_pages_pending": dev.retired_pages_pending,
+            "remapped_rows_uncorrectable": dev.remapped_rows_uncorrectable,
+            "row_remap_pending": dev.row_remap_pending,
+            "row_remap_failed": dev.row_remap_failed,
+        }
+
+        if dev.row_remap_failed:
+            findings.error(
+                f"GPU {dev.index} failed to remap a memory row with errors and has "
+                "no spare rows left. It should be replaced (RMA).",
+                code="gpu-row-remap-failed",
+                metrics=metrics,
+            )
+        if retired >= RETIRED_PAGES_RMA_THRESHOLD:
+            findings.error(
+                f"GPU {dev.index} has {retired} retired memory pages, at or above "
+                f"NVIDIA's replacement threshold of {RETIRED_PAGES_RMA_THRESHOLD}. "
+                "It should be replaced (RMA).",
+                code="gpu-retired-pages-rma",
+                metrics=metrics,
+            )
+        elif retired:
+            findings.warn(
+                f"GPU {dev.index} has retired {retired} memory page(s) with ECC "
+                "errors. Watch for the count growing.",
+                code="gpu-retired-pages",
+                metrics=metrics,
+            )
+
+        pending = [
+            repair
+            for repair, flag in (
+                ("row remapping", dev.row_remap_pending),
+                ("page retirement", dev.retired_pages_pending),
+            )
+            if flag
+        ]
+        if pending:
+            findings.error(
+                f"GPU {dev.index} has a pending {' and '.join(pending)} that takes "
+                "effect only after a GPU reset; until then the faulty memory is "
+                "still in use and jobs may crash. Reset the GPU with "
+                f"'nvidia-smi -r -i {dev.index}' or reboot.",
+                code="gpu-reset-required",
+                metrics=metrics,
+            )
+        elif dev.ecc_uncorrected_volatile:
+            findings.error(
+                f"GPU {dev.index} has had {dev.ecc_uncorrected_volatile} "
+                "uncorrectable ECC error(s) since the last reset, so data in its "
+                "memory may be corrupt. Reset the GPU with "
+                f"'nvidia-smi -r -i {dev.index}' or reboot.",
+                code="gpu-uncorrectable-ecc",
+                metrics=metrics,
+            )
+        elif dev.ecc_uncorrected_aggregate:
+            findings.info(
+                f"GPU {dev.index} has had {dev.ecc_uncorrected_aggregate} "
+                "uncorrectable ECC error(s) over its lifetime, none since the "
+                "last reset.",
+                code="gpu-past-uncorrectable-ecc",
+                metrics=metrics,
+            )
+
+        if dev.ecc_enabled is False:
+            findings.info(
+                f"ECC is disabled on GPU {dev.index}, so memory errors go "
+                "undetected.",
+                code="ecc-disabled",
+                metrics=metrics,
+            )
+
+    if not checked:
+        return False
+    if verbose:
+        return f"Memory errors checked on {checked} GPU(s)"
+    return True
@@ -2,20 +2,51 @@
 # SPDX-License-Identifier: Apache-2.0
 """GPU checks for the doctor command."""
 
-from rapids_cli.hardware import HardwareInfoError
+from rapids_cli.doctor.findings import FindingsCollector
+from rapids_cli.hardware import HardwareInfoError, visible_mig_instances
 from rapids_cli.providers import get_gpu_info
 
 REQUIRED_COMPUTE_CAPABILITY = 7
 
 
-def gpu_check(verbose=False, **kwargs):
-    """Check GPU availability."""
+def gpu_check(verbose=False, findings=None, **kwargs):
+    """Check GPU availability.
+
+    A GPU in MIG mode is only usable through its MIG instances, so one
+    without any instance visible to this process does not count.
+    """
+    findings = findings if findings is not None else FindingsCollector()
     try:
         num_gpus = get_gpu_info().device_count
+        devices = get_gpu_info().devices
     except HardwareInfoError as e:
         raise ValueError("No available GPUs detected") from e
     assert num_gpus > 0, "No GPUs detected"
-    return f"GPU(s) detected: {num_gpus}"
+
+    mig_gpus = [dev for dev in devices if dev.mig_enabled]
+    if not mig_gpus:
+        return f"GPU(s) detected: {num_gpus}"
+
+    num_instances = 0
+    for dev in mig_gpus:
+        instances = visible_mig_instances(dev)
+        num_instances += len(instances)
+        if not instances:
+            findings.warn(
+                f"GPU {dev.index} has MIG mode enabled but no MIG instance is "
+                "visible to this process, so CUDA cannot use it. Create "
+                "instances with 'nvidia-smi mig' or check CUDA_VISIBLE_DEVICES.",
+                code="mig-no-instances",
+                metrics={"gpu": dev.index, "mig_instances": len(dev.mig_instances)},
+            )
+    if num_instances == 0 and len(mig_gpus) == num_gpus:
+        raise ValueError(
+            "All GPUs are in MIG mode and no MIG instance is visible to this process"
+        )
+    return (
+        f"GPU(s) detected: {num_gpus}, {len(mig_gpus)} in MIG mode with "
+        f"{num_instances} visible MIG instance(s)"
+    )
 
 
 def check_gpu_compute_capability(verbose=False, **kwargs):
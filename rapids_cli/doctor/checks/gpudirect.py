@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Check GPUDirect RDMA and GPUDirect Storage readiness."""
+
+from rapids_cli.doctor.findings import FindingsCollector
+from rapids_cli.gpudirect import (
+    GDS_MODULE,
+    PEERMEM_MODULES,
+    cufile_json_path,
+    gds_compat_mode_allowed,
+    loaded_modules,
+    rdma_ports,
+    read_cufile_json,
+)
+
+
+def check_gpudirect(verbose=False, findings=None, **kwargs):
+    """Check that GPUDirect RDMA and Storage can be used where the hardware allows."""
+    findings = findings if findings is not None else FindingsCollector()
+    modules = loaded_modules()
+
+    ports = rdma_ports()
+    active = [port for port in ports if port.state == "ACTIVE"]
+    if not ports:
+        findings.info(
+            "No InfiniBand or RoCE adapters found; GPUDirect RDMA does not apply.",
+            code="no-rdma-devices",
+        )
+    else:
+        adapters = sorted({port.device for port in ports})
+        metrics = {
+            "adapters": adapters,
+            "active_ports": [f"{port.device}/{port.port}" for port in active],
+        }
+        if not active:
+            findings.warn(
+                f"No port of the RDMA adapters ({', '.join(adapters)}) is "
+                "ACTIVE, so UCX and NCCL fall back to TCP between nodes.",
+                code="rdma-ports-down",
+                metrics=metrics,
+            )
+        if not modules.intersection(PEERMEM_MODULES):
+            findings.perf_advice(
+                "RDMA adapters are present but the nvidia_peermem kernel module "
+                "is not loaded. Without GPUDirect RDMA, UCX and NCCL copy GPU "
+                "buffers through host memory, which cuts inter-node bandwidth "
+                "and adds latency. Load it with 'modprobe nvidia_peermem'.",
+                code="gpudirect-rdma-unavailable",
+                metrics=metrics,
+            )
+
+    path = cufile_json_path()
+    try:
+        config = read_cufile_json(path)
+    except ValueError as e:
+        findings.warn(
+            f"{path} could not be parsed ({e}); cuFile will use its defaults.",
+            code="cufile-json-invalid",
+            metrics={"path": str(path)},
+        )
+        config = None
+
+    metrics = {"path": str(path), "cufile_json": config is not None}
+    if GDS_MODULE not in modules:
+        message = (
+            "The nvidia_fs kernel module is not loaded, so GPUDirect Storage is "
+            "unavailable and cuFile (used by cudf and kvikio) reads through "
+            "host bounce buffers in compatibility mode, limiting file I/O "
+            "throughput."
+        )
+        # A cufile.json means GDS was set up on purpose, so its absence
+        # is worth acting on; otherwise it is only context.
+        findings.add(
+            "perf-advice" if config is not None else "info",
+            message,
+            code="gpudirect-storage-unavailable",
+            metrics=metrics,
+        )
+    elif config is not None and gds_compat_mode_allowed(config):
+        findings.info(
+            f"GPUDirect Storage is available. {path} allows compatibility "
+            "mode, so cuFile silently falls back to POSIX I/O for files GDS "
+            "cannot serve.",
+            code="gds-compat-mode-allowed",
+            metrics=metrics,
+        )
+
+    if verbose:
+        return (
+            f"GPUDirect checked: {len(active)} active RDMA port(s), "
+            f"nvidia_fs {'loaded' if GDS_MODULE in modules else 'not loaded'}"
+        )
+    return True
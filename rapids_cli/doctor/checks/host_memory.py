@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Check host memory settings used by UCX and pinned host buffers."""
+
+from rapids_cli.doctor.findings import FindingsCollector
+from rapids_cli.host_memory import hugepages, shm_usage, transparent_hugepage_mode
+from rapids_cli.providers import get_system_info
+
+# Docker gives containers a 64 MiB /dev/shm by default, far too little for UCX
+# shared memory transports or Dask spilling to shared memory.
+MIN_SHM_BYTES = 1024**3
+# UCX registers host buffers with InfiniBand adapters, which pins them and
+# counts against RLIMIT_MEMLOCK. Anything short of this is easily exhausted.
+MIN_MEMLOCK_BYTES = 1024**3
+
+
+def _gib(value):
+    return f"{value / 1024**3:.2f} GiB"
+
+
+def check_host_memory_config(verbose=False, findings=None, **kwargs):
+    """Check /dev/shm size, the memlock limit and transparent hugepages."""
+    findings = findings if findings is not None else FindingsCollector()
+
+    shm = shm_usage()
+    if shm is not None:
+        size, free = shm
+        metrics = {"size_bytes": size, "free_bytes": free}
+        if size < MIN_SHM_BYTES:
+            findings.perf_advice(
+                f"/dev/shm is only {_gib(size)}. UCX and multi-process "
+                "workloads need more; in Docker run with '--shm-size' of at "
+                "least 1g or '--ipc=host'.",
+                code="small-dev-shm",
+                metrics=metrics,
+            )
+        elif free < MIN_SHM_BYTES:
+            findings.warn(
+                f"/dev/shm has only {_gib(free)} free of {_gib(size)}. Stale "
+                "files from crashed processes may be holding the space.",
+                code="dev-shm-nearly-full",
+                metrics=metrics,
+            )
+
+    soft, hard = get_system_info().memlock_limits
+    if soft is not None and soft < MIN_MEMLOCK_BYTES:
+        advice = (
+            "raise it with 'ulimit -l unlimited'"
+            if hard is None or hard > soft
+            else "raise it in /etc/security/limits.conf or with Docker's "
+            "'--ulimit memlock=-1'"
+        )
+        findings.perf_advice(
+            f"The locked memory limit (ulimit -l) is {soft // 1024} KiB. UCX "
+            f"over InfiniBand pins host buffers against this limit; {advice}.",
+            code="low-memlock-limit",
+            metrics={"soft_bytes": soft, "hard_bytes": hard},
+        )
+
+    thp = transparent_hugepage_mode()
+    if thp == "never":
+        findings.perf_advice(
+            "Transparent hugepages are disabled, which increases TLB misses "
+            "for large host buffers. Set "
+            "/sys/kernel/mm/transparent_hugepage/enabled to 'madvise'.",
+            code="transparent-hugepages-disabled",
+            metrics={"mode": thp},
+        )
+
+    pool = hugepages()
+    if pool.get("total"):
+        findings.info(
+            f"{pool['free']} of {pool['total']} hugepages of "
+            f"{pool['page_size'] // 1024} KiB are free.",
+            code="hugepage-pool",
+            metrics=pool,
+        )
+
+    if verbose:
+        return "Shared memory, memlock and hugepage settings checked"
+    return True
@@ -2,37 +2,210 @@
 # SPDX-License-Identifier: Apache-2.0
 """Memory checks."""
 
+import os
 import warnings
 
-from rapids_cli.hardware import HardwareInfoError
+from rapids_cli.doctor.findings import FindingsCollector
+from rapids_cli.hardware import (
+    HardwareInfoError,
+    usable_memory_bytes,
+    visible_mig_instances,
+)
 from rapids_cli.providers import get_gpu_info, get_system_info
 
+# Fraction of each GPU's memory below which ``check_gpu_free_memory`` warns.
+# Setting the RAPIDS_CLI_MIN_FREE_GPU_MEMORY environment variable makes the
+# check fail below that fraction instead.
+DEFAULT_MIN_FREE_GPU_MEMORY = 0.9
+
+
+def min_free_gpu_memory():
+    """Return the fraction of GPU memory ``check_gpu_free_memory`` requires free.
+
+    That is the value of ``RAPIDS_CLI_MIN_FREE_GPU_MEMORY``, or ``None`` if it
+    is not set to a number, in which case nothing is required.
+    """
+    value = os.environ.get("RAPIDS_CLI_MIN_FREE_GPU_MEMORY")
+    try:
+        fraction = float(value) if value else None
+    except ValueError:
+        return None
+    return None if fraction is None else min(max(fraction, 0.0), 1.0)
+
 
 def get_system_memory(verbose=False, **kwargs):
-    """Get the total system memory."""
-    return get_system_info().total_memory_bytes / (1024**3)
+    """Get the system memory available to this process.
+
+    Inside a container this is the cgroup memory limit when it is lower than
+    the host's total memory.
+    """
+    system_info = get_system_info()
+    memory = system_info.total_memory_bytes
+    limit = system_info.memory_limit_bytes
+    if limit is not None:
+        memory = min(memory, limit)
+    return memory / (1024**3)
 
 
 def get_gpu_memory(verbose=False, **kwargs):
-    """Get the total GPU memory."""
-    return sum(dev.memory_total_bytes for dev in get_gpu_info().devices) / (1024**3)
+    """Get the total GPU memory.
+
+    GPUs in MIG mode contribute the memory of the MIG instances visible to
+    this process rather than that of the whole card.
+    """
+    return sum(usable_memory_bytes(dev) for dev in get_gpu_info().devices) / (1024**3)
 
 
-def check_memory_to_gpu_ratio(verbose=True, **kwargs):
+def check_memory_to_gpu_ratio(verbose=True, findings=None, **kwargs):
     """Check the system for a 2:1 ratio of system Memory to total GPU Memory.
 
-    This is especially useful for Dask.
+    This is especially useful for Dask. System memory and CPUs are those the
+    process's cgroup allows, so the check is meaningful inside containers.
     """
     try:
-        _ = get_gpu_info().device_count
+        device_count = get_gpu_info().device_count
+        mig_instances = sum(
+            len(visible_mig_instances(dev))
+            for dev in get_gpu_info().devices
+            if dev.mig_enabled
+        )
     except HardwareInfoError as e:
         raise ValueError("GPU not found. Please ensure GPUs are installed.") from e
 
-    ratio = get_system_memory() / get_gpu_memory()
+    system_memory = get_system_memory()
+    gpu_memory = get_gpu_memory()
+    if not gpu_memory:
+        return False
+    ratio = system_memory / gpu_memory
+    cgroup_limited = system_memory * 1024**3 < get_system_info().total_memory_bytes
     if ratio < 1.8:
-        warnings.warn(
+        message = (
             "System Memory to total GPU Memory ratio not at least 2:1 ratio. "
-            "It is recommended to have double the system memory to GPU memory for optimal performance.",
-            stacklevel=2,
+            "It is recommended to have double the system memory to GPU memory for optimal performance."
+        )
+        if cgroup_limited:
+            message += (
+                f" System memory is limited to {system_memory:.1f} GiB by the "
+                "container's cgroup."
+            )
+        if mig_instances:
+            message += (
+                f" GPU memory counts the {mig_instances} MIG instance(s) "
+                "visible to this process."
+            )
+        if findings is None:
+            warnings.warn(message, stacklevel=2)
+        else:
+            findings.perf_advice(
+                message,
+                code="low-memory-to-gpu-ratio",
+                metrics={
+                    "ratio": round(ratio, 2),
+                    "system_memory_gib": round(system_memory, 1),
+                    "gpu_memory_gib": round(gpu_memory, 1),
+                    "cgroup_limited": cgroup_limited,
+                    "mig_instances": mig_instances,
+                },
+            )
+
+    # Each Dask-CUDA worker drives one GPU from its own process, so fewer CPUs
+    # than GPUs leaves workers competing for CPU time.
+    cpu_limit = get_system_info().cpu_limit
+    if findings is not None and cpu_limit is not None and cpu_limit < device_count:
+        findings.perf_advice(
+            f"The container's cgroup limits this process to {cpu_limit:g} CPUs "
+            f"for {device_count} GPUs. Allow at least one CPU per GPU.",
+            code="low-cpu-limit-per-gpu",
+            metrics={"cpu_limit": cpu_limit, "gpus": device_count},
+        )
+    return True
+
+
+def _memory_units(dev):
+    """Yield what CUDA can use of a GPU as a name, location metrics and record.
+
+    That is the GPU itself or, on a GPU in MIG mode, each MIG instance visible
+    to this process, which has its own memory and processes.
+    """
+    if not dev.mig_enabled:
+        yield f"GPU {dev.index}", {"gpu": dev.index}, dev
+        return
+    for mig in visible_mig_instances(dev):
+        yield (
+            f"GPU {dev.index} MIG instance {mig.index}",
+            {"gpu": dev.index, "mig_instance": mig.index},
+            mig,
         )
+
+
+def check_gpu_free_memory(verbose=False, findings=None, **kwargs):
+    """Check that no other process is holding memory on the GPUs.
+
+    Warns when a GPU has less than 90% of its memory free, or about compute
+    processes on a GPU that still has enough free. When
+    ``RAPIDS_CLI_MIN_FREE_GPU_MEMORY`` is set, e.g. in a job prologue scoped
+    to the job's GPUs with ``rapids doctor --devices``, a GPU with less than
+    that fraction free fails the check instead. GPUs in MIG mode are checked
+    per MIG instance visible to this process.
+    """
+    findings = findings if findings is not None else FindingsCollector()
+    gpu_info = get_gpu_info()
+    try:
+        # The provider may have been loaded long ago, e.g. in the doctor daemon.
+        gpu_info.refresh_usage()
+        devices = gpu_info.devices
+    except HardwareInfoError as e:
+        raise ValueError("GPU not found. Please ensure GPUs are installed.") from e
+
+    required = min_free_gpu_memory()
+    threshold = DEFAULT_MIN_FREE_GPU_MEMORY if required is None else required
+    checked = 0
+    for dev in devices:
+        for name, location, unit in _memory_units(dev):
+            if unit.memory_free_bytes is None or not unit.memory_total_bytes:
+                continue
+            checked += 1
+            free = unit.memory_free_bytes / unit.memory_total_bytes
+            holders = ", ".join(
+                f"PID {p.pid}"
+                + (f" ({p.name})" if p.name else "")
+                + (
+                    f" holding {p.used_memory_bytes / 1024**3:.1f} GiB"
+                    if p.used_memory_bytes is not None
+                    else ""
+                )
+                for p in unit.processes
+            )
+            metrics = {
+                **location,
+                "free_fraction": round(free, 3),
+                "required_free_fraction": required,
+                "free_gib": round(unit.memory_free_bytes / 1024**3, 1),
+                "pids": [p.pid for p in unit.processes],
+            }
+            if free < threshold:
+                message = (
+                    f"{name} has only {free:.0%} of its memory free "
+                    f"({unit.memory_free_bytes / 1024**3:.1f} GiB)"
+                )
+                if required is None:
+                    report = findings.warn
+                    message += "."
+                else:
+                    report = findings.error
+                    message += f", below the required {required:.0%}."
+                if holders:
+                    message += f" Held by: {holders}."
+                report(message, code="gpu-memory-occupied", metrics=metrics)
+            elif unit.processes:
+                findings.warn(
+                    f"{name} is in use by {holders}.",
+                    code="gpu-in-use",
+                    metrics=metrics,
+                )
+
+    if not checked:
+        return False
+    if verbose:
+        return f"Free memory checked on {checked} GPU(s)"
     return True
@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Check GPU placement against NUMA nodes and the process CPU affinity."""
+
+from rapids_cli.doctor.findings import FindingsCollector
+from rapids_cli.hardware import HardwareInfoError
+from rapids_cli.providers import get_gpu_info, get_system_info
+from rapids_cli.topology import format_cpulist, gpu_topology, numa_nodes
+
+
+def check_numa_affinity(verbose=False, findings=None, **kwargs):
+    """Check that GPUs are reachable from local CPUs and memory on their NUMA node."""
+    findings = findings if findings is not None else FindingsCollector()
+    try:
+        devices = get_gpu_info().devices
+    except HardwareInfoError as e:
+        raise ValueError("GPU not found. Please ensure GPUs are installed.") from e
+
+    topologies = [
+        topology
+        for dev in devices
+        if dev.pci_bus_id is not None
+        and (topology := gpu_topology(dev.index, dev.pci_bus_id)) is not None
+    ]
+    if not topologies:
+        return False
+
+    nodes = {node.node: node for node in numa_nodes()}
+    affinity = get_system_info().cpu_affinity
+    gpu_memory_per_node: dict[int, int] = {}
+    memory_by_index = {dev.index: dev.memory_total_bytes for dev in devices}
+
+    for topology in topologies:
+        if topology.numa_node is None:
+            continue
+        node = topology.numa_node
+        gpu_memory_per_node[node] = gpu_memory_per_node.get(node, 0) + (
+            memory_by_index[topology.index]
+        )
+        local = format_cpulist(topology.local_cpus)
+        findings.info(
+            f"GPU {topology.index} ({topology.pci_bus_id}) is on NUMA node "
+            f"{node} with local CPUs {local}.",
+            code="gpu-numa-node",
+            metrics={"gpu": topology.index, "numa_node": node, "local_cpus": local},
+        )
+        # Work pinned to CPUs on another socket reaches the GPU across the
+        # inter-socket link, which lowers host-device bandwidth.
+        if affinity and topology.local_cpus and not affinity & topology.local_cpus:
+            findings.perf_advice(
+                f"This process may only run on CPUs {format_cpulist(affinity)}, "
+                f"none of which are local to GPU {topology.index} on NUMA node "
+                f"{node} (CPUs {local}). Pin the worker for each GPU to its "
+                "local CPUs, as dask-cuda does by default.",
+                code="gpu-cpu-affinity-remote",
+                metrics={
+                    "gpu": topology.index,
+                    "numa_node": node,
+                    "affinity": format_cpulist(affinity),
+                    "local_cpus": local,
+                },
+            )
+
+    for node, gpu_memory in sorted(gpu_memory_per_node.items()):
+        node_memory = nodes[node].memory_total_bytes if node in nodes else None
+        if node_memory is not None and node_memory < gpu_memory:
+            findings.perf_advice(
+                f"NUMA node {node} has {node_memory / 1024**3:.1f} GiB of memory "
+                f"for {gpu_memory / 1024**3:.1f} GiB of GPU memory attached to "
+                "it. Spilling and host staging buffers will use memory on "
+                "other nodes.",
+                code="low-numa-memory-to-gpu-ratio",
+                metrics={
+                    "numa_node": node,
+                    "node_memory_gib": round(node_memory / 1024**3, 1),
+                    "gpu_memory_gib": round(gpu_memory / 1024**3, 1),
+                },
+            )
+
+    if verbose:
+        return f"NUMA placement checked on {len(topologies)} GPU(s)"
+    return True
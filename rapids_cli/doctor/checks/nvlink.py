@@ -2,6 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 """Check for NVLink status."""
 
+from collections import Counter
+
+from rapids_cli.doctor.findings import FindingsCollector
 from rapids_cli.hardware import HardwareInfoError
 from rapids_cli.providers import get_gpu_info
 
@@ -21,7 +24,8 @@ def check_nvlink_status(verbose=True, **kwargs):
 
     # Note: this check assumes a homogeneous GPU environment (all GPUs of the same
     # model). Mixed configurations — e.g. some NVLink-capable GPUs alongside some
-    # that are not — are not handled and may produce misleading results.
+    # that are not — are not handled and may produce misleading results. How
+    # the links connect GPUs is checked by check_nvlink_topology.
 
     devices = gpu_info.devices
 
@@ -44,3 +48,104 @@ def check_nvlink_status(verbose=True, **kwargs):
 
     if verbose:
         return f"All NVLinks active across {device_count} GPUs"
+
+
+def _find(parents, node):
+    while parents.setdefault(node, node) != node:
+        parents[node] = parents[parents[node]]
+        node = parents[node]
+    return node
+
+
+def check_nvlink_topology(verbose=False, findings=None, **kwargs):
+    """Check that the NVLink graph connects all GPUs with even bandwidth."""
+    findings = findings if findings is not None else FindingsCollector()
+    try:
+        devices = get_gpu_info().devices
+    except HardwareInfoError as e:
+        raise ValueError("GPU not found. Please ensure GPUs are installed.") from e
+    if len(devices) < 2 or all(not dev.nvlink_remotes for dev in devices):
+        return False
+
+    gpus = {dev.pci_bus_id: dev.index for dev in devices if dev.pci_bus_id}
+    parents: dict[tuple[str, object], tuple[str, object]] = {}
+    directed: Counter[tuple[int, int]] = Counter()
+    switch_links: Counter[int] = Counter()
+    for dev in devices:
+        _find(parents, ("gpu", dev.index))
+        for remote in dev.nvlink_remotes.values():
+            if remote.pci_bus_id in gpus:
+                peer = gpus[remote.pci_bus_id]
+                directed[dev.index, peer] += 1
+                endpoint = ("gpu", peer)
+            elif remote.device_type == "switch":
+                # Without an address for the switch, assume a single fabric.
+                switch_links[dev.index] += 1
+                endpoint = ("switch", remote.pci_bus_id)
+            else:
+                continue
+            parents[_find(parents, ("gpu", dev.index))] = _find(parents, endpoint)
+
+    components: dict[tuple[str, object], list[int]] = {}
+    for dev in devices:
+        components.setdefault(_find(parents, ("gpu", dev.index)), []).append(dev.index)
+    groups = sorted(components.values())
+
+    # Each link is seen from both ends; a driver may only report one of them.
+    pair_links: dict[tuple[int, int], int] = {}
+    for (a, b), n in directed.items():
+        pair = (min(a, b), max(a, b))
+        pair_links[pair] = max(pair_links.get(pair, 0), n)
+    active_links = {dev.index: len(dev.nvlink_remotes) for dev in devices}
+    metrics = {
+        "components": groups,
+        "pair_links": {f"{a}-{b}": n for (a, b), n in sorted(pair_links.items())},
+        "switch_links": dict(sorted(switch_links.items())),
+        "active_links": active_links,
+    }
+
+    def _names(group):
+        return ", ".join(str(index) for index in group)
+
+    findings.info(
+        f"NVLink connects GPUs into {len(groups)} group(s): "
+        + "; ".join(f"[{_names(group)}]" for group in groups),
+        code="nvlink-topology",
+        metrics=metrics,
+    )
+    if len(groups) > 1:
+        findings.warn(
+            f"GPUs are split into {len(groups)} NVLink islands ("
+            + "; ".join(f"GPUs {_names(group)}" for group in groups)
+            + "). Traffic between islands falls back to PCIe, so keep "
+            "multi-GPU jobs within one island or check the NVLink fabric.",
+            code="nvlink-partitioned",
+            metrics=metrics,
+        )
+
+    counts = {n for n in active_links.values() if n}
+    if len(counts) > 1:
+        most = max(counts)
+        short = {gpu: n for gpu, n in active_links.items() if n and n < most}
+        findings.perf_advice(
+            ", ".join(f"GPU {gpu} has {n}" for gpu, n in short.items())
+            + f" active NVLinks where other GPUs have {most}, so collectives "
+            "are limited by the slowest GPU's bandwidth.",
+            code="nvlink-bandwidth-asymmetry",
+            metrics=metrics,
+        )
+    # Direct GPU-to-GPU meshes (e.g. hybrid cube-mesh) pair some GPUs with
+    # more links than others by design, so this is context only.
+    if len(set(pair_links.values())) > 1:
+        findings.info(
+            "NVLink link counts differ between GPU pairs: "
+            + ", ".join(
+                f"GPU {a}-{b}: {n}" for (a, b), n in sorted(pair_links.items())
+            ),
+            code="nvlink-pair-asymmetry",
+            metrics=metrics,
+        )
+
+    if verbose:
+        return f"NVLink graph connects {len(devices)} GPUs in {len(groups)} group(s)"
+    return True
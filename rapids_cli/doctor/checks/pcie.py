@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Check for degraded PCIe links."""
+
+from rapids_cli.doctor.findings import FindingsCollector
+from rapids_cli.hardware import HardwareInfoError
+from rapids_cli.providers import get_gpu_info
+
+
+def check_pcie_link(verbose=False, findings=None, **kwargs):
+    """Check that each GPU's PCIe link runs at its full width and generation."""
+    findings = findings if findings is not None else FindingsCollector()
+    gpu_info = get_gpu_info()
+    try:
+        # The link generation follows the load, and the provider may have
+        # been loaded long ago, e.g. in the doctor daemon.
+        gpu_info.refresh_usage()
+        devices = gpu_info.devices
+    except HardwareInfoError as e:
+        raise ValueError("GPU not found. Please ensure GPUs are installed.") from e
+
+    checked = 0
+    for dev in devices:
+        width, max_width = dev.pcie_link_width, dev.pcie_max_link_width
+        gen, max_gen = dev.pcie_link_generation, dev.pcie_max_link_generation
+        if None in (width, max_width, gen, max_gen):
+            continue
+        checked += 1
+        metrics = {
+            "gpu": dev.index,
+            "generation": gen,
+            "max_generation": max_gen,
+            "width": width,
+            "max_width": max_width,
+        }
+
+        # A narrower link is a hardware problem such as a card in the wrong
+        # slot, a riser or a bad seat, and caps host-device bandwidth.
+        if width < max_width:
+            findings.warn(
+                f"GPU {dev.index} PCIe link is running at Gen{gen} x{width} "
+                f"instead of Gen{max_gen} x{max_width}, limiting host-device "
+                "bandwidth. Check that the GPU is seated in a full-width slot.",
+                code="pcie-width-degraded",
+                metrics=metrics,
+            )
+        # GPUs lower their link generation to save power while idle, so a
+        # lower generation on its own is expected outside of a workload.
+        elif gen < max_gen:
+            findings.info(
+                f"GPU {dev.index} PCIe link is at Gen{gen} of Gen{max_gen}. "
+                "This is expected while the GPU is idle; if it persists under "
+                "load, host-device bandwidth is reduced.",
+                code="pcie-generation-below-max",
+                metrics=metrics,
+            )
+
+    if not checked:
+        return False
+    if verbose:
+        return f"PCIe links checked on {checked} GPU(s)"
+    return True
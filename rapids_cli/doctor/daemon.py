@@ -0,0 +1,449 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Long-lived doctor daemon serving check results over a Unix domain socket.
+
+``rapids doctor --daemon`` keeps the hardware providers and the loaded check
+functions warm between runs. ``rapids doctor --client`` sends one JSON request
+over the socket and renders the results it gets back, so it skips entry point
+discovery, NVML initialization and CUDA toolkit probing entirely. Results of
+checks whose manifest entry declares them not volatile are cached and served
+without running the check again.
+
+The daemon rebuilds its cached state whenever the NVIDIA driver, the set of
+GPU device nodes, or the client's CUDA installation changes. Cached results are
+kept apart per GPU selection, library search path and cgroup limits.
+
+Checks run in the daemon's process, but cgroup limits, CPU affinity and the
+memlock limit are read for the client process, found through the socket's
+peer credentials, so that a job confined to fewer CPUs or less memory than the
+daemon is checked against its own limits.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from rapids_cli import providers
+from rapids_cli.constants import DOCTOR_SYMBOL
+from rapids_cli.doctor.doctor import (
+    CheckResult,
+    CheckSpec,
+    doctor_check,
+    get_console,
+    plan_checks,
+    report_results,
+    run_checks,
+)
+from rapids_cli.hardware import (
+    DefaultSystemInfo,
+    GpuInfoProvider,
+    HardwareInfoError,
+    NvmlGpuInfo,
+    ProcessSystemInfo,
+    SelectedGpuInfo,
+    SystemInfoProvider,
+    cuda_visible_devices,
+    visible_mig_instances,
+)
+
+# Environment variables that change what checks observe. The client forwards
+# them with every request and the daemon rebuilds its state when they differ
+# from the values it was warmed up with.
+FINGERPRINT_ENV_VARS = (
+    "CUDA_HOME",
+    "CUDA_PATH",
+    "CUDA_DEVICE_ORDER",
+    "CONDA_PREFIX",
+    "VIRTUAL_ENV",
+    "RAPIDS_CLI_MIN_FREE_GPU_MEMORY",
+    "CUDA_MPS_PIPE_DIRECTORY",
+)
+# Environment variables that differ between the jobs one daemon serves. The
+# client forwards them too, but the daemon applies them to each request
+# without rebuilding and keeps cached results apart per GPU selection and
+# search path instead.
+REQUEST_ENV_VARS = ("CUDA_VISIBLE_DEVICES", "PATH", "LD_LIBRARY_PATH")
+
+# How long a client waits for the daemon to answer, in seconds.
+REQUEST_TIMEOUT = 30.0
+
+_DRIVER_VERSION_FILE = Path("/proc/driver/nvidia/version")
+_DRIVER_GPUS_DIR = Path("/proc/driver/nvidia/gpus")
+_DEV_DIR = Path("/dev")
+
+
+def default_socket_path() -> str:
+    """Return the per-user socket path used when ``--socket`` is not given.
+
+    The socket lives in ``XDG_RUNTIME_DIR``, or else in a ``rapids-doctor-<uid>``
+    directory of the temporary directory that the daemon creates with mode 0700.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, f"rapids-doctor-{os.getuid()}.sock")
+    return os.path.join(
+        tempfile.gettempdir(), f"rapids-doctor-{os.getuid()}", "doctor.sock"
+    )
+
+
+def check_socket_directory(socket_path: str) -> None:
+    """Check that no other user can place or replace a socket at ``socket_path``.
+
+    The directory must belong to this user or root, and must not be writable
+    by others unless it is sticky like ``/tmp``.
+
+    Raises:
+        PermissionError: If another user could control the socket.
+    """
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    st = os.stat(directory)
+    writable = st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    if st.st_uid not in (os.getuid(), 0) or (
+        writable and not st.st_mode & stat.S_ISVTX
+    ):
+        raise PermissionError(f"{directory} can be modified by other users")
+
+
+def _peer_credentials(sock: socket.socket) -> tuple[int, int, int] | None:
+    """Return the process, user and group id of the other end of a Unix socket.
+
+    ``None`` where the platform cannot tell.
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials = sock.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    return struct.unpack("3i", credentials)
+
+
+def _peer_uid(sock: socket.socket) -> int | None:
+    """Return the user id of the process on the other end of a Unix socket.
+
+    ``None`` where the platform cannot tell, which leaves the socket file's
+    permissions as the only protection.
+    """
+    credentials = _peer_credentials(sock)
+    return None if credentials is None else credentials[1]
+
+
+def _peer_pid(sock: socket.socket) -> int | None:
+    """Return the process id on the other end of a Unix socket, ``None`` if unknown."""
+    credentials = _peer_credentials(sock)
+    return None if credentials is None else credentials[0]
+
+
+def _list_names(directory: Path, pattern: str) -> tuple[str, ...]:
+    try:
+        return tuple(sorted(p.name for p in directory.glob(pattern)))
+    except OSError:
+        return ()
+
+
+def system_fingerprint(env: dict[str, str]) -> tuple:
+    """Return a value that changes when the driver, devices or environment change.
+
+    Args:
+        env: The client's environment. Only ``FINGERPRINT_ENV_VARS`` are used.
+    """
+    try:
+        driver = _DRIVER_VERSION_FILE.read_text()
+    except OSError:
+        driver = None
+    return (
+        driver,
+        _list_names(_DRIVER_GPUS_DIR, "*"),
+        _list_names(_DEV_DIR, "nvidia*"),
+        tuple(sorted((k, v) for k, v in env.items() if k in FINGERPRINT_ENV_VARS)),
+    )
+
+
+def _device_scope(gpu_info: GpuInfoProvider | None, selection: Any) -> tuple:
+    """Return the GPUs and MIG instances that ``gpu_info`` exposes to checks.
+
+    Selections naming the same GPUs in different ways, e.g. by ordinal and by
+    UUID, resolve to the same scope. A selection that cannot be resolved is
+    its own scope.
+    """
+    if gpu_info is None:
+        return ()
+    try:
+        devices = gpu_info.devices
+    except HardwareInfoError:
+        return ("unresolved", selection)
+    return tuple(
+        (dev.index, tuple(mig.index for mig in visible_mig_instances(dev)))
+        for dev in devices
+    )
+
+
+class DaemonError(RuntimeError):
+    """Raised when a running doctor daemon fails to answer a request."""
+
+
+class DoctorDaemon:
+    """Warm providers, loaded checks and cached results, rebuilt when the system fingerprint changes."""
+
+    def __init__(self) -> None:
+        """Initialize with no cached state; the first request warms it up."""
+        self._fingerprint: tuple | None = None
+        self._checks: list[CheckSpec] = []
+        self._gpu_info: NvmlGpuInfo | None = None
+        self._system_info: DefaultSystemInfo | None = None
+        # Cached results per resolved GPU selection and search path.
+        self._results: dict[tuple, dict[str, CheckResult]] = {}
+
+    def _refresh(self, env: dict[str, str]) -> None:
+        # Adopt the client's view of the environment so that checks which read
+        # e.g. CUDA_HOME see the same values a local run would.
+        for name in FINGERPRINT_ENV_VARS + REQUEST_ENV_VARS:
+            if name in env:
+                os.environ[name] = env[name]
+            else:
+                os.environ.pop(name, None)
+
+        fingerprint = system_fingerprint(env)
+        if fingerprint == self._fingerprint:
+            return
+
+        self._gpu_info = NvmlGpuInfo()
+        self._system_info = DefaultSystemInfo()
+        self._checks = plan_checks()
+        self._results = {}
+        self._fingerprint = fingerprint
+
+    def handle(self, request: dict[str, Any], pid: int | None = None) -> dict[str, Any]:
+        """Run the requested checks against the cached state.
+
+        Args:
+            request: A decoded client request with optional ``filters``,
+                ``verbose``, ``budget``, ``check_timeout``, ``fail_fast``,
+                ``devices`` and ``env`` keys.
+            pid: The client's process id. Checks of cgroup limits, CPU
+                affinity and the memlock limit then look at the client, whose
+                job may be confined more tightly than the daemon, instead of
+                at the daemon itself.
+
+        Returns:
+            A JSON-serializable response holding one entry per check result.
+        """
+        env = request.get("env", {})
+        self._refresh(env)
+        # The warm provider holds every GPU; each request sees its selection,
+        # or the GPUs in the client's CUDA_VISIBLE_DEVICES.
+        devices = request.get("devices")
+        gpu_info: GpuInfoProvider | None = self._gpu_info
+        if gpu_info is not None and devices:
+            gpu_info = SelectedGpuInfo(gpu_info, devices, strict=True)
+        elif gpu_info is not None and cuda_visible_devices() is not None:
+            gpu_info = SelectedGpuInfo(gpu_info, cuda_visible_devices() or [])
+        scope = _device_scope(
+            gpu_info, (tuple(devices or ()), os.environ.get("CUDA_VISIBLE_DEVICES"))
+        )
+        system_info: SystemInfoProvider | None = self._system_info
+        limits = None
+        if system_info is not None and pid is not None:
+            system_info = ProcessSystemInfo(system_info, pid)
+            limits = (system_info.memory_limit_bytes, system_info.cpu_limit)
+        cache = self._results.setdefault(
+            (scope, env.get("PATH"), env.get("LD_LIBRARY_PATH"), limits), {}
+        )
+        providers.reset_providers()
+        providers.set_providers(gpu_info=gpu_info, system_info=system_info)
+        filters = request.get("filters") or []
+        checks = [spec for spec in self._checks if spec.matches(filters)]
+        results = run_checks(
+            checks,
+            verbose=bool(request.get("verbose", False)),
+            budget=request.get("budget"),
+            check_timeout=request.get("check_timeout"),
+            cache=cache,
+            fail_fast=bool(request.get("fail_fast", False)),
+        )
+        return {"results": [result.to_dict() for result in results]}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: DoctorServer
+
+    def handle(self) -> None:
+        try:
+            response = self.server.doctor.handle(
+                json.loads(self.rfile.readline()), pid=_peer_pid(self.connection)
+            )
+        except Exception as e:
+            response = {"error": f"{type(e).__name__}: {e}"}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class DoctorServer(socketserver.UnixStreamServer):
+    """Unix socket server answering doctor requests one at a time.
+
+    Only this user can connect: the socket is created with mode 0600, and
+    connections from processes of other users are dropped.
+    """
+
+    def __init__(self, socket_path: str, doctor: DoctorDaemon | None = None) -> None:
+        """Bind to ``socket_path``, replacing a stale socket left by a dead daemon.
+
+        A missing parent directory is created with mode 0700.
+
+        Raises:
+            PermissionError: If other users could modify the socket's directory.
+            RuntimeError: If another daemon is serving ``socket_path``.
+        """
+        self.doctor = doctor or DoctorDaemon()
+        old_umask = os.umask(0o077)
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(socket_path)), exist_ok=True)
+            check_socket_directory(socket_path)
+            if os.path.exists(socket_path):
+                if _is_listening(socket_path):
+                    raise RuntimeError(
+                        f"A doctor daemon is already serving {socket_path}"
+                    )
+                os.unlink(socket_path)
+            super().__init__(socket_path, _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def verify_request(self, request, client_address) -> bool:
+        """Only answer clients running as the same user as the daemon."""
+        return _peer_uid(request) in (None, os.getuid())
+
+    def server_close(self) -> None:
+        """Close the socket and remove the socket file."""
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.server_address)  # type: ignore[arg-type]
+
+
+def _is_listening(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def serve(socket_path: str | None = None, verbose: bool = False) -> None:
+    """Run the doctor daemon until interrupted.
+
+    All checks are run once at startup so that the first client request is
+    already served from warm providers.
+    """
+    socket_path = socket_path or default_socket_path()
+    doctor = DoctorDaemon()
+    doctor.handle({"env": dict(os.environ)})
+    with DoctorServer(socket_path, doctor) as server:
+        get_console().print(f"Serving doctor results on {socket_path}")
+        with contextlib.suppress(KeyboardInterrupt):
+            server.serve_forever()
+
+
+def request(
+    payload: dict[str, Any],
+    socket_path: str | None = None,
+    timeout: float = REQUEST_TIMEOUT,
+) -> dict[str, Any]:
+    """Send a single request to a running daemon and return its decoded response.
+
+    Raises:
+        OSError: If no daemon is listening on the socket, the socket is not
+            this user's own (``PermissionError``), or the daemon does not
+            answer within ``timeout`` seconds (``TimeoutError``).
+        DaemonError: If the daemon failed to handle the request.
+    """
+    socket_path = socket_path or default_socket_path()
+    check_socket_directory(socket_path)
+    if os.stat(socket_path).st_uid != os.getuid():
+        raise PermissionError(f"{socket_path} belongs to another user")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile("rb") as stream:
+            line = stream.readline()
+    if not line:
+        raise ConnectionError("Doctor daemon closed the connection")
+    response = json.loads(line)
+    if "error" in response:
+        raise DaemonError(f"Doctor daemon failed: {response['error']}")
+    return response
+
+
+def run_client(
+    verbose: bool,
+    filters: list[str] | None = None,
+    socket_path: str | None = None,
+    *,
+    budget: float | None = None,
+    check_timeout: float | None = None,
+    fail_fast: bool = False,
+    devices: list[str] | None = None,
+) -> bool:
+    """Get and report check results from the daemon.
+
+    Falls back to running the checks in this process when no daemon is
+    reachable, so a prologue using ``--client`` never silently skips checks.
+    A daemon that is reachable but fails or does not answer in time is
+    reported rather than followed by a full local run.
+
+    Returns:
+        True if all checks passed, False otherwise.
+
+    Raises:
+        DaemonError: If the daemon failed the request or did not answer within
+            ``REQUEST_TIMEOUT`` seconds.
+    """
+    payload = {
+        "filters": list(filters or []),
+        "verbose": verbose,
+        "budget": budget,
+        "check_timeout": check_timeout,
+        "fail_fast": fail_fast,
+        "devices": devices,
+        "env": {
+            k: v
+            for k, v in os.environ.items()
+            if k in FINGERPRINT_ENV_VARS + REQUEST_ENV_VARS
+        },
+    }
+    try:
+        response = request(payload, socket_path)
+    except TimeoutError as e:
+        raise DaemonError(
+            f"Doctor daemon did not answer within {REQUEST_TIMEOUT:g}s; "
+            "run without --client to check locally"
+        ) from e
+    except OSError as e:
+        reason = f"not trusted ({e})" if isinstance(e, PermissionError) else None
+        get_console().print(
+            f"[bold yellow]Doctor daemon {reason or 'not reachable'}, "
+            "running checks locally[/bold yellow]"
+        )
+        return doctor_check(
+            verbose,
+            False,
+            filters,
+            budget=budget,
+            check_timeout=check_timeout,
+            fail_fast=fail_fast,
+            devices=devices,
+        )
+
+    get_console().print(
+        f"[bold green]{DOCTOR_SYMBOL} Performing REQUIRED health check for RAPIDS [/bold green]"
+    )
+    results = [CheckResult.from_dict(data) for data in response["results"]]
+    return report_results(results, verbose=verbose)
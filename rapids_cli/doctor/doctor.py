@@ -3,17 +3,48 @@
 """Health check for RAPIDS."""
 
 import contextlib
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import traceback
 import warnings
-from dataclasses import dataclass
-
-from rich.console import Console
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from rapids_cli import providers
 from rapids_cli._compatibility import entry_points
+from rapids_cli._watchdog import WatchdogTimeoutError, call_with_timeout
 from rapids_cli.constants import DOCTOR_SYMBOL
-from rapids_cli.hardware import DefaultSystemInfo, NvmlGpuInfo
+from rapids_cli.doctor.findings import Finding, FindingsCollector
+from rapids_cli.doctor.manifest import CheckMetadata, read_manifest
+from rapids_cli.hardware import DefaultSystemInfo, NvmlGpuInfo, cuda_visible_devices
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Assumed cost in seconds of a check that has neither run before on this
+# machine nor declares a cost.
+DEFAULT_CHECK_COST = 0.05
+
+# Weight of the newest measurement in the running average of check timings.
+_TIMING_SMOOTHING = 0.5
+
 
-console = Console()
+@functools.cache
+def get_console() -> "Console":
+    """Return the console doctor output is rendered to.
+
+    rich is imported on first use, so callers of :func:`iter_checks` that do
+    their own rendering never import it.
+    """
+    from rich.console import Console
+
+    return Console()
 
 
 @dataclass
@@ -24,10 +55,188 @@ class CheckResult:
     value: str | None
     error: Exception | None
     warnings: list[warnings.WarningMessage] | None
+    duration: float = 0.0
+    skip_reason: str | None = None
+    findings: list[Finding] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation of this result."""
+        error = None
+        if self.error is not None:
+            error = {
+                "type": getattr(self.error, "error_type", type(self.error).__name__),
+                "message": str(self.error),
+                "traceback": getattr(self.error, "traceback", None)
+                or "".join(traceback.format_exception(self.error)),
+            }
+        return {
+            "name": self.name,
+            "description": self.description,
+            "status": self.status,
+            "value": self.value,
+            "error": error,
+            "warnings": (
+                [str(w.message) for w in self.warnings]
+                if self.warnings is not None
+                else None
+            ),
+            "duration": self.duration,
+            "skip_reason": self.skip_reason,
+            "findings": [finding.to_dict() for finding in self.findings],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CheckResult":
+        """Rebuild a result produced by :meth:`to_dict`, e.g. in another process."""
+        error = data["error"]
+        return cls(
+            name=data["name"],
+            description=data["description"],
+            status=data["status"],
+            value=data["value"],
+            error=(
+                RemoteCheckError(error["message"], error["type"], error["traceback"])
+                if error is not None
+                else None
+            ),
+            warnings=(
+                [
+                    warnings.WarningMessage(UserWarning(message), UserWarning, "", 0)
+                    for message in data["warnings"]
+                ]
+                if data["warnings"] is not None
+                else None
+            ),
+            duration=data.get("duration", 0.0),
+            skip_reason=data.get("skip_reason"),
+            findings=[Finding.from_dict(f) for f in data.get("findings", [])],
+        )
+
+
+class RemoteCheckError(Exception):
+    """A check error that was raised outside of the current process."""
+
+    def __init__(self, message: str, error_type: str, traceback: str) -> None:
+        """Record the original exception type name and formatted traceback."""
+        super().__init__(message)
+        self.error_type = error_type
+        self.traceback = traceback
+
+
+def describe_check(check_fn: Callable) -> str:
+    """Return a check's description, the first line of its docstring."""
+    return (check_fn.__doc__ or "").strip().split("\n")[0]
+
+
+@dataclass
+class CheckSpec:
+    """A registered check, described by its manifest entry and loaded on demand.
+
+    Attributes:
+        name: The entry point name, which prerequisites refer to.
+        value: The entry point value, e.g. ``"my_package.checks:my_check"``.
+        metadata: What the providing distribution declares about the check.
+        entry_point: The entry point the check function is loaded from.
+        check_fn: The check function, once loaded.
+    """
+
+    name: str
+    value: str
+    metadata: CheckMetadata = field(default_factory=CheckMetadata)
+    entry_point: Any = None
+    check_fn: Callable | None = None
+
+    def load(self) -> Callable:
+        """Import the check function, once.
+
+        Raises:
+            ImportError: If the providing module cannot be imported.
+            AttributeError: If the module does not define the check function.
+        """
+        if self.check_fn is None:
+            if self.entry_point is None:
+                raise ImportError(f"No entry point to load {self.value} from")
+            self.check_fn = self.entry_point.load()
+        return self.check_fn
+
+    @property
+    def display_name(self) -> str:
+        """The check function's name if loaded, else the entry point name."""
+        return self.check_fn.__name__ if self.check_fn is not None else self.name
+
+    @property
+    def description(self) -> str:
+        """The check function's description if loaded, else an empty string."""
+        return describe_check(self.check_fn) if self.check_fn is not None else ""
+
+    def matches(self, filters: list[str] | None) -> bool:
+        """Whether a filter is contained in the entry point value or names the check or one of its tags."""
+        return not filters or any(
+            f in self.value or f == self.name or f in self.metadata.tags
+            for f in filters
+        )
+
+
+class CheckCancelledError(Exception):
+    """Raised by a check that stopped early because its run was cancelled."""
+
+
+class CancellationToken:
+    """Cooperative cancellation signal passed to every check as ``cancel_token``.
+
+    Long-running checks should call :meth:`raise_if_cancelled` between steps,
+    or wait on :meth:`wait` instead of sleeping, so that ``--fail-fast`` and
+    embedding callers can stop them early.
+    """
+
+    def __init__(self, event: Any = None) -> None:
+        """Create a token backed by ``event``, a ``threading.Event`` by default.
+
+        Args:
+            event: Any object with ``is_set``, ``set`` and ``wait`` methods,
+                e.g. a ``multiprocessing`` event shared with worker processes.
+        """
+        self._event = event if event is not None else threading.Event()
+        self.reason: str | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the run has been cancelled."""
+        return self._event.is_set()
+
+    @property
+    def skip_reason(self) -> str:
+        """How checks stopped by this token are reported."""
+        return f"cancelled ({self.reason})" if self.reason else "cancelled"
+
+    def cancel(self, reason: str | None = None) -> None:
+        """Cancel the run. The first reason given is kept."""
+        if not self.cancelled:
+            self.reason = reason
+        self._event.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait up to ``timeout`` seconds for cancellation and return whether it happened."""
+        return bool(self._event.wait(timeout))
+
+    def raise_if_cancelled(self) -> None:
+        """Raise ``CheckCancelledError`` if the run has been cancelled."""
+        if self.cancelled:
+            raise CheckCancelledError("Check was cancelled")
 
 
 def doctor_check(
-    verbose: bool, dry_run: bool, filters: list[str] | None = None
+    verbose: bool,
+    dry_run: bool,
+    filters: list[str] | None = None,
+    *,
+    budget: float | None = None,
+    isolate: bool = False,
+    jobs: int | None = None,
+    check_timeout: float | None = None,
+    max_rss: int | None = None,
+    fail_fast: bool = False,
+    devices: list[str] | None = None,
 ) -> bool:
     """Perform a health check for RAPIDS.
 
@@ -41,35 +250,48 @@ def doctor_check(
         dry_run: Whether to skip running checks.
         filters: A list of filters to run specific checks containing specified
             strings. For example, passing ``['cudf', 'cuml']`` will only run
-            checks containing those strings.
+            checks containing those strings. A filter also selects checks
+            with that entry point name or declared tag.
+        budget: Wall-clock time budget in seconds. Checks are run cheapest
+            first and any that do not fit are reported as not run rather
+            than failed. ``None`` runs every check to completion.
+        isolate: Whether to run checks in a pool of worker processes so that
+            a crashing or misbehaving check cannot affect the others.
+        jobs: Number of worker processes when ``isolate`` is set.
+        check_timeout: Seconds after which a single check fails.
+        max_rss: Per-check resident memory limit in bytes when ``isolate``
+            is set.
+        fail_fast: Whether to stop after the first failing check. Checks not
+            yet started, and checks still running that do not stop in time,
+            are reported as "cancelled (fail-fast)".
+        devices: GPUs to check, as CUDA device ordinals or UUIDs in the
+            form ``CUDA_VISIBLE_DEVICES`` takes, e.g. those allocated to a
+            job. Defaults to ``CUDA_VISIBLE_DEVICES``, or every GPU when
+            that is unset.
 
     Returns:
-        True if all checks passed (or dry_run is True), False otherwise.
+        True if all checks that ran passed (or dry_run is True), False otherwise.
 
     Note:
-        The function discovers and loads check functions defined in entry points
-        under the ``rapids_doctor_check`` group. It also checks specific
-        configurations related to a corresponding subcommand if given.
+        The function discovers check functions defined in entry points
+        under the ``rapids_doctor_check`` group. Checks are only imported
+        once they are about to run, so a dry run imports nothing and checks
+        declared as requiring a GPU are never imported on machines without
+        one.
 
     Example:
         >>> doctor_check(verbose=False, dry_run=False)
         >>> doctor_check(verbose=False, dry_run=False, filters=['cudf'])
     """
     filters = [] if not filters else filters
+    console = get_console()
     console.print(
         f"[bold green]{DOCTOR_SYMBOL} Performing REQUIRED health check for RAPIDS [/bold green]"
     )
 
-    checks = []
     if verbose:
         console.print("Discovering checks")
-    for ep in entry_points(group="rapids_doctor_check"):
-        with contextlib.suppress(AttributeError, ImportError):
-            if verbose:
-                console.print(f"Found check '{ep.name}' provided by '{ep.value}'")
-            if filters and not any(f in ep.value for f in filters):
-                continue
-            checks += [ep.load()]
+    checks = plan_checks(filters, verbose=verbose)
     if verbose:
         console.print(f"Discovered {len(checks)} checks")
     if not dry_run:
@@ -78,42 +300,544 @@ def doctor_check(
         console.print("Dry run, skipping checks")
         return True
 
-    providers.set_providers(gpu_info=NvmlGpuInfo(), system_info=DefaultSystemInfo())
-
-    results: list[CheckResult] = []
     with console.status("[bold green]Running checks...") as ui_status:
-        for i, check_fn in enumerate(checks):
-            error = None
-            caught_warnings = None
-            ui_status.update(f"Running [{i+1}/{len(checks)}] {check_fn.__name__}")
-
-            try:
-                with warnings.catch_warnings(record=True) as w:
-                    warnings.simplefilter("always")
-                    status = True
-                    value = check_fn(verbose=verbose)
-                    caught_warnings = w
-
-            except Exception as e:
-                error = e
-                status = False
-
-            results.append(
-                CheckResult(
-                    name=check_fn.__name__,
-                    description=check_fn.__doc__.strip().split("\n")[0],
-                    status=bool(status),
-                    value=value if isinstance(value, str) else None,
-                    error=error,
-                    warnings=caught_warnings,
-                )
+
+        def on_start(i: int, n: int, name: str) -> None:
+            ui_status.update(f"Running [{i+1}/{n}] {name}")
+
+        results = list(
+            iter_checks(
+                checks=checks,
+                verbose=verbose,
+                budget=budget,
+                isolate=isolate,
+                jobs=jobs,
+                check_timeout=check_timeout,
+                max_rss=max_rss,
+                fail_fast=fail_fast,
+                devices=devices,
+                on_start=on_start,
             )
+        )
+
+    return report_results(results, verbose=verbose)
+
+
+def iter_checks(
+    filters: list[str] | None = None,
+    *,
+    checks: list[CheckSpec] | None = None,
+    verbose: bool = False,
+    budget: float | None = None,
+    isolate: bool = False,
+    jobs: int | None = None,
+    check_timeout: float | None = None,
+    max_rss: int | None = None,
+    fail_fast: bool = False,
+    devices: list[str] | None = None,
+    cancel_token: CancellationToken | None = None,
+    on_start: Callable[[int, int, str], Any] | None = None,
+) -> Iterator[CheckResult]:
+    """Run health checks and yield each result as soon as it is available.
+
+    This is the library entry point behind ``rapids doctor``. It prints
+    nothing; pass the results to :func:`report_results` for the CLI's
+    rendering, or consume them directly:
+
+    .. code-block:: python
+
+       from rapids_cli.doctor import iter_checks
+
+       for result in iter_checks(["cudf"]):
+           print(result.name, result.status, f"{result.duration:.2f}s")
+
+    Fresh hardware providers are installed before the first check runs.
+    Closing the generator early stops scheduling further checks.
+
+    Args:
+        filters: Only run checks matching one of these strings, see
+            :meth:`CheckSpec.matches`.
+        checks: Checks to run, e.g. from :func:`plan_checks`. ``filters`` is
+            ignored when given.
+        verbose: Passed through to each check.
+        budget: Wall-clock time budget in seconds, see :func:`doctor_check`.
+        isolate: Whether to run checks in a pool of worker processes.
+            Implied by ``max_rss``.
+        jobs: Number of worker processes when isolated.
+        check_timeout: Seconds after which a single check fails.
+        max_rss: Per-check resident memory limit in bytes.
+        fail_fast: Whether to cancel the run after the first failing check.
+        devices: GPUs that GPU checks look at, see :func:`doctor_check`.
+            Only these are queried from the driver.
+        cancel_token: Lets the caller cancel the run from another thread.
+        on_start: Called with ``(index, total, check name)`` as each check
+            starts.
+
+    Yields:
+        One result per check, in completion order. ``duration`` holds each
+        check's wall-clock time.
+    """
+    if checks is None:
+        checks = plan_checks(filters)
+    if devices:
+        gpu_info = NvmlGpuInfo(devices=devices, strict=True)
+    else:
+        gpu_info = NvmlGpuInfo(devices=cuda_visible_devices())
+    providers.set_providers(gpu_info=gpu_info, system_info=DefaultSystemInfo())
+
+    if isolate or max_rss is not None:
+        from rapids_cli.doctor.pool import iter_checks_isolated
+
+        yield from iter_checks_isolated(
+            checks,
+            verbose=verbose,
+            workers=jobs,
+            check_timeout=check_timeout,
+            max_rss=max_rss,
+            budget=budget,
+            on_start=on_start,
+            fail_fast=fail_fast,
+            cancel_token=cancel_token,
+        )
+    else:
+        yield from iter_checks_in_process(
+            checks,
+            verbose=verbose,
+            budget=budget,
+            on_start=on_start,
+            check_timeout=check_timeout,
+            fail_fast=fail_fast,
+            cancel_token=cancel_token,
+        )
+
+
+def plan_checks(
+    filters: list[str] | None = None, verbose: bool = False
+) -> list[CheckSpec]:
+    """List the checks registered under ``rapids_doctor_check`` without importing them.
+
+    Args:
+        filters: Only keep checks matching one of these strings, see
+            :meth:`CheckSpec.matches`. ``None`` or an empty list keeps every
+            check.
+        verbose: Whether to print each discovered entry point.
+
+    Returns:
+        One unloaded ``CheckSpec`` per matching entry point, carrying the
+        metadata its distribution declares in a ``rapids_doctor_checks.json``
+        manifest.
+    """
+    manifests: dict[int, dict[str, CheckMetadata]] = {}
+    checks = []
+    for ep in entry_points(group="rapids_doctor_check"):
+        if verbose:
+            get_console().print(f"Found check '{ep.name}' provided by '{ep.value}'")
+        dist = getattr(ep, "dist", None)
+        if id(dist) not in manifests:
+            manifests[id(dist)] = read_manifest(dist) if dist is not None else {}
+        spec = CheckSpec(
+            name=ep.name,
+            value=ep.value,
+            metadata=manifests[id(dist)].get(ep.name) or CheckMetadata(),
+            entry_point=ep,
+        )
+        if spec.matches(filters):
+            checks.append(spec)
+    return checks
+
+
+def _timings_path() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "rapids-cli" / "doctor_timings.json"
+
+
+def load_timings() -> dict[str, float]:
+    """Return the recorded check durations in seconds, keyed by entry point value."""
+    try:
+        timings = json.loads(_timings_path().read_text())
+    except (OSError, ValueError):
+        return {}
+    return timings if isinstance(timings, dict) else {}
+
 
-    # Print warnings
+def save_timings(timings: dict[str, float]) -> None:
+    """Persist check durations for cost-aware scheduling of later runs."""
+    path = _timings_path()
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(timings))
+        os.replace(tmp_path, path)
+
+
+def estimate_cost(spec: CheckSpec, timings: dict[str, float]) -> float:
+    """Estimate how long a check takes, in seconds.
+
+    The running average recorded on this machine wins over the cost declared
+    in the check's manifest entry, then a ``cost`` attribute on an already
+    loaded check function, then ``DEFAULT_CHECK_COST``.
+    """
+    recorded = timings.get(spec.value)
+    if isinstance(recorded, (int, float)):
+        return float(recorded)
+    if spec.metadata.cost is not None:
+        return spec.metadata.cost
+    declared = getattr(spec.check_fn, "cost", None)
+    if isinstance(declared, (int, float)) and not isinstance(declared, bool):
+        return float(declared)
+    return DEFAULT_CHECK_COST
+
+
+def order_checks(
+    checks: list[CheckSpec], key: Callable[[CheckSpec], Any] | None = None
+) -> list[CheckSpec]:
+    """Order checks by ``key``, moving each after the prerequisites it declares.
+
+    Prerequisites that are not among ``checks`` are ignored, and checks in a
+    prerequisite cycle keep their relative order.
+    """
+    remaining = sorted(checks, key=key) if key is not None else list(checks)
+    names = {spec.name for spec in remaining}
+    ordered: list[CheckSpec] = []
+    placed: set[str] = set()
+    while remaining:
+        index = next(
+            (
+                i
+                for i, spec in enumerate(remaining)
+                if all(r in placed or r not in names for r in spec.metadata.requires)
+            ),
+            0,
+        )
+        spec = remaining.pop(index)
+        ordered.append(spec)
+        placed.add(spec.name)
+    return ordered
+
+
+def _gpu_count() -> int:
+    return providers.get_gpu_info().device_count
+
+
+def gpu_available(timeout: float | None = None) -> bool:
+    """Whether the current GPU provider reports at least one GPU.
+
+    Args:
+        timeout: Seconds to wait for the provider, which may have to load
+            NVML first. ``None`` waits as long as it takes.
+
+    Raises:
+        WatchdogTimeoutError: If the provider did not answer within ``timeout``.
+    """
+    try:
+        return call_with_timeout(_gpu_count, timeout) > 0
+    except WatchdogTimeoutError:
+        raise
+    except Exception:
+        return False
+
+
+def precondition_skip_reason(
+    spec: CheckSpec, passed: dict[str, bool], timeout: float | None = None
+) -> str | None:
+    """Return why a check should not run given its metadata, or ``None`` to run it.
+
+    Args:
+        spec: The check about to run.
+        passed: Whether each check run so far passed, keyed by entry point
+            name. Prerequisites missing from it do not hold the check back.
+        timeout: Seconds left in the run's budget to find out whether there
+            is a GPU. A check whose GPU probe does not finish in time is
+            reported as "not run (budget)".
+    """
+    if spec.metadata.requires_gpu:
+        try:
+            if not gpu_available(timeout):
+                return "not run (no GPU)"
+        except WatchdogTimeoutError:
+            return "not run (budget)"
+    failed = [name for name in spec.metadata.requires if passed.get(name) is False]
+    if failed:
+        return f"not run (requires {', '.join(failed)})"
+    return None
+
+
+def _takes_findings(check_fn: Callable) -> bool:
+    try:
+        return "findings" in inspect.signature(check_fn).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def run_check(
+    check_fn: Callable,
+    verbose: bool = False,
+    timeout: float | None = None,
+    cancel_token: CancellationToken | None = None,
+) -> CheckResult:
+    """Run a single check function and capture its outcome as a CheckResult.
+
+    Args:
+        check_fn: The check function to run.
+        verbose: Passed through to the check.
+        timeout: Seconds to wait for the check before abandoning it. A check
+            that times out fails with a ``WatchdogTimeoutError`` error.
+        cancel_token: Passed through to the check. A check that raises
+            ``CheckCancelledError`` is reported as skipped, not failed.
+
+    The check is passed a fresh ``FindingsCollector`` as ``findings``. It
+    fails if it raises or reports an ``error`` finding. Checks that predate
+    the findings API, which have no ``findings`` parameter, report problems
+    as Python warnings instead. Those are recorded and reported as ``warn``
+    findings coded with the warning category. Recording replaces the
+    process-wide warning filters for as long as the check runs, and catches
+    warnings from any other thread meanwhile, so checks that take
+    ``findings`` run without it.
+    """
+    error = None
+    value = None
+    caught_warnings = None
+    skip_reason = None
+    collector = FindingsCollector()
+    kwargs: dict[str, Any] = {"verbose": verbose, "findings": collector}
+    if cancel_token is not None:
+        kwargs["cancel_token"] = cancel_token
+    start = time.perf_counter()
+    try:
+        if _takes_findings(check_fn):
+            value = call_with_timeout(check_fn, timeout, **kwargs)
+        else:
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                value = call_with_timeout(check_fn, timeout, **kwargs)
+                caught_warnings = w
+        status = True
+
+    except CheckCancelledError:
+        status = False
+        skip_reason = cancel_token.skip_reason if cancel_token else "cancelled"
+    except Exception as e:
+        error = e
+        status = False
+
+    findings = list(collector.findings)
+    findings += [
+        Finding("warn", str(w.message), code=w.category.__name__)
+        for w in caught_warnings or []
+    ]
+    if any(finding.severity == "error" for finding in findings):
+        status = False
+
+    return CheckResult(
+        name=check_fn.__name__,
+        description=describe_check(check_fn),
+        status=bool(status),
+        value=value if isinstance(value, str) else None,
+        error=error,
+        warnings=caught_warnings,
+        duration=time.perf_counter() - start,
+        skip_reason=skip_reason,
+        findings=findings,
+    )
+
+
+def unrun_result(
+    spec: CheckSpec,
+    *,
+    error: Exception | None = None,
+    skip_reason: str | None = None,
+    duration: float = 0.0,
+) -> CheckResult:
+    """Build a failed or skipped result for a check that did not return normally."""
+    return CheckResult(
+        name=spec.display_name,
+        description=spec.description,
+        status=False,
+        value=None,
+        error=error,
+        warnings=None,
+        duration=duration,
+        skip_reason=skip_reason,
+    )
+
+
+def record_timing(timings: dict[str, float], value: str, duration: float) -> None:
+    """Fold a measured check duration into the running average for ``value``."""
+    previous = timings.get(value, duration)
+    timings[value] = _TIMING_SMOOTHING * duration + (1 - _TIMING_SMOOTHING) * previous
+
+
+def iter_checks_in_process(
+    checks: list[CheckSpec],
+    verbose: bool = False,
+    budget: float | None = None,
+    on_start: Callable[[int, int, str], Any] | None = None,
+    check_timeout: float | None = None,
+    cache: dict[str, CheckResult] | None = None,
+    fail_fast: bool = False,
+    cancel_token: CancellationToken | None = None,
+) -> Iterator[CheckResult]:
+    """Run checks one at a time in this process, yielding each result.
+
+    Checks run in order, or cheapest first when fitting them into a budget.
+
+    Checks run after the prerequisites they declare and are reported as not
+    run when a prerequisite did not pass or when they require a GPU and there
+    is none. Each check is imported just before it runs; checks that fail to
+    import are silently skipped. Each check's duration is folded into the
+    timings recorded for the next run. With a budget, checks whose estimated
+    cost exceeds the time left are reported as "not run (budget)" and a check
+    still running when the budget runs out is abandoned and reported as
+    "cancelled (budget)". Once the run is cancelled, the remaining checks are
+    reported as cancelled without running.
+
+    Args:
+        checks: The checks to run.
+        verbose: Passed through to each check.
+        budget: Wall-clock time budget in seconds, or ``None`` for no limit.
+        on_start: Called with ``(index, total, check name)`` before each check
+            runs.
+        check_timeout: Seconds after which a single check is abandoned and
+            fails, or ``None`` for no limit.
+        cache: Earlier results keyed by entry point value. Checks found here
+            are not run again, and results of checks not declared volatile
+            are added to it.
+        fail_fast: Whether to cancel the run after the first failing check.
+        cancel_token: Passed to each check, and lets the caller cancel the
+            run from another thread. A new token is used if not given.
+
+    Yields:
+        One result per check, in the order they were scheduled.
+    """
+    cancel_token = cancel_token or CancellationToken()
+    timings = load_timings()
+
+    def cost(spec: CheckSpec) -> float:
+        return estimate_cost(spec, timings)
+
+    deadline = None
+    if budget is not None:
+        deadline = time.monotonic() + budget
+    checks = order_checks(checks, cost if deadline is not None else None)
+
+    passed: dict[str, bool] = {}
+    try:
+        for i, spec in enumerate(checks):
+            result = cache.get(spec.value) if cache is not None else None
+            if result is not None:
+                passed[spec.name] = result.status
+                yield result
+                continue
+            if cancel_token.cancelled:
+                passed[spec.name] = False
+                yield unrun_result(spec, skip_reason=cancel_token.skip_reason)
+                continue
+
+            # Probing for a GPU may load NVML, so it gets no more than the
+            # budget left, and none once the budget is spent.
+            skip_reason = None
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    skip_reason = "not run (budget)"
+            if skip_reason is None:
+                skip_reason = precondition_skip_reason(spec, passed, remaining)
+            if skip_reason is None:
+                try:
+                    check_fn = spec.load()
+                except (AttributeError, ImportError):
+                    continue
+
+            timeout = check_timeout
+            budget_bound = False
+            if skip_reason is None and deadline is not None:
+                remaining = deadline - time.monotonic()
+                if estimate_cost(spec, timings) > remaining:
+                    skip_reason = "not run (budget)"
+                elif timeout is None or remaining < timeout:
+                    timeout, budget_bound = remaining, True
+            if skip_reason is not None:
+                passed[spec.name] = False
+                yield unrun_result(spec, skip_reason=skip_reason)
+                continue
+
+            if on_start is not None:
+                on_start(i, len(checks), spec.display_name)
+            result = run_check(
+                check_fn, verbose=verbose, timeout=timeout, cancel_token=cancel_token
+            )
+            if isinstance(result.error, WatchdogTimeoutError):
+                if budget_bound:
+                    # The budget is spent. Ask the abandoned check, still
+                    # running in its watchdog thread, and the rest to stop.
+                    cancel_token.cancel("budget")
+                    result.skip_reason = "cancelled (budget)"
+            elif not result.skip_reason:
+                record_timing(timings, spec.value, result.duration)
+                if cache is not None and not spec.metadata.volatile:
+                    cache[spec.value] = result
+            passed[spec.name] = result.status and not result.skip_reason
+            if fail_fast and not passed[spec.name] and not result.skip_reason:
+                cancel_token.cancel("fail-fast")
+            yield result
+    finally:
+        save_timings(timings)
+
+
+def run_checks(
+    checks: list[CheckSpec],
+    verbose: bool = False,
+    budget: float | None = None,
+    on_start: Callable[[int, int, str], Any] | None = None,
+    check_timeout: float | None = None,
+    cache: dict[str, CheckResult] | None = None,
+    fail_fast: bool = False,
+    cancel_token: CancellationToken | None = None,
+) -> list[CheckResult]:
+    """Run checks in this process and collect their results.
+
+    See :func:`iter_checks_in_process` for the arguments.
+    """
+    return list(
+        iter_checks_in_process(
+            checks,
+            verbose=verbose,
+            budget=budget,
+            on_start=on_start,
+            check_timeout=check_timeout,
+            cache=cache,
+            fail_fast=fail_fast,
+            cancel_token=cancel_token,
+        )
+    )
+
+
+def report_results(results: list[CheckResult], verbose: bool = False) -> bool:
+    """Print warnings, verbose output, skipped checks and failures for a set of results.
+
+    This is the CLI's rendering of the results of :func:`iter_checks`.
+
+    Returns:
+        True if all checks that ran passed, False otherwise. A run whose checks
+        were all skipped, e.g. by the budget, also returns False; a run with
+        no checks to begin with does not.
+    """
+    console = get_console()
+
+    # Print warnings and performance advice, and context in verbose mode
     for result in results:
-        if result.warnings:
-            for warning in result.warnings:
-                console.print(f"[bold yellow]Warning[/bold yellow]: {warning.message}")
+        for finding in result.findings:
+            if finding.severity == "warn":
+                console.print(f"[bold yellow]Warning[/bold yellow]: {finding.message}")
+            elif finding.severity == "perf-advice":
+                console.print(
+                    f"[bold cyan]Performance advice[/bold cyan]: {finding.message}"
+                )
+            elif finding.severity == "info" and verbose:
+                console.print(
+                    f"[bold blue]{result.name}[/bold blue]: {finding.message}"
+                )
 
     # Print verbose output for successful checks
     if verbose:
@@ -121,15 +845,31 @@ def doctor_check(
             if result.status and result.value:
                 console.print(f"[bold blue]{result.name}[/bold blue]: {result.value}")
 
-    if all(result.status for result in results):
+    for result in results:
+        if result.skip_reason:
+            console.print(
+                f"[bold yellow]{result.name}[/bold yellow] {result.skip_reason}"
+            )
+
+    ran = [result for result in results if not result.skip_reason]
+    if results and not ran:
+        console.print("[bold red]No checks ran[/bold red]")
+        return False
+    if all(result.status for result in ran):
         console.print("[bold green]All checks passed![/bold green]")
         return True
     else:
         for result in results:
-            if not result.status:
+            if not result.status and not result.skip_reason:
                 console.print(f"[bold red]{result.name} failed[/bold red]")
-                console.print(f"  {result.error}")
-                if verbose and result.error:
+                if result.error is not None:
+                    console.print(f"  {result.error}")
+                for finding in result.findings:
+                    if finding.severity == "error":
+                        console.print(f"  {finding.message}")
+                if verbose and isinstance(result.error, RemoteCheckError):
+                    console.print(result.error.traceback)
+                elif verbose and result.error:
                     try:
                         raise result.error
                     except Exception:
@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Structured findings that checks report alongside their pass/fail status.
+
+Every check is passed a :class:`FindingsCollector` as the ``findings`` keyword
+argument. Findings carry a severity, a human-readable message, an optional
+machine-readable code and optional metrics, and travel with the
+:class:`~rapids_cli.doctor.doctor.CheckResult` to every consumer.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Literal, get_args
+
+Severity = Literal["info", "warn", "error", "perf-advice"]
+
+SEVERITIES: tuple[str, ...] = get_args(Severity)
+
+
+@dataclass
+class Finding:
+    """A single observation reported by a check.
+
+    Attributes:
+        severity: ``"info"`` for context, ``"warn"`` for a problem that does
+            not fail the check, ``"error"`` for one that does, and
+            ``"perf-advice"`` for a working but suboptimal configuration.
+        message: What was found and, where possible, how to fix it.
+        code: A stable identifier for the kind of finding, e.g.
+            ``"pcie-link-degraded"``, for tools that act on findings.
+        metrics: Measured values behind the finding.
+    """
+
+    severity: Severity
+    message: str
+    code: str | None = None
+    metrics: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation of this finding."""
+        return {
+            "severity": self.severity,
+            "message": self.message,
+            "code": self.code,
+            "metrics": dict(self.metrics),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Finding:
+        """Rebuild a finding produced by :meth:`to_dict`."""
+        return cls(
+            severity=data["severity"],
+            message=data["message"],
+            code=data.get("code"),
+            metrics=dict(data.get("metrics") or {}),
+        )
+
+
+class FindingsCollector:
+    """Collects the findings of one check run."""
+
+    def __init__(self) -> None:
+        """Start with no findings."""
+        self.findings: list[Finding] = []
+
+    def add(
+        self,
+        severity: Severity,
+        message: str,
+        *,
+        code: str | None = None,
+        metrics: dict[str, Any] | None = None,
+    ) -> Finding:
+        """Record a finding.
+
+        Raises:
+            ValueError: If ``severity`` is not one of ``SEVERITIES``.
+        """
+        if severity not in SEVERITIES:
+            raise ValueError(
+                f"Unknown severity {severity!r}, expected one of {', '.join(SEVERITIES)}"
+            )
+        finding = Finding(severity, message, code=code, metrics=dict(metrics or {}))
+        self.findings.append(finding)
+        return finding
+
+    def info(
+        self,
+        message: str,
+        *,
+        code: str | None = None,
+        metrics: dict[str, Any] | None = None,
+    ) -> Finding:
+        """Record context that is only shown in verbose output."""
+        return self.add("info", message, code=code, metrics=metrics)
+
+    def warn(
+        self,
+        message: str,
+        *,
+        code: str | None = None,
+        metrics: dict[str, Any] | None = None,
+    ) -> Finding:
+        """Record a problem that does not fail the check."""
+        return self.add("warn", message, code=code, metrics=metrics)
+
+    def error(
+        self,
+        message: str,
+        *,
+        code: str | None = None,
+        metrics: dict[str, Any] | None = None,
+    ) -> Finding:
+        """Record a problem that fails the check, without stopping it."""
+        return self.add("error", message, code=code, metrics=metrics)
+
+    def perf_advice(
+        self,
+        message: str,
+        *,
+        code: str | None = None,
+        metrics: dict[str, Any] | None = None,
+    ) -> Finding:
+        """Record a configuration that works but leaves performance on the table."""
+        return self.add("perf-advice", message, code=code, metrics=metrics)
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Declarative check metadata read from package metadata.
+
+Loading a check's entry point imports its module, which for plugins means
+importing libraries such as cudf or cuml. A distribution can avoid that by
+shipping a ``rapids_doctor_checks.json`` manifest in its ``.dist-info``
+directory, keyed by entry point name:
+
+.. code-block:: json
+
+   {
+       "my_check": {
+           "tags": ["my_package", "io"],
+           "cost": 0.5,
+           "requires_gpu": true,
+           "volatile": false,
+           "requires": ["gpu"]
+       }
+   }
+
+A check's description is the first line of its docstring, so it is not part of
+the manifest. Hatchling ships the file with the ``extra-metadata`` wheel
+option, which places it under ``extra_metadata/`` in the ``.dist-info``
+directory. The manifest is read with ``Distribution.read_text`` and never
+imports anything.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+MANIFEST_NAME = "rapids_doctor_checks.json"
+
+# Locations inside the .dist-info directory searched for the manifest.
+_MANIFEST_PATHS = (f"extra_metadata/{MANIFEST_NAME}", MANIFEST_NAME)
+
+
+@dataclass
+class CheckMetadata:
+    """What a check declares about itself without being imported.
+
+    Attributes:
+        tags: Extra words that ``rapids doctor`` filters match against.
+        cost: Expected duration in seconds, used to schedule ``--budget`` runs
+            until the check has been timed on this machine.
+        requires_gpu: Whether the check is meaningless without a GPU. Such
+            checks are not imported at all on machines without one.
+        volatile: Whether the result can change without the driver, devices
+            or environment changing (e.g. free GPU memory). The doctor daemon
+            only caches results of checks declared not volatile, so checks
+            without a manifest entry count as volatile.
+        requires: Entry point names of checks that must pass before this one
+            is worth running.
+    """
+
+    tags: list[str] = field(default_factory=list)
+    cost: float | None = None
+    requires_gpu: bool = False
+    volatile: bool = True
+    requires: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CheckMetadata:
+        """Build metadata from a manifest entry, ignoring malformed fields."""
+
+        def _strings(value: Any) -> list[str]:
+            if not isinstance(value, list):
+                return []
+            return [v for v in value if isinstance(v, str)]
+
+        cost = data.get("cost")
+        return cls(
+            tags=_strings(data.get("tags")),
+            cost=(
+                float(cost)
+                if isinstance(cost, (int, float)) and not isinstance(cost, bool)
+                else None
+            ),
+            requires_gpu=data.get("requires_gpu") is True,
+            volatile=data.get("volatile") is not False,
+            requires=_strings(data.get("requires")),
+        )
+
+
+def read_manifest(dist: Any) -> dict[str, CheckMetadata]:
+    """Return the check metadata a distribution declares, keyed by entry point name.
+
+    Args:
+        dist: An ``importlib.metadata.Distribution``. Distributions without a
+            manifest, or with an unreadable one, declare nothing.
+    """
+    for path in _MANIFEST_PATHS:
+        try:
+            text = dist.read_text(path)
+        except Exception:
+            continue
+        if not isinstance(text, str):
+            continue
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {
+            name: CheckMetadata.from_dict(entry)
+            for name, entry in data.items()
+            if isinstance(entry, dict)
+        }
+    return {}
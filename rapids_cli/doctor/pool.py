@@ -0,0 +1,315 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Run doctor checks in a pool of isolated worker processes.
+
+A check that segfaults inside a CUDA library, leaks GPU memory or leaves NVML
+in a bad state only takes down its own worker. Workers are forked before any
+check runs and read hardware information from a snapshot of the orchestrator's
+providers rather than initializing NVML themselves. A worker that crashes or
+exceeds its timeout or RSS limit is killed, its check is reported as failed
+and a fresh worker takes its place.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import multiprocessing
+import os
+import signal
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from multiprocessing.connection import Connection, wait
+from typing import Any
+
+import psutil
+
+from rapids_cli import providers
+from rapids_cli._watchdog import WatchdogTimeoutError, call_with_timeout
+from rapids_cli.doctor.doctor import (
+    CancellationToken,
+    CheckResult,
+    CheckSpec,
+    estimate_cost,
+    load_timings,
+    order_checks,
+    precondition_skip_reason,
+    record_timing,
+    run_check,
+    save_timings,
+    unrun_result,
+)
+
+# How often the orchestrator wakes up to enforce timeouts and RSS limits.
+_POLL_INTERVAL = 0.05
+
+# Seconds a running check gets to notice cancellation before it is killed.
+_CANCEL_GRACE = 1.0
+
+
+class CheckProcessError(Exception):
+    """A check's worker process was killed or died before returning a result."""
+
+
+def _worker_main(
+    conn: Connection,
+    checks: list[CheckSpec],
+    snapshot: dict[str, Any],
+    verbose: bool,
+    cancel_token: CancellationToken,
+) -> None:  # pragma: no cover
+    """Run the checks whose indices the orchestrator sends until told to stop."""
+    providers.set_providers(**snapshot)
+    while (index := conn.recv()) is not None:
+        check_fn = checks[index].load()
+        result = run_check(check_fn, verbose=verbose, cancel_token=cancel_token)
+        conn.send(result.to_dict())
+
+
+class _Worker:
+    """A forked worker process and the pipe used to talk to it."""
+
+    def __init__(self, ctx, checks, snapshot, verbose, cancel_token) -> None:
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, checks, snapshot, verbose, cancel_token),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.index = -1
+        self.started = 0.0
+
+    def submit(self, index: int) -> None:
+        self.index = index
+        self.started = time.monotonic()
+        self.conn.send(index)
+
+    def rss(self) -> int:
+        try:
+            return psutil.Process(self.process.pid).memory_info().rss
+        except psutil.Error:
+            return 0
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        with contextlib.suppress(OSError):
+            self.conn.send(None)
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+def _describe_exit(exitcode: int | None) -> str:
+    if exitcode is not None and exitcode < 0:
+        with contextlib.suppress(ValueError):
+            return f"was killed by {signal.Signals(-exitcode).name}"
+    return f"exited with code {exitcode}"
+
+
+def iter_checks_isolated(
+    checks: list[CheckSpec],
+    verbose: bool = False,
+    *,
+    workers: int | None = None,
+    check_timeout: float | None = None,
+    max_rss: int | None = None,
+    budget: float | None = None,
+    on_start: Callable[[int, int, str], Any] | None = None,
+    fail_fast: bool = False,
+    cancel_token: CancellationToken | None = None,
+) -> Iterator[CheckResult]:
+    """Run checks in parallel worker processes, yielding results as they complete.
+
+    A check is only handed to a worker once the prerequisites it declares have
+    finished, and is reported as not run if one of them did not pass or if it
+    requires a GPU and there is none. Checks are imported by the orchestrator
+    just before they are handed to a worker; those that fail to import are
+    silently skipped.
+
+    Once the run is cancelled, checks not yet started are reported as
+    cancelled and running checks get ``_CANCEL_GRACE`` seconds to return
+    before their workers are killed.
+
+    Args:
+        checks: The checks to run.
+        verbose: Passed through to each check.
+        workers: Number of worker processes. Defaults to the number of CPUs,
+            capped at the number of checks.
+        check_timeout: Seconds after which a check's worker is killed and the
+            check fails, or ``None`` for no limit.
+        max_rss: Resident set size in bytes above which a check's worker is
+            killed and the check fails, or ``None`` for no limit.
+        budget: Wall-clock time budget in seconds. Checks run cheapest first;
+            those that cannot start in time are reported as "not run (budget)"
+            and those still running when it expires are killed and reported
+            as "cancelled (budget)".
+        on_start: Called with ``(index, total, check name)`` as each check is
+            handed to a worker.
+        fail_fast: Whether to cancel the run after the first failing check.
+        cancel_token: Lets the caller cancel the run from another thread.
+            Workers are given a token of their own that follows it.
+
+    Yields:
+        One result per check, in completion order.
+    """
+    timings = load_timings()
+
+    def cost(spec: CheckSpec) -> float:
+        return estimate_cost(spec, timings)
+
+    def waiting(index: int) -> bool:
+        requires = checks[index].metadata.requires
+        return any(r in names and r not in finished for r in requires)
+
+    deadline = None
+    if budget is not None:
+        deadline = time.monotonic() + budget
+    checks = order_checks(checks, cost if deadline is not None else None)
+    pending = deque(range(len(checks)))
+    if not pending:
+        return
+
+    names = {spec.name for spec in checks}
+    finished: set[str] = set()
+    passed: dict[str, bool] = {}
+
+    # Loading the providers for the snapshot may initialize NVML, so it gets
+    # no more than the budget.
+    try:
+        snapshot = call_with_timeout(
+            providers.snapshot_providers,
+            None if deadline is None else deadline - time.monotonic(),
+        )
+    except WatchdogTimeoutError:
+        for index in pending:
+            yield unrun_result(checks[index], skip_reason="not run (budget)")
+        return
+    ctx = multiprocessing.get_context("fork")
+    token = CancellationToken(ctx.Event())
+    worker_args = (ctx, checks, snapshot, verbose, token)
+    size = max(1, min(workers or os.cpu_count() or 1, len(pending)))
+    idle = [_Worker(*worker_args) for _ in range(size)]
+    busy: list[_Worker] = []
+    started = 0
+    cancelled_at = None
+    try:
+        while pending or busy:
+            if cancel_token is not None and cancel_token.cancelled:
+                token.cancel(cancel_token.reason)
+            if token.cancelled:
+                cancelled_at = cancelled_at or time.monotonic()
+                while pending:
+                    spec = checks[pending.popleft()]
+                    yield unrun_result(spec, skip_reason=token.skip_reason)
+            while pending and idle:
+                # Checks still waiting on a running prerequisite are passed
+                # over so that independent checks behind them can start.
+                index = next((i for i in pending if not busy or not waiting(i)), -1)
+                if index < 0:
+                    break
+                pending.remove(index)
+                spec = checks[index]
+                skip_reason = precondition_skip_reason(spec, passed)
+                if skip_reason is None:
+                    try:
+                        spec.load()
+                    except (AttributeError, ImportError):
+                        finished.add(spec.name)
+                        continue
+                if (
+                    skip_reason is None
+                    and deadline is not None
+                    and cost(spec) > deadline - time.monotonic()
+                ):
+                    skip_reason = "not run (budget)"
+                if skip_reason is not None:
+                    finished.add(spec.name)
+                    passed[spec.name] = False
+                    yield unrun_result(spec, skip_reason=skip_reason)
+                    continue
+                if on_start is not None:
+                    on_start(started, len(checks), spec.display_name)
+                started += 1
+                worker = idle.pop()
+                try:
+                    worker.submit(index)
+                except OSError:
+                    # The worker died while idle, e.g. at the hands of the
+                    # OOM killer, so the check goes to a fresh one instead.
+                    worker.kill()
+                    worker = _Worker(*worker_args)
+                    worker.submit(index)
+                busy.append(worker)
+            if not busy:
+                continue
+
+            ready = wait(
+                [w.conn for w in busy] + [w.process.sentinel for w in busy],
+                timeout=_POLL_INTERVAL,
+            )
+            now = time.monotonic()
+            for worker in list(busy):
+                spec = checks[worker.index]
+                elapsed = now - worker.started
+                if worker.conn in ready:
+                    with contextlib.suppress(EOFError):
+                        result = CheckResult.from_dict(worker.conn.recv())
+                        busy.remove(worker)
+                        idle.append(worker)
+                        finished.add(spec.name)
+                        if result.skip_reason:
+                            result.skip_reason = token.skip_reason
+                        else:
+                            record_timing(timings, spec.value, result.duration)
+                            if fail_fast and not result.status:
+                                token.cancel("fail-fast")
+                        passed[spec.name] = result.status and not result.skip_reason
+                        yield result
+                        continue
+
+                error = skip_reason = None
+                if not worker.process.is_alive() or worker.conn in ready:
+                    worker.process.join()
+                    error = CheckProcessError(
+                        f"Check process {_describe_exit(worker.process.exitcode)}"
+                    )
+                elif deadline is not None and now >= deadline:
+                    skip_reason = "cancelled (budget)"
+                elif cancelled_at is not None and now >= cancelled_at + _CANCEL_GRACE:
+                    skip_reason = token.skip_reason
+                elif check_timeout is not None and elapsed > check_timeout:
+                    error = CheckProcessError(
+                        f"Check did not finish within {check_timeout:.3g}s"
+                    )
+                elif max_rss is not None and worker.rss() > max_rss:
+                    error = CheckProcessError(
+                        f"Check process exceeded the RSS limit of {max_rss / 2**20:.0f} MiB"
+                    )
+                else:
+                    continue
+
+                busy.remove(worker)
+                worker.kill()
+                if fail_fast and error is not None:
+                    token.cancel("fail-fast")
+                if pending and not token.cancelled:
+                    idle.append(_Worker(*worker_args))
+                finished.add(spec.name)
+                passed[spec.name] = False
+                yield unrun_result(
+                    spec, error=error, skip_reason=skip_reason, duration=elapsed
+                )
+    finally:
+        for worker in idle:
+            worker.stop()
+        for worker in busy:
+            worker.kill()
+        save_timings(timings)
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""GPUDirect RDMA and GPUDirect Storage (GDS) state read from the filesystem.
+
+GPUDirect RDMA lets network adapters read and write GPU memory directly and
+needs the ``nvidia_peermem`` kernel module. GPUDirect Storage does the same
+for NVMe and parallel filesystems through the ``nvidia_fs`` module, configured
+by ``cufile.json``. Every function takes an optional path standing in for the
+real file or directory so it can be pointed at a fixture tree.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+PROC_MODULES = Path("/proc/modules")
+INFINIBAND_CLASS = Path("/sys/class/infiniband")
+# cuFile reads the file named by CUFILE_ENV_PATH_JSON, else this default.
+CUFILE_JSON = Path("/etc/cufile.json")
+
+PEERMEM_MODULES = ("nvidia_peermem", "nv_peer_mem")
+GDS_MODULE = "nvidia_fs"
+
+
+@dataclass
+class RdmaPort:
+    """A port of an InfiniBand or RoCE adapter.
+
+    Attributes:
+        device: Adapter name, e.g. ``"mlx5_0"``.
+        port: Port number.
+        link_layer: ``"InfiniBand"``, or ``"Ethernet"`` for RoCE.
+        state: Port state without its numeric prefix, e.g. ``"ACTIVE"``.
+    """
+
+    device: str
+    port: int
+    link_layer: str | None = None
+    state: str | None = None
+
+
+def _read(path: Path) -> str | None:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def loaded_modules(path: Path | None = None) -> set[str]:
+    """Return the names of the loaded kernel modules."""
+    text = _read(path or PROC_MODULES) or ""
+    return {line.split()[0] for line in text.splitlines() if line.strip()}
+
+
+def rdma_ports(root: Path | None = None) -> list[RdmaPort]:
+    """Return the ports of every InfiniBand and RoCE adapter."""
+    ports = []
+    for device in sorted((root or INFINIBAND_CLASS).glob("*")):
+        for port in sorted((device / "ports").glob("[0-9]*")):
+            state = _read(port / "state")
+            ports.append(
+                RdmaPort(
+                    device=device.name,
+                    port=int(port.name),
+                    link_layer=_read(port / "link_layer"),
+                    # The kernel reports e.g. "4: ACTIVE".
+                    state=state.partition(":")[2].strip() if state else None,
+                )
+            )
+    return ports
+
+
+def cufile_json_path() -> Path:
+    """Return the ``cufile.json`` cuFile would read."""
+    return Path(os.environ.get("CUFILE_ENV_PATH_JSON") or CUFILE_JSON)
+
+
+def read_cufile_json(path: Path | None = None) -> dict[str, Any] | None:
+    """Return the parsed ``cufile.json``, or ``None`` when it does not exist.
+
+    ``cufile.json`` allows ``//`` comment lines, which are dropped before
+    parsing.
+
+    Raises:
+        ValueError: If the file exists but is not valid JSON.
+    """
+    text = _read(path or cufile_json_path())
+    if text is None:
+        return None
+    lines = [line for line in text.splitlines() if not line.strip().startswith("//")]
+    config = json.loads("\n".join(lines))
+    if not isinstance(config, dict):
+        raise ValueError("cufile.json does not contain a JSON object")
+    return config
+
+
+def gds_compat_mode_allowed(config: dict[str, Any]) -> bool:
+    """Return whether cuFile may fall back to POSIX I/O when GDS is unavailable."""
+    properties = config.get("properties")
+    if not isinstance(properties, dict):
+        return True
+    return properties.get("allow_compat_mode", True) is not False
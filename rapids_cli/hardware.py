@@ -4,24 +4,344 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Protocol, runtime_checkable
+import os
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
+
+from rapids_cli._watchdog import WatchdogTimeoutError, call_with_timeout
+
+# Seconds to wait for the GPU driver before declaring it wedged. Overridden by
+# the RAPIDS_CLI_PROBE_TIMEOUT environment variable; zero or a negative value
+# disables the watchdog.
+DEFAULT_PROBE_TIMEOUT = 30.0
+
+# Where the CUDA MPS control daemon creates its pipes unless
+# CUDA_MPS_PIPE_DIRECTORY says otherwise.
+MPS_PIPE_DIRECTORY = Path("/tmp/nvidia-mps")
+
+_COMPUTE_MODES = {
+    0: "default",
+    1: "exclusive_thread",
+    2: "prohibited",
+    3: "exclusive_process",
+}
+
+
+@dataclass
+class NvLinkRemote:
+    """The far end of an NVLink.
+
+    Attributes:
+        pci_bus_id: The remote device's sysfs PCI address, or ``None`` when the
+            driver does not report it.
+        device_type: ``"gpu"``, ``"switch"`` (an NVSwitch), ``"ibmnpu"`` or
+            ``"unknown"``.
+    """
+
+    pci_bus_id: str | None = None
+    device_type: str = "unknown"
+
+
+@dataclass
+class GpuProcess:
+    """A compute process using a GPU.
+
+    Attributes:
+        pid: Process id, in the host's PID namespace.
+        name: Process name, or ``None`` when the driver cannot resolve it, as
+            happens for processes outside the caller's container.
+        used_memory_bytes: GPU memory held by the process, or ``None`` when
+            the driver does not report it.
+    """
+
+    pid: int
+    name: str | None = None
+    used_memory_bytes: int | None = None
+
+
+@dataclass
+class MigInstance:
+    """A Multi-Instance GPU (MIG) device, i.e. a compute instance of a GPU instance.
+
+    Attributes:
+        index: Index of the MIG device within its parent GPU.
+        memory_total_bytes: Memory of the GPU instance.
+        uuid: The ``MIG-...`` UUID that ``CUDA_VISIBLE_DEVICES`` accepts.
+        name: Device name including the profile, e.g.
+            ``"NVIDIA A100-SXM4-40GB MIG 1g.5gb"``.
+        gpu_instance_id: Id of the GPU instance on the parent GPU.
+        compute_instance_id: Id of the compute instance within the GPU instance.
+        multiprocessor_count: Streaming multiprocessors of the compute instance.
+        gpu_instance_slice_count: Slices of the parent GPU the GPU instance uses.
+        compute_instance_slice_count: Slices of the GPU instance the compute
+            instance uses.
+        memory_used_bytes: Memory in use on the GPU instance.
+        memory_free_bytes: Free memory of the GPU instance.
+        processes: Compute processes running on the MIG device.
+
+    Like those of ``DeviceInfo``, the memory use and ``processes`` describe
+    the moment the MIG device was read.
+    """
+
+    index: int
+    memory_total_bytes: int
+    uuid: str | None = None
+    name: str | None = None
+    gpu_instance_id: int | None = None
+    compute_instance_id: int | None = None
+    multiprocessor_count: int | None = None
+    gpu_instance_slice_count: int | None = None
+    compute_instance_slice_count: int | None = None
+    memory_used_bytes: int | None = None
+    memory_free_bytes: int | None = None
+    processes: list[GpuProcess] = field(default_factory=list)
 
 
 @dataclass
 class DeviceInfo:
-    """Per-GPU device information."""
+    """Per-GPU device information.
+
+    Fields after ``nvlink_states`` are ``None`` when the driver does not
+    report them. The maximum PCIe link generation is the highest both the GPU
+    and its slot support. ``clock_event_reasons`` is NVML's bitmask of reasons
+    the clocks are currently held down; clocks are in MHz and power limits in
+    milliwatts. ``pci_bus_id`` is in the ``domain:bus:device.function`` form
+    used by sysfs, e.g. ``"0000:3b:00.0"``. ``nvlink_remotes`` holds the far
+    end of each link in ``nvlink_states``, for the links that are active.
+
+    Memory use, utilization (in percent) and ``processes`` describe the
+    moment the device was read, unlike the other fields.
+
+    ``mig_enabled`` is whether Multi-Instance GPU mode is currently on. CUDA
+    cannot use such a GPU as a whole, only the ``mig_instances`` on it.
+
+    ECC error counters are either ``volatile`` (since the last driver load or
+    GPU reset) or ``aggregate`` (over the GPU's lifetime). Older GPUs retire
+    pages of memory with errors (``retired_pages_*`` count pages retired for
+    repeated single-bit and for double-bit errors); Ampere and later remap
+    rows instead. Pending retirements and remaps take effect on the next GPU
+    reset, and a failed remap means the GPU ran out of spare rows.
+
+    ``compute_mode`` is ``"default"``, ``"exclusive_process"``,
+    ``"exclusive_thread"`` or ``"prohibited"``.
+    """
 
     index: int
     compute_capability: tuple[int, int]
     memory_total_bytes: int
     nvlink_states: list[bool] = field(default_factory=list)
+    nvlink_remotes: dict[int, NvLinkRemote] = field(default_factory=dict)
+    pcie_link_generation: int | None = None
+    pcie_max_link_generation: int | None = None
+    pcie_link_width: int | None = None
+    pcie_max_link_width: int | None = None
+    clock_event_reasons: int | None = None
+    sm_clock_mhz: int | None = None
+    sm_max_clock_mhz: int | None = None
+    memory_clock_mhz: int | None = None
+    memory_max_clock_mhz: int | None = None
+    sm_application_clock_mhz: int | None = None
+    sm_default_application_clock_mhz: int | None = None
+    memory_application_clock_mhz: int | None = None
+    memory_default_application_clock_mhz: int | None = None
+    power_limit_mw: int | None = None
+    default_power_limit_mw: int | None = None
+    temperature_c: int | None = None
+    pci_bus_id: str | None = None
+    name: str | None = None
+    uuid: str | None = None
+    memory_used_bytes: int | None = None
+    memory_free_bytes: int | None = None
+    gpu_utilization_percent: int | None = None
+    memory_utilization_percent: int | None = None
+    processes: list[GpuProcess] = field(default_factory=list)
+    mig_enabled: bool | None = None
+    mig_instances: list[MigInstance] = field(default_factory=list)
+    ecc_enabled: bool | None = None
+    ecc_corrected_volatile: int | None = None
+    ecc_uncorrected_volatile: int | None = None
+    ecc_corrected_aggregate: int | None = None
+    ecc_uncorrected_aggregate: int | None = None
+    retired_pages_sbe: int | None = None
+    retired_pages_dbe: int | None = None
+    retired_pages_pending: bool | None = None
+    remapped_rows_correctable: int | None = None
+    remapped_rows_uncorrectable: int | None = None
+    row_remap_pending: bool | None = None
+    row_remap_failed: bool | None = None
+    persistence_mode: bool | None = None
+    compute_mode: str | None = None
+
+
+def visible_mig_instances(
+    device: DeviceInfo, cuda_visible_devices: str | None = None
+) -> list[MigInstance]:
+    """Return the MIG instances of ``device`` that CUDA exposes to this process.
+
+    When ``cuda_visible_devices`` names MIG devices, either as ``MIG-<uuid>``
+    or in the older ``MIG-GPU-<uuid>/<gpu instance>/<compute instance>``
+    form, only those are visible. Otherwise every instance is.
+
+    Args:
+        device: The parent GPU.
+        cuda_visible_devices: The selected devices in the form of
+            ``CUDA_VISIBLE_DEVICES``. When not given, every instance of
+            ``device`` is visible, as providers only keep the instances
+            selected by ``--devices`` or ``CUDA_VISIBLE_DEVICES``.
+    """
+    if cuda_visible_devices is None:
+        return list(device.mig_instances)
+    selected = {
+        entry.strip()
+        for entry in cuda_visible_devices.split(",")
+        if entry.strip().startswith("MIG-")
+    }
+    if not selected:
+        return list(device.mig_instances)
+    return [
+        mig
+        for mig in device.mig_instances
+        if mig.uuid in selected
+        or f"MIG-{device.uuid}/{mig.gpu_instance_id}/{mig.compute_instance_id}"
+        in selected
+    ]
+
+
+def usable_memory_bytes(
+    device: DeviceInfo, cuda_visible_devices: str | None = None
+) -> int:
+    """Return the GPU memory CUDA can use on ``device``.
+
+    This is the whole card, or the memory of the visible MIG instances when
+    MIG mode is enabled.
+    """
+    if not device.mig_enabled:
+        return device.memory_total_bytes
+    return sum(
+        mig.memory_total_bytes
+        for mig in visible_mig_instances(device, cuda_visible_devices)
+    )
+
+
+def sysfs_pci_address(bus_id: str | bytes) -> str:
+    """Convert an NVML PCI bus id to the address sysfs uses.
+
+    NVML reports ``"00000000:3B:00.0"``, with an eight digit domain and upper
+    case hex; sysfs names the same device ``"0000:3b:00.0"``.
+    """
+    if isinstance(bus_id, bytes):
+        bus_id = bus_id.decode()
+    domain, _, rest = bus_id.strip().rpartition(":")
+    domain, _, bus = domain.rpartition(":")
+    return f"{int(domain or '0', 16):04x}:{bus.lower()}:{rest.lower()}"
 
 
 class HardwareInfoError(Exception):
     """Raised when hardware information cannot be obtained."""
 
 
+def cuda_visible_devices() -> list[str] | None:
+    """Return the entries of ``CUDA_VISIBLE_DEVICES``, or ``None`` when it is unset."""
+    value = os.environ.get("CUDA_VISIBLE_DEVICES")
+    if value is None:
+        return None
+    return [entry.strip() for entry in value.split(",") if entry.strip()]
+
+
+def ordinals_in_pci_bus_order(models: Iterable[str | None]) -> bool:
+    """Return whether CUDA numbers the GPUs of the given models in PCI bus id order.
+
+    It does with ``CUDA_DEVICE_ORDER=PCI_BUS_ID``. By default CUDA numbers the
+    GPU it guesses is fastest first, which only agrees with PCI bus id order
+    on a node of identical GPUs.
+    """
+    if os.environ.get("CUDA_DEVICE_ORDER") == "PCI_BUS_ID":
+        return True
+    return len(set(models)) <= 1
+
+
+def resolve_devices(
+    entries: Sequence[str],
+    gpus: Sequence[tuple[int, str | None, str | None]],
+    mig_parents: Mapping[str, int] | None = None,
+    strict: bool = False,
+    pci_bus_order: bool = True,
+) -> list[int]:
+    """Map ``CUDA_VISIBLE_DEVICES``-style entries to NVML device indices.
+
+    An entry is a CUDA device ordinal, a GPU UUID (``GPU-...``, or a unique
+    prefix of one) or a MIG device UUID, which selects the GPU it is on.
+    Ordinals count GPUs in PCI bus id order, see
+    :func:`ordinals_in_pci_bus_order`.
+
+    Args:
+        entries: The selected devices, in order.
+        gpus: ``(NVML index, PCI bus id, UUID)`` of every GPU on the node.
+        mig_parents: NVML index of the GPU holding each ``MIG-<uuid>`` entry.
+        strict: Whether an entry matching no GPU is an error. Otherwise it and
+            every later entry are ignored, as CUDA does.
+        pci_bus_order: Whether CUDA numbers the GPUs in PCI bus id order.
+            Otherwise which GPU an ordinal means is unknown, and ordinals
+            match no GPU.
+
+    Raises:
+        HardwareInfoError: If ``strict`` and an entry matches no GPU.
+    """
+    mig_parents = mig_parents or {}
+    by_bus_id = sorted(gpus, key=lambda gpu: (gpu[1] is None, gpu[1] or "", gpu[0]))
+    selected: list[int] = []
+    for entry in entries:
+        entry = entry.strip()
+        if entry.isdigit() and not pci_bus_order:
+            if strict:
+                raise HardwareInfoError(
+                    f"GPU ordinal {entry!r} is ambiguous, as CUDA numbers the "
+                    "different GPUs of this system fastest first. Select GPUs "
+                    "by UUID or set CUDA_DEVICE_ORDER=PCI_BUS_ID"
+                )
+            break
+        if entry.isdigit():
+            matches = [by_bus_id[int(entry)][0]] if int(entry) < len(gpus) else []
+        elif entry.startswith("MIG-GPU-"):
+            # The older MIG-GPU-<gpu uuid>/<gpu instance>/<compute instance> form.
+            parent = entry[len("MIG-") :].split("/")[0]
+            matches = [index for index, _, uuid in gpus if uuid == parent]
+        elif entry.startswith("MIG-"):
+            matches = [mig_parents[entry]] if entry in mig_parents else []
+        elif entry.startswith("GPU-"):
+            matches = [
+                index for index, _, uuid in gpus if (uuid or "").startswith(entry)
+            ]
+        else:
+            matches = []
+
+        if len(matches) != 1:
+            if strict:
+                raise HardwareInfoError(
+                    f"No single GPU matches {entry!r}; this system has "
+                    f"{len(gpus)} GPU(s)"
+                )
+            break
+        if matches[0] not in selected:
+            selected.append(matches[0])
+    return selected
+
+
+def probe_timeout() -> float | None:
+    """Return the deadline in seconds for driver queries, or None for no deadline."""
+    value = os.environ.get("RAPIDS_CLI_PROBE_TIMEOUT")
+    if not value:
+        return DEFAULT_PROBE_TIMEOUT
+    try:
+        timeout = float(value)
+    except ValueError:
+        return DEFAULT_PROBE_TIMEOUT
+    return timeout if timeout > 0 else None
+
+
 @runtime_checkable
 class GpuInfoProvider(Protocol):
     """Read-only interface for GPU information."""
@@ -46,6 +366,19 @@ class GpuInfoProvider(Protocol):
         """Return driver version string."""
         ...
 
+    def refresh_usage(self) -> None:
+        """Re-read the fields of every device that change with its load.
+
+        Those are the memory use, utilization, processes, current clocks,
+        clock event reasons, temperature, current PCIe link, persistence mode
+        and compute mode, and the memory use and processes of MIG instances.
+        """
+        ...
+
+    def refresh_health(self) -> None:
+        """Re-read the ECC error counts, retired pages and row remapping state."""
+        ...
+
 
 @runtime_checkable
 class SystemInfoProvider(Protocol):
@@ -61,43 +394,425 @@ class SystemInfoProvider(Protocol):
         """Return path to CUDA runtime headers."""
         ...
 
+    @property
+    def memory_limit_bytes(self) -> int | None:
+        """Return the cgroup memory limit in bytes, or None when unlimited."""
+        ...
+
+    @property
+    def cpu_limit(self) -> float | None:
+        """Return the cgroup CPU limit in CPUs, or None when unlimited."""
+        ...
+
+    @property
+    def cpu_affinity(self) -> set[int] | None:
+        """Return the CPUs the process may run on, or None where unsupported."""
+        ...
+
+    @property
+    def memlock_limits(self) -> tuple[int | None, int | None]:
+        """Return the soft and hard locked memory limits in bytes, None meaning unlimited."""
+        ...
+
+    @property
+    def mps_pipe_directory(self) -> str | None:
+        """Return the pipe directory of a running CUDA MPS control daemon, or None."""
+        ...
+
 
 class NvmlGpuInfo:
     """Real GPU info provider backed by pynvml.
 
     Lazily loads all device information on first property access and caches results.
+    Loading runs under a watchdog so that a wedged GPU or driver surfaces as a
+    ``HardwareInfoError`` instead of hanging the caller. When a selection of
+    devices is given, only those are loaded.
     """
 
-    def __init__(self) -> None:
-        """Initialize with empty cached state."""
+    def __init__(
+        self,
+        timeout: float | None = None,
+        devices: Sequence[str] | None = None,
+        strict: bool = False,
+    ) -> None:
+        """Initialize with empty cached state.
+
+        Args:
+            timeout: Seconds to wait for NVML before giving up. Defaults to
+                :func:`probe_timeout`.
+            devices: Devices to load, as ``CUDA_VISIBLE_DEVICES`` entries,
+                see :func:`resolve_devices`. ``None`` loads every GPU.
+            strict: Whether a device entry matching no GPU raises
+                ``HardwareInfoError`` rather than ending the selection.
+        """
+        self._timeout = timeout if timeout is not None else probe_timeout()
+        self._selection = list(devices) if devices is not None else None
+        self._strict = strict
+        self._timeout_error: HardwareInfoError | None = None
         self._loaded = False
+        # Held while loading so that a caller that gave up waiting on a load
+        # and a later caller do not both load.
+        self._load_lock = threading.Lock()
         self._device_count = 0
         self._devices: list[DeviceInfo] = []
         self._cuda_driver_version = 0
         self._driver_version = ""
 
+    def _call(self, fn) -> None:
+        # A timed out query is still blocked in the driver, so retrying would
+        # only block again. Fail fast for every later access instead.
+        if self._timeout_error is not None:
+            raise self._timeout_error
+
+        try:
+            call_with_timeout(fn, self._timeout)
+        except WatchdogTimeoutError as e:
+            self._timeout_error = HardwareInfoError(
+                f"GPU driver (NVML) query timed out after {self._timeout:.3g}s"
+            )
+            raise self._timeout_error from e
+
     def _ensure_loaded(self) -> None:
         if self._loaded:
             return
+        with self._load_lock:
+            if not self._loaded:
+                self._call(self._load)
+                self._loaded = True
+
+    @staticmethod
+    def _query(fn, *args):
+        """Call an optional NVML query, returning None where it is unsupported."""
+        import pynvml
+
+        try:
+            return fn(*args)
+        except pynvml.NVMLError:
+            return None
+
+    @classmethod
+    def _nvlink_remote(cls, handle, link_id: int) -> NvLinkRemote:
+        import pynvml
+
+        pci_info = cls._query(pynvml.nvmlDeviceGetNvLinkRemotePciInfo, handle, link_id)
+        device_type = cls._query(
+            pynvml.nvmlDeviceGetNvLinkRemoteDeviceType, handle, link_id
+        )
+        return NvLinkRemote(
+            pci_bus_id=sysfs_pci_address(pci_info.busId) if pci_info else None,
+            device_type={
+                pynvml.NVML_NVLINK_DEVICE_TYPE_GPU: "gpu",
+                pynvml.NVML_NVLINK_DEVICE_TYPE_IBMNPU: "ibmnpu",
+                pynvml.NVML_NVLINK_DEVICE_TYPE_SWITCH: "switch",
+            }.get(device_type, "unknown"),
+        )
+
+    @classmethod
+    def _processes(cls, handle) -> list[GpuProcess]:
+        import pynvml
+
+        processes = []
+        for process in (
+            cls._query(pynvml.nvmlDeviceGetComputeRunningProcesses, handle) or []
+        ):
+            name = cls._query(pynvml.nvmlSystemGetProcessName, process.pid)
+            processes.append(
+                GpuProcess(
+                    pid=process.pid,
+                    name=name.decode() if isinstance(name, bytes) else name,
+                    used_memory_bytes=process.usedGpuMemory,
+                )
+            )
+        return processes
+
+    @classmethod
+    def _mig_instances(cls, handle) -> tuple[bool | None, list[MigInstance]]:
+        """Return whether MIG mode is enabled and the MIG devices of a GPU."""
+        import pynvml
+
+        mode = cls._query(pynvml.nvmlDeviceGetMigMode, handle)
+        if mode is None:
+            return None, []
+        if mode[0] != pynvml.NVML_DEVICE_MIG_ENABLE:
+            return False, []
+
+        instances = []
+        for i in range(cls._query(pynvml.nvmlDeviceGetMaxMigDeviceCount, handle) or 0):
+            # Slots without a compute instance behind them report NotFound.
+            mig = cls._query(pynvml.nvmlDeviceGetMigDeviceHandleByIndex, handle, i)
+            if mig is None:
+                continue
+            attributes = cls._query(pynvml.nvmlDeviceGetAttributes, mig)
+            memory_info = cls._query(pynvml.nvmlDeviceGetMemoryInfo, mig)
+            if memory_info is not None:
+                memory = memory_info.total
+            elif attributes is not None:
+                memory = attributes.memorySizeMB * 1024**2
+            else:
+                memory = 0
+            instances.append(
+                MigInstance(
+                    index=i,
+                    memory_total_bytes=memory,
+                    uuid=cls._query(pynvml.nvmlDeviceGetUUID, mig),
+                    name=cls._query(pynvml.nvmlDeviceGetName, mig),
+                    gpu_instance_id=cls._query(pynvml.nvmlDeviceGetGpuInstanceId, mig),
+                    compute_instance_id=cls._query(
+                        pynvml.nvmlDeviceGetComputeInstanceId, mig
+                    ),
+                    multiprocessor_count=(
+                        attributes.multiprocessorCount if attributes else None
+                    ),
+                    gpu_instance_slice_count=(
+                        attributes.gpuInstanceSliceCount if attributes else None
+                    ),
+                    compute_instance_slice_count=(
+                        attributes.computeInstanceSliceCount if attributes else None
+                    ),
+                    **cls._mig_usage(mig, memory_info),
+                )
+            )
+        return True, instances
+
+    @classmethod
+    def _mig_usage(cls, mig_handle, memory_info=None) -> dict[str, Any]:
+        """Return the MigInstance fields that change with the load on a MIG device."""
+        import pynvml
+
+        if memory_info is None:
+            memory_info = cls._query(pynvml.nvmlDeviceGetMemoryInfo, mig_handle)
+        return {
+            "memory_used_bytes": memory_info.used if memory_info else None,
+            "memory_free_bytes": memory_info.free if memory_info else None,
+            "processes": cls._processes(mig_handle),
+        }
+
+    @classmethod
+    def _memory_health(cls, handle) -> dict[str, Any]:
+        """Return the DeviceInfo fields describing ECC errors and memory repairs."""
+        import pynvml
+
+        query = cls._query
+        corrected = pynvml.NVML_MEMORY_ERROR_TYPE_CORRECTED
+        uncorrected = pynvml.NVML_MEMORY_ERROR_TYPE_UNCORRECTED
+        volatile, aggregate = pynvml.NVML_VOLATILE_ECC, pynvml.NVML_AGGREGATE_ECC
+
+        ecc_mode = query(pynvml.nvmlDeviceGetEccMode, handle)
+        sbe_pages = query(
+            pynvml.nvmlDeviceGetRetiredPages,
+            handle,
+            pynvml.NVML_PAGE_RETIREMENT_CAUSE_MULTIPLE_SINGLE_BIT_ECC_ERRORS,
+        )
+        dbe_pages = query(
+            pynvml.nvmlDeviceGetRetiredPages,
+            handle,
+            pynvml.NVML_PAGE_RETIREMENT_CAUSE_DOUBLE_BIT_ECC_ERROR,
+        )
+        pages_pending = query(pynvml.nvmlDeviceGetRetiredPagesPendingStatus, handle)
+        remapped = query(pynvml.nvmlDeviceGetRemappedRows, handle)
+        # Fields that cannot be read are None, so that a refresh clears them.
+        health: dict[str, Any] = {
+            **dict.fromkeys(
+                (
+                    "remapped_rows_correctable",
+                    "remapped_rows_uncorrectable",
+                    "row_remap_pending",
+                    "row_remap_failed",
+                    "ecc_corrected_volatile",
+                    "ecc_uncorrected_volatile",
+                    "ecc_corrected_aggregate",
+                    "ecc_uncorrected_aggregate",
+                )
+            ),
+            "ecc_enabled": bool(ecc_mode[0]) if ecc_mode is not None else None,
+            "retired_pages_sbe": len(sbe_pages) if sbe_pages is not None else None,
+            "retired_pages_dbe": len(dbe_pages) if dbe_pages is not None else None,
+            "retired_pages_pending": (
+                pages_pending == pynvml.NVML_FEATURE_ENABLED
+                if pages_pending is not None
+                else None
+            ),
+        }
+        if remapped is not None:
+            health["remapped_rows_correctable"] = remapped[0]
+            health["remapped_rows_uncorrectable"] = remapped[1]
+            health["row_remap_pending"] = bool(remapped[2])
+            health["row_remap_failed"] = bool(remapped[3])
+        if health["ecc_enabled"]:
+            for name, error_type, counter_type in (
+                ("ecc_corrected_volatile", corrected, volatile),
+                ("ecc_uncorrected_volatile", uncorrected, volatile),
+                ("ecc_corrected_aggregate", corrected, aggregate),
+                ("ecc_uncorrected_aggregate", uncorrected, aggregate),
+            ):
+                health[name] = query(
+                    pynvml.nvmlDeviceGetTotalEccErrors, handle, error_type, counter_type
+                )
+        return health
+
+    @classmethod
+    def _usage(cls, handle, memory_info=None) -> dict[str, Any]:
+        """Return the DeviceInfo fields that change while a device is in use."""
+        import pynvml
+
+        query = cls._query
+        if memory_info is None:
+            memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
+        utilization = query(pynvml.nvmlDeviceGetUtilizationRates, handle)
+        persistence = query(pynvml.nvmlDeviceGetPersistenceMode, handle)
+        compute_mode = query(pynvml.nvmlDeviceGetComputeMode, handle)
+        return {
+            "memory_used_bytes": memory_info.used,
+            "memory_free_bytes": memory_info.free,
+            "gpu_utilization_percent": utilization.gpu if utilization else None,
+            "memory_utilization_percent": utilization.memory if utilization else None,
+            "processes": cls._processes(handle),
+            "clock_event_reasons": query(
+                pynvml.nvmlDeviceGetCurrentClocksThrottleReasons, handle
+            ),
+            "sm_clock_mhz": query(
+                pynvml.nvmlDeviceGetClockInfo, handle, pynvml.NVML_CLOCK_SM
+            ),
+            "memory_clock_mhz": query(
+                pynvml.nvmlDeviceGetClockInfo, handle, pynvml.NVML_CLOCK_MEM
+            ),
+            "temperature_c": query(
+                pynvml.nvmlDeviceGetTemperature, handle, pynvml.NVML_TEMPERATURE_GPU
+            ),
+            # GPUs lower their PCIe link to save power while idle.
+            "pcie_link_generation": query(
+                pynvml.nvmlDeviceGetCurrPcieLinkGeneration, handle
+            ),
+            "pcie_link_width": query(pynvml.nvmlDeviceGetCurrPcieLinkWidth, handle),
+            # Administrators change these on live nodes, e.g. between jobs.
+            "persistence_mode": (
+                persistence == pynvml.NVML_FEATURE_ENABLED
+                if persistence is not None
+                else None
+            ),
+            "compute_mode": (
+                _COMPUTE_MODES.get(compute_mode, "unknown")
+                if compute_mode is not None
+                else None
+            ),
+        }
+
+    def _load_usage(self) -> None:
+        import pynvml
+
+        for dev in self._devices:
+            handle = pynvml.nvmlDeviceGetHandleByIndex(dev.index)
+            for name, value in self._usage(handle).items():
+                setattr(dev, name, value)
+            for mig in dev.mig_instances:
+                mig_handle = self._query(
+                    pynvml.nvmlDeviceGetMigDeviceHandleByIndex, handle, mig.index
+                )
+                if mig_handle is None:
+                    continue
+                for name, value in self._mig_usage(mig_handle).items():
+                    setattr(mig, name, value)
+
+    def refresh_usage(self) -> None:
+        """Re-read the fields of every device that change with its load.
+
+        Those are the memory use, utilization, processes, current clocks,
+        clock event reasons, temperature, current PCIe link, persistence mode
+        and compute mode, and the memory use and processes of MIG instances.
+        Only the queries behind those fields are repeated, which is much
+        cheaper than loading everything again. Before the first load this just
+        loads.
+        """
+        if not self._loaded:
+            self._ensure_loaded()
+            return
+        self._call(self._load_usage)
+
+    def _load_health(self) -> None:
+        import pynvml
+
+        for dev in self._devices:
+            handle = pynvml.nvmlDeviceGetHandleByIndex(dev.index)
+            for name, value in self._memory_health(handle).items():
+                setattr(dev, name, value)
+
+    def refresh_health(self) -> None:
+        """Re-read the ECC error counts, retired pages and row remapping state.
+
+        Those change as memory errors happen, unlike the rest of the device
+        information. Before the first load this just loads.
+        """
+        if not self._loaded:
+            self._ensure_loaded()
+            return
+        self._call(self._load_health)
+
+    def _select(self, count: int) -> list[int]:
+        """Return the NVML indices of the selected devices."""
+        import pynvml
+
+        if self._selection is None:
+            return list(range(count))
+
+        gpus = []
+        models = []
+        for i in range(count):
+            handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+            models.append(self._query(pynvml.nvmlDeviceGetName, handle))
+            pci_info = self._query(pynvml.nvmlDeviceGetPciInfo, handle)
+            gpus.append(
+                (
+                    i,
+                    sysfs_pci_address(pci_info.busId) if pci_info else None,
+                    self._query(pynvml.nvmlDeviceGetUUID, handle),
+                )
+            )
+        mig_parents = {}
+        for entry in self._selection:
+            if not entry.startswith("MIG-") or entry.startswith("MIG-GPU-"):
+                continue
+            mig = self._query(pynvml.nvmlDeviceGetHandleByUUID, entry)
+            if mig is None:
+                continue
+            parent = self._query(
+                pynvml.nvmlDeviceGetDeviceHandleFromMigDeviceHandle, mig
+            )
+            if parent is not None:
+                index = self._query(pynvml.nvmlDeviceGetIndex, parent)
+                if index is not None:
+                    mig_parents[entry] = index
+        return resolve_devices(
+            self._selection,
+            gpus,
+            mig_parents,
+            strict=self._strict,
+            pci_bus_order=ordinals_in_pci_bus_order(models),
+        )
 
+    def _load(self) -> None:
         import pynvml
 
+        sm, mem = pynvml.NVML_CLOCK_SM, pynvml.NVML_CLOCK_MEM
+        query = self._query
+
         try:
             pynvml.nvmlInit()
         except pynvml.NVMLError as e:
             raise HardwareInfoError("Unable to initialize GPU driver (NVML)") from e
 
-        self._device_count = pynvml.nvmlDeviceGetCount()
+        indices = self._select(pynvml.nvmlDeviceGetCount())
+        self._device_count = len(indices)
         self._cuda_driver_version = pynvml.nvmlSystemGetCudaDriverVersion()
         self._driver_version = pynvml.nvmlSystemGetDriverVersion()
 
         self._devices = []
-        for i in range(self._device_count):
+        for i in indices:
             handle = pynvml.nvmlDeviceGetHandleByIndex(i)
             major, minor = pynvml.nvmlDeviceGetCudaComputeCapability(handle)
             memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
 
             nvlink_states: list[bool] = []
+            nvlink_remotes: dict[int, NvLinkRemote] = {}
             for link_id in range(pynvml.NVML_NVLINK_MAX_LINKS):
                 try:
                     state = pynvml.nvmlDeviceGetNvLinkState(handle, link_id)
@@ -107,17 +822,63 @@ class NvmlGpuInfo:
                     pynvml.NVMLError_NotSupported,
                 ):
                     break
+                if state:
+                    nvlink_remotes[link_id] = self._nvlink_remote(handle, link_id)
 
+            pci_info = query(pynvml.nvmlDeviceGetPciInfo, handle)
+            mig_enabled, mig_instances = self._mig_instances(handle)
             self._devices.append(
                 DeviceInfo(
                     index=i,
                     compute_capability=(major, minor),
                     memory_total_bytes=memory_info.total,
                     nvlink_states=nvlink_states,
+                    nvlink_remotes=nvlink_remotes,
+                    pcie_max_link_generation=self._query(
+                        pynvml.nvmlDeviceGetMaxPcieLinkGeneration, handle
+                    ),
+                    pcie_max_link_width=self._query(
+                        pynvml.nvmlDeviceGetMaxPcieLinkWidth, handle
+                    ),
+                    sm_max_clock_mhz=query(
+                        pynvml.nvmlDeviceGetMaxClockInfo, handle, sm
+                    ),
+                    memory_max_clock_mhz=query(
+                        pynvml.nvmlDeviceGetMaxClockInfo, handle, mem
+                    ),
+                    sm_application_clock_mhz=query(
+                        pynvml.nvmlDeviceGetApplicationsClock, handle, sm
+                    ),
+                    sm_default_application_clock_mhz=query(
+                        pynvml.nvmlDeviceGetDefaultApplicationsClock, handle, sm
+                    ),
+                    memory_application_clock_mhz=query(
+                        pynvml.nvmlDeviceGetApplicationsClock, handle, mem
+                    ),
+                    memory_default_application_clock_mhz=query(
+                        pynvml.nvmlDeviceGetDefaultApplicationsClock, handle, mem
+                    ),
+                    power_limit_mw=query(
+                        pynvml.nvmlDeviceGetPowerManagementLimit, handle
+                    ),
+                    default_power_limit_mw=query(
+                        pynvml.nvmlDeviceGetPowerManagementDefaultLimit, handle
+                    ),
+                    pci_bus_id=(
+                        sysfs_pci_address(pci_info.busId) if pci_info else None
+                    ),
+                    name=query(pynvml.nvmlDeviceGetName, handle),
+                    uuid=query(pynvml.nvmlDeviceGetUUID, handle),
+                    **self._usage(handle, memory_info),
+                    mig_enabled=mig_enabled,
+                    mig_instances=mig_instances,
+                    **self._memory_health(handle),
                 )
             )
-
-        self._loaded = True
+        if self._selection is not None:
+            entries = ",".join(self._selection)
+            for dev in self._devices:
+                dev.mig_instances = visible_mig_instances(dev, entries)
 
     @property
     def device_count(self) -> int:
@@ -144,18 +905,116 @@ class NvmlGpuInfo:
         return self._driver_version
 
 
+class SelectedGpuInfo:
+    """A GpuInfoProvider restricted to some of the devices of another one.
+
+    Unlike ``NvmlGpuInfo(devices=...)`` the underlying provider still loads
+    every device, which suits a long-lived provider answering for different
+    selections. Device indices keep their meaning in the underlying provider,
+    so results for a selection are reported against the same GPU numbers as a
+    full run. A device selected through MIG devices is returned as a copy
+    holding just those MIG instances.
+    """
+
+    def __init__(
+        self, provider: GpuInfoProvider, devices: Sequence[str], strict: bool = False
+    ) -> None:
+        """Select devices of ``provider``.
+
+        Args:
+            provider: A provider of every GPU on the node.
+            devices: ``CUDA_VISIBLE_DEVICES`` entries, see
+                :func:`resolve_devices`.
+            strict: Whether an entry matching no GPU raises
+                ``HardwareInfoError`` rather than ending the selection.
+        """
+        self._provider = provider
+        self._selection = list(devices)
+        self._strict = strict
+
+    @property
+    def device_count(self) -> int:
+        """Return number of selected GPU devices."""
+        return len(self.devices)
+
+    @property
+    def devices(self) -> list[DeviceInfo]:
+        """Return the selected devices, in selection order.
+
+        Call again after refreshing, as devices may be copies.
+
+        Raises:
+            HardwareInfoError: If ``strict`` and an entry matches no GPU.
+        """
+        devices = self._provider.devices
+        by_index = {dev.index: dev for dev in devices}
+        indices = resolve_devices(
+            self._selection,
+            [(dev.index, dev.pci_bus_id, dev.uuid) for dev in devices],
+            {
+                mig.uuid: dev.index
+                for dev in devices
+                for mig in dev.mig_instances
+                if mig.uuid
+            },
+            strict=self._strict,
+            pci_bus_order=ordinals_in_pci_bus_order(dev.name for dev in devices),
+        )
+        entries = ",".join(self._selection)
+        selected = []
+        for i in indices:
+            dev = by_index[i]
+            instances = visible_mig_instances(dev, entries)
+            if len(instances) != len(dev.mig_instances):
+                dev = replace(dev, mig_instances=instances)
+            selected.append(dev)
+        return selected
+
+    @property
+    def cuda_driver_version(self) -> int:
+        """Return CUDA driver version as integer."""
+        return self._provider.cuda_driver_version
+
+    @property
+    def driver_version(self) -> str:
+        """Return driver version string."""
+        return self._provider.driver_version
+
+    def refresh_usage(self) -> None:
+        """Re-read the usage of the underlying provider's devices."""
+        self._provider.refresh_usage()
+
+    def refresh_health(self) -> None:
+        """Re-read the memory health of the underlying provider's devices."""
+        self._provider.refresh_health()
+
+
 class DefaultSystemInfo:
-    """Real system info provider backed by psutil and cuda.pathfinder.
+    """Real system info provider backed by psutil, cuda.pathfinder and cgroups.
 
-    Lazily loads each piece of information on first access.
+    Lazily loads each piece of information on first access, except the CPU
+    affinity, the memlock limit and whether CUDA MPS is running, which are
+    checked on every access.
     """
 
-    def __init__(self) -> None:
-        """Initialize with empty cached state."""
+    def __init__(self, cgroup_root: Path | None = None, pid: int | None = None) -> None:
+        """Initialize with empty cached state.
+
+        Args:
+            cgroup_root: Where the cgroup filesystem is mounted. Defaults to
+                :data:`rapids_cli.cgroup.CGROUP_ROOT`.
+            pid: The process whose cgroup limits, CPU affinity and memlock
+                limit are reported. Defaults to this one.
+        """
+        self._cgroup_root = cgroup_root
+        self._pid = pid
         self._memory_loaded = False
         self._total_memory_bytes = 0
         self._cuda_path_loaded = False
         self._cuda_runtime_path: str | None = None
+        self._limits_loaded = False
+        self._memory_limit_bytes: int | None = None
+        self._cpu_limit: float | None = None
 
     @property
     def total_memory_bytes(self) -> int:
@@ -178,3 +1037,212 @@ class DefaultSystemInfo:
             )
             self._cuda_path_loaded = True
         return self._cuda_runtime_path
+
+    def _load_limits(self) -> None:
+        if not self._limits_loaded:
+            from rapids_cli import cgroup
+
+            self._memory_limit_bytes = cgroup.memory_limit_bytes(
+                self._cgroup_root, self._pid
+            )
+            self._cpu_limit = cgroup.cpu_limit(self._cgroup_root, self._pid)
+            self._limits_loaded = True
+
+    @property
+    def memory_limit_bytes(self) -> int | None:
+        """Return the cgroup memory limit in bytes, or None when unlimited."""
+        self._load_limits()
+        return self._memory_limit_bytes
+
+    @property
+    def cpu_limit(self) -> float | None:
+        """Return the cgroup CPU limit in CPUs, or None when unlimited."""
+        self._load_limits()
+        return self._cpu_limit
+
+    @property
+    def cpu_affinity(self) -> set[int] | None:
+        """Return the CPUs the process may run on, or None where unsupported."""
+        from rapids_cli.topology import process_affinity
+
+        return process_affinity(self._pid)
+
+    @property
+    def memlock_limits(self) -> tuple[int | None, int | None]:
+        """Return the soft and hard locked memory limits in bytes, None meaning unlimited."""
+        from rapids_cli.host_memory import memlock_limits
+
+        return memlock_limits(self._pid)
+
+    @property
+    def mps_pipe_directory(self) -> str | None:
+        """Return the pipe directory of a running CUDA MPS control daemon, or None.
+
+        The daemon is taken to be running when its ``control`` pipe exists in
+        ``CUDA_MPS_PIPE_DIRECTORY``, or in :data:`MPS_PIPE_DIRECTORY`.
+        """
+        # Not cached: the MPS daemon starts and stops while a long-lived
+        # provider, e.g. the doctor daemon's, is in use.
+        directory = Path(
+            os.environ.get("CUDA_MPS_PIPE_DIRECTORY") or MPS_PIPE_DIRECTORY
+        )
+        if (directory / "control").exists():
+            return str(directory)
+        return None
+
+
+class ProcessSystemInfo:
+    """A SystemInfoProvider describing another process on this host.
+
+    Host-wide information comes from a long-lived provider, while the cgroup
+    limits, CPU affinity and memlock limit are those of the process, which
+    may be confined more tightly than the provider's own, e.g. a doctor
+    daemon's client running inside a job.
+    """
+
+    def __init__(self, provider: SystemInfoProvider, pid: int) -> None:
+        """Describe process ``pid``, taking host-wide information from ``provider``."""
+        self._provider = provider
+        self._process = DefaultSystemInfo(pid=pid)
+
+    @property
+    def total_memory_bytes(self) -> int:
+        """Return total system memory in bytes."""
+        return self._provider.total_memory_bytes
+
+    @property
+    def cuda_runtime_path(self) -> str | None:
+        """Return path to CUDA runtime headers."""
+        return self._provider.cuda_runtime_path
+
+    @property
+    def memory_limit_bytes(self) -> int | None:
+        """Return the process's cgroup memory limit in bytes, or None when unlimited."""
+        return self._process.memory_limit_bytes
+
+    @property
+    def cpu_limit(self) -> float | None:
+        """Return the process's cgroup CPU limit in CPUs, or None when unlimited."""
+        return self._process.cpu_limit
+
+    @property
+    def cpu_affinity(self) -> set[int] | None:
+        """Return the CPUs the process may run on, or None where unsupported."""
+        return self._process.cpu_affinity
+
+    @property
+    def memlock_limits(self) -> tuple[int | None, int | None]:
+        """Return the process's locked memory limits in bytes, None meaning unlimited."""
+        return self._process.memlock_limits
+
+    @property
+    def mps_pipe_directory(self) -> str | None:
+        """Return the pipe directory of a running CUDA MPS control daemon, or None."""
+        return self._provider.mps_pipe_directory
+
+
+class _Snapshot:
+    """Base for picklable point-in-time copies of a provider.
+
+    Every field listed in ``_fields`` is read from the source provider once.
+    A field whose lookup raised ``HardwareInfoError`` re-raises an error with
+    the same message when read from the snapshot.
+    """
+
+    _fields: tuple[str, ...] = ()
+
+    def __init__(self, provider: object) -> None:
+        """Read every field of ``provider`` into the snapshot."""
+        self._values: dict[str, tuple[object, str | None]] = {}
+        for name in self._fields:
+            try:
+                self._values[name] = (getattr(provider, name), None)
+            except HardwareInfoError as e:
+                self._values[name] = (None, str(e))
+
+    def _get(self, name: str):
+        value, error = self._values[name]
+        if error is not None:
+            raise HardwareInfoError(error)
+        return value
+
+
+class GpuInfoSnapshot(_Snapshot):
+    """Picklable copy of a GpuInfoProvider, readable without touching NVML."""
+
+    _fields = ("device_count", "devices", "cuda_driver_version", "driver_version")
+
+    @property
+    def device_count(self) -> int:
+        """Return number of GPU devices."""
+        return self._get("device_count")
+
+    @property
+    def devices(self) -> list[DeviceInfo]:
+        """Return list of device information."""
+        return self._get("devices")
+
+    @property
+    def cuda_driver_version(self) -> int:
+        """Return CUDA driver version as integer."""
+        return self._get("cuda_driver_version")
+
+    @property
+    def driver_version(self) -> str:
+        """Return driver version string."""
+        return self._get("driver_version")
+
+    def refresh_usage(self) -> None:
+        """Do nothing; a snapshot keeps the usage it was taken with."""
+
+    def refresh_health(self) -> None:
+        """Do nothing; a snapshot keeps the memory health it was taken with."""
+
+
+class SystemInfoSnapshot(_Snapshot):
+    """Picklable copy of a SystemInfoProvider."""
+
+    _fields = (
+        "total_memory_bytes",
+        "cuda_runtime_path",
+        "memory_limit_bytes",
+        "cpu_limit",
+        "cpu_affinity",
+        "memlock_limits",
+        "mps_pipe_directory",
+    )
+
+    @property
+    def total_memory_bytes(self) -> int:
+        """Return total system memory in bytes."""
+        return self._get("total_memory_bytes")
+
+    @property
+    def cuda_runtime_path(self) -> str | None:
+        """Return path to CUDA runtime headers."""
+        return self._get("cuda_runtime_path")
+
+    @property
+    def memory_limit_bytes(self) -> int | None:
+        """Return the cgroup memory limit in bytes, or None when unlimited."""
+        return self._get("memory_limit_bytes")
+
+    @property
+    def cpu_limit(self) -> float | None:
+        """Return the cgroup CPU limit in CPUs, or None when unlimited."""
+        return self._get("cpu_limit")
+
+    @property
+    def cpu_affinity(self) -> set[int] | None:
+        """Return the CPUs the process may run on, or None where unsupported."""
+        return self._get("cpu_affinity")
+
+    @property
+    def memlock_limits(self) -> tuple[int | None, int | None]:
+        """Return the soft and hard locked memory limits in bytes, None meaning unlimited."""
+        return self._get("memlock_limits")
+
+    @property
+    def mps_pipe_directory(self) -> str | None:
+        """Return the pipe directory of a running CUDA MPS control daemon, or None."""
+        return self._get("mps_pipe_directory")
@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""Host memory settings that UCX and pinned host buffers depend on.
+
+Every function takes an optional path standing in for the real file or mount
+so it can be pointed at a fixture; a missing path means the setting is
+unknown rather than an error.
+"""
+
+from __future__ import annotations
+
+import re
+import resource
+import shutil
+from pathlib import Path
+
+SHM_PATH = Path("/dev/shm")
+THP_ENABLED_PATH = Path("/sys/kernel/mm/transparent_hugepage/enabled")
+MEMINFO_PATH = Path("/proc/meminfo")
+
+_MEMINFO_LINE = re.compile(r"^(\w+):\s+(\d+)(\s*kB)?$", re.MULTILINE)
+
+
+def shm_usage(path: Path | None = None) -> tuple[int, int] | None:
+    """Return the size and free space of ``/dev/shm`` in bytes."""
+    try:
+        usage = shutil.disk_usage(path or SHM_PATH)
+    except OSError:
+        return None
+    return usage.total, usage.free
+
+
+def memlock_limits(pid: int | None = None) -> tuple[int | None, int | None]:
+    """Return the soft and hard ``RLIMIT_MEMLOCK`` in bytes, ``None`` meaning unlimited.
+
+    Args:
+        pid: The process to look at. Defaults to this one.
+    """
+    if pid is None:
+        soft, hard = resource.getrlimit(resource.RLIMIT_MEMLOCK)
+    else:
+        soft, hard = resource.prlimit(pid, resource.RLIMIT_MEMLOCK)
+    return (
+        None if soft == resource.RLIM_INFINITY else soft,
+        None if hard == resource.RLIM_INFINITY else hard,
+    )
+
+
+def transparent_hugepage_mode(path: Path | None = None) -> str | None:
+    """Return the transparent hugepage mode: ``always``, ``madvise`` or ``never``.
+
+    The kernel lists every mode and brackets the active one, e.g.
+    ``always [madvise] never``.
+    """
+    try:
+        text = (path or THP_ENABLED_PATH).read_text()
+    except OSError:
+        return None
+    match = re.search(r"\[(\w+)\]", text)
+    return match.group(1) if match else None
+
+
+def hugepages(path: Path | None = None) -> dict[str, int]:
+    """Return the default hugepage pool from ``/proc/meminfo``.
+
+    The result has ``total`` and ``free`` page counts and the ``page_size``
+    in bytes, or is empty when meminfo cannot be read.
+    """
+    try:
+        text = (path or MEMINFO_PATH).read_text()
+    except OSError:
+        return {}
+    values = {
+        key: int(value) * (1024 if kb else 1)
+        for key, value, kb in _MEMINFO_LINE.findall(text)
+    }
+    if "HugePages_Total" not in values:
+        return {}
+    return {
+        "total": values["HugePages_Total"],
+        "free": values.get("HugePages_Free", 0),
+        "page_size": values.get("Hugepagesize", 0),
+    }
@@ -12,11 +12,15 @@ accessors. Tests swap in fakes with ``monkeypatch.setattr`` on the
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from rapids_cli.doctor.checks.cuda_toolkit import CudaToolkitInfo
-    from rapids_cli.hardware import GpuInfoProvider, SystemInfoProvider
+    from rapids_cli.hardware import (
+        GpuInfoProvider,
+        HardwareInfoError,
+        SystemInfoProvider,
+    )
 
 
 @dataclass
@@ -26,6 +30,7 @@ class _Providers:
     gpu_info: GpuInfoProvider | None = field(default=None)
     system_info: SystemInfoProvider | None = field(default=None)
     toolkit_info: CudaToolkitInfo | None = field(default=None)
+    toolkit_error: HardwareInfoError | None = field(default=None)
 
 
 _providers = _Providers()
@@ -46,6 +51,34 @@ def set_providers(
         _providers.toolkit_info = toolkit_info
 
 
+def reset_providers() -> None:
+    """Drop all installed providers so the next access gathers fresh data."""
+    _providers.gpu_info = None
+    _providers.system_info = None
+    _providers.toolkit_info = None
+    _providers.toolkit_error = None
+
+
+def snapshot_providers() -> dict[str, Any]:
+    """Return picklable copies of the providers for use in another process.
+
+    GPU and system information is fully materialized so that the receiving
+    process never has to initialize NVML. Toolkit information is only passed
+    along if it has already been gathered; otherwise the receiver gathers it
+    lazily as usual.
+
+    Returns:
+        Keyword arguments for :func:`set_providers`.
+    """
+    from rapids_cli.hardware import GpuInfoSnapshot, SystemInfoSnapshot
+
+    return {
+        "gpu_info": GpuInfoSnapshot(get_gpu_info()),
+        "system_info": SystemInfoSnapshot(get_system_info()),
+        "toolkit_info": _providers.toolkit_info,
+    }
+
+
 def get_gpu_info() -> GpuInfoProvider:
     """Return the installed GPU info provider, lazily creating a real one."""
     if _providers.gpu_info is None:  # pragma: no cover
@@ -65,9 +98,23 @@ def get_system_info() -> SystemInfoProvider:
 
 
 def get_toolkit_info() -> CudaToolkitInfo:
-    """Return the installed toolkit info, lazily gathering it from the system."""
-    if _providers.toolkit_info is None:  # pragma: no cover
+    """Return the installed toolkit info, lazily gathering it from the system.
+
+    Raises:
+        HardwareInfoError: If gathering timed out, now or on an earlier call.
+    """
+    if _providers.toolkit_info is None:
+        # A timed out driver query is still blocked, so gathering again would
+        # only block again. Fail fast until the providers are reset instead.
+        if _providers.toolkit_error is not None:
+            raise _providers.toolkit_error
+
         from rapids_cli.doctor.checks.cuda_toolkit import _gather_toolkit_info
+        from rapids_cli.hardware import HardwareInfoError
 
-        _providers.toolkit_info = _gather_toolkit_info()
+        try:
+            _providers.toolkit_info = _gather_toolkit_info()
+        except HardwareInfoError as e:
+            _providers.toolkit_error = e
+            raise
     return _providers.toolkit_info
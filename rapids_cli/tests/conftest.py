@@ -6,7 +6,10 @@ from __future__ import annotations
 
 import pytest
 
-from rapids_cli import providers
+from rapids_cli import providers, topology
+from rapids_cli.doctor.findings import FindingsCollector
+from rapids_cli.hardware import DeviceInfo
+from rapids_cli.tests.fakes import FakeGpuInfo, FakeSysfs
 
 
 @pytest.fixture(autouse=True)
@@ -20,6 +23,13 @@ def _reset_providers(monkeypatch):
     monkeypatch.setattr(providers._providers, "gpu_info", None)
     monkeypatch.setattr(providers._providers, "system_info", None)
     monkeypatch.setattr(providers._providers, "toolkit_info", None)
+    monkeypatch.setattr(providers._providers, "toolkit_error", None)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_cache(monkeypatch, tmp_path):
+    """Keep check timings recorded by doctor runs out of the user's cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
 
 
 @pytest.fixture
@@ -50,3 +60,59 @@ def set_toolkit_info(monkeypatch):
         monkeypatch.setattr(providers._providers, "toolkit_info", fake)
 
     return _set
+
+
+@pytest.fixture
+def make_device():
+    """Return a factory for the ``DeviceInfo`` of a fake GPU.
+
+    Fields that are not given describe a compute capability 8.0 GPU without
+    memory. Test modules that need other defaults override this fixture,
+    e.g. with ``functools.partial(make_device, **defaults)``.
+    """
+
+    def _make(index=0, **fields):
+        fields.setdefault("compute_capability", (8, 0))
+        fields.setdefault("memory_total_bytes", 0)
+        return DeviceInfo(index=index, **fields)
+
+    return _make
+
+
+@pytest.fixture
+def set_devices(set_gpu_info):
+    """Install a fake GPU info provider reporting the given devices and return it."""
+
+    def _set(*devices):
+        fake = FakeGpuInfo(device_count=len(devices), devices=list(devices))
+        set_gpu_info(fake)
+        return fake
+
+    return _set
+
+
+@pytest.fixture
+def run_with_findings():
+    """Return a helper that runs a check with a fresh ``FindingsCollector``.
+
+    The helper returns the check's return value and the findings it
+    reported, as a list or, with ``by_code=True``, keyed by their code.
+    """
+
+    def _run(check_fn, verbose=False, by_code=False):
+        findings = FindingsCollector()
+        result = check_fn(verbose=verbose, findings=findings)
+        if by_code:
+            return result, {f.code: f for f in findings.findings}
+        return result, findings.findings
+
+    return _run
+
+
+@pytest.fixture
+def sysfs(monkeypatch, tmp_path):
+    """Point sysfs lookups at an empty fixture tree and return its builder."""
+    root = tmp_path / "sys"
+    root.mkdir()
+    monkeypatch.setattr(topology, "SYSFS_ROOT", root)
+    return FakeSysfs(root)
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from pathlib import Path
 
 from rapids_cli.hardware import DeviceInfo, HardwareInfoError
 
@@ -17,6 +18,16 @@ class FakeGpuInfo:
     devices: list[DeviceInfo] = field(default_factory=list)
     cuda_driver_version: int = 0
     driver_version: str = ""
+    usage_refreshes: int = 0
+    health_refreshes: int = 0
+
+    def refresh_usage(self) -> None:
+        """Count the refresh; fake usage only changes when a test sets it."""
+        self.usage_refreshes += 1
+
+    def refresh_health(self) -> None:
+        """Count the refresh; fake health only changes when a test sets it."""
+        self.health_refreshes += 1
 
 
 @dataclass
@@ -25,6 +36,11 @@ class FakeSystemInfo:
 
     total_memory_bytes: int = 0
     cuda_runtime_path: str | None = None
+    memory_limit_bytes: int | None = None
+    cpu_limit: float | None = None
+    cpu_affinity: set[int] | None = None
+    memlock_limits: tuple[int | None, int | None] = (None, None)
+    mps_pipe_directory: str | None = None
 
 
 class FailingGpuInfo:
@@ -50,6 +66,14 @@ class FailingGpuInfo:
         """Raise HardwareInfoError."""
         raise HardwareInfoError("No GPU available")
 
+    def refresh_usage(self) -> None:
+        """Raise HardwareInfoError."""
+        raise HardwareInfoError("No GPU available")
+
+    def refresh_health(self) -> None:
+        """Raise HardwareInfoError."""
+        raise HardwareInfoError("No GPU available")
+
 
 class FailingSystemInfo:
     """Test fake that raises HardwareInfoError on any property access."""
@@ -63,3 +87,56 @@ class FailingSystemInfo:
     def cuda_runtime_path(self) -> str | None:
         """Raise HardwareInfoError."""
         raise HardwareInfoError("System info unavailable")
+
+    @property
+    def memory_limit_bytes(self) -> int | None:
+        """Raise HardwareInfoError."""
+        raise HardwareInfoError("System info unavailable")
+
+    @property
+    def cpu_limit(self) -> float | None:
+        """Raise HardwareInfoError."""
+        raise HardwareInfoError("System info unavailable")
+
+    @property
+    def cpu_affinity(self) -> set[int] | None:
+        """Raise HardwareInfoError."""
+        raise HardwareInfoError("System info unavailable")
+
+    @property
+    def memlock_limits(self) -> tuple[int | None, int | None]:
+        """Raise HardwareInfoError."""
+        raise HardwareInfoError("System info unavailable")
+
+    @property
+    def mps_pipe_directory(self) -> str | None:
+        """Raise HardwareInfoError."""
+        raise HardwareInfoError("System info unavailable")
+
+
+class FakeSysfs:
+    """Builds a fixture tree standing in for ``/sys`` under ``root``."""
+
+    def __init__(self, root: Path) -> None:
+        """Start with an empty tree at ``root``."""
+        self.root = root
+
+    def _write(self, relative: str, text: str) -> None:
+        path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+    def add_pci_device(self, address: str, numa_node: int, local_cpulist: str) -> None:
+        """Add a PCI device attached to ``numa_node``."""
+        self._write(f"bus/pci/devices/{address}/numa_node", f"{numa_node}\n")
+        self._write(f"bus/pci/devices/{address}/local_cpulist", f"{local_cpulist}\n")
+
+    def add_numa_node(self, node: int, cpulist: str, memory_total_kb: int) -> None:
+        """Add a NUMA node with its CPUs and memory."""
+        base = f"devices/system/node/node{node}"
+        self._write(f"{base}/cpulist", f"{cpulist}\n")
+        self._write(
+            f"{base}/meminfo",
+            f"Node {node} MemTotal:       {memory_total_kb} kB\n"
+            f"Node {node} MemFree:        {memory_total_kb // 2} kB\n",
+        )
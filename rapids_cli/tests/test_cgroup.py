@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+from pathlib import Path
+
+import pytest
+
+from rapids_cli import cgroup
+from rapids_cli.cgroup import cpu_limit, is_v2, memory_limit_bytes
+
+
+@pytest.fixture
+def proc_cgroup(monkeypatch, tmp_path):
+    """Point /proc/self/cgroup at a fixture file and return a writer for it."""
+    path = tmp_path / "proc-self-cgroup"
+    monkeypatch.setattr(cgroup, "PROC_SELF_CGROUP", path)
+    return path.write_text
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"{text}\n")
+
+
+def test_v2_namespaced(tmp_path, proc_cgroup):
+    """Inside a cgroup namespace the process's cgroup is the mount root."""
+    proc_cgroup("0::/\n")
+    _write(tmp_path / "cgroup.controllers", "cpu memory")
+    _write(tmp_path / "memory.max", str(8 * 1024**3))
+    _write(tmp_path / "cpu.max", "250000 100000")
+    assert is_v2(tmp_path)
+    assert memory_limit_bytes(tmp_path) == 8 * 1024**3
+    assert cpu_limit(tmp_path) == 2.5
+
+
+def test_v2_limits_of_another_process(tmp_path, proc_cgroup, monkeypatch):
+    proc_cgroup("0::/daemon\n")
+    read = cgroup._read
+    monkeypatch.setattr(
+        cgroup,
+        "_read",
+        lambda path: "0::/job" if path == Path("/proc/4242/cgroup") else read(path),
+    )
+    _write(tmp_path / "cgroup.controllers", "cpu memory")
+    _write(tmp_path / "daemon" / "memory.max", "max")
+    _write(tmp_path / "job" / "memory.max", str(4 * 1024**3))
+    _write(tmp_path / "job" / "cpu.max", "200000 100000")
+    assert memory_limit_bytes(tmp_path) is None
+    assert memory_limit_bytes(tmp_path, pid=4242) == 4 * 1024**3
+    assert cpu_limit(tmp_path, pid=4242) == 2.0
+
+
+def test_v2_tightest_limit_in_hierarchy(tmp_path, proc_cgroup):
+    proc_cgroup("0::/kubepods.slice/pod1/container\n")
+    _write(tmp_path / "cgroup.controllers", "cpu memory")
+    pod = tmp_path / "kubepods.slice" / "pod1"
+    _write(pod / "memory.max", str(4 * 1024**3))
+    _write(pod / "cpu.max", "max 100000")
+    _write(pod / "container" / "memory.max", "max")
+    _write(pod / "container" / "cpu.max", "100000 100000")
+    assert memory_limit_bytes(tmp_path) == 4 * 1024**3
+    assert cpu_limit(tmp_path) == 1.0
+
+
+def test_v2_unlimited(tmp_path, proc_cgroup):
+    proc_cgroup("0::/missing\n")
+    _write(tmp_path / "cgroup.controllers", "cpu memory")
+    _write(tmp_path / "memory.max", "max")
+    _write(tmp_path / "cpu.max", "max 100000")
+    assert memory_limit_bytes(tmp_path) is None
+    assert cpu_limit(tmp_path) is None
+
+
+def test_v1(tmp_path, proc_cgroup):
+    proc_cgroup(
+        "12:memory:/docker/abc\n" "11:cpu,cpuacct:/docker/abc\n" "0::/docker/abc\n"
+    )
+    _write(tmp_path / "memory" / "docker" / "abc" / "memory.limit_in_bytes", "2048")
+    _write(tmp_path / "memory" / "memory.limit_in_bytes", str(2**63 - 4096))
+    cpu = tmp_path / "cpu,cpuacct" / "docker" / "abc"
+    _write(cpu / "cpu.cfs_quota_us", "50000")
+    _write(cpu / "cpu.cfs_period_us", "100000")
+    assert not is_v2(tmp_path)
+    assert memory_limit_bytes(tmp_path) == 2048
+    assert cpu_limit(tmp_path) == 0.5
+
+
+def test_v1_unlimited(tmp_path, proc_cgroup):
+    proc_cgroup("")
+    _write(tmp_path / "memory" / "memory.limit_in_bytes", "9223372036854771712")
+    _write(tmp_path / "cpu" / "cpu.cfs_quota_us", "-1")
+    _write(tmp_path / "cpu" / "cpu.cfs_period_us", "100000")
+    assert memory_limit_bytes(tmp_path) is None
+    assert cpu_limit(tmp_path) is None
+
+
+def test_missing_cgroup_filesystem(tmp_path, proc_cgroup):
+    assert memory_limit_bytes(tmp_path / "absent") is None
+    assert cpu_limit(tmp_path / "absent") is None
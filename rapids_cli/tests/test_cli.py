@@ -2,9 +2,28 @@
 # SPDX-License-Identifier: Apache-2.0
 from unittest.mock import patch
 
+import pytest
 from click.testing import CliRunner
 
-from rapids_cli.cli import debug, doctor, rapids
+from rapids_cli.cli import (
+    ByteSize,
+    DeviceList,
+    Duration,
+    SectionList,
+    debug,
+    doctor,
+    rapids,
+)
+
+_DEFAULT_OPTIONS = {
+    "budget": None,
+    "isolate": False,
+    "jobs": None,
+    "check_timeout": None,
+    "max_rss": None,
+    "fail_fast": False,
+    "devices": None,
+}
 
 
 def test_rapids_cli_help():
@@ -34,7 +53,7 @@ def test_debug_command_help():
 def test_doctor_command_success():
     """Test doctor command with successful checks."""
     runner = CliRunner()
-    with patch("rapids_cli.cli.doctor_check", return_value=True):
+    with patch("rapids_cli.doctor.doctor_check", return_value=True):
         result = runner.invoke(rapids, ["doctor"])
         assert result.exit_code == 0
 
@@ -42,7 +61,7 @@ def test_doctor_command_success():
 def test_doctor_command_failure():
     """Test doctor command with failed checks."""
     runner = CliRunner()
-    with patch("rapids_cli.cli.doctor_check", return_value=False):
+    with patch("rapids_cli.doctor.doctor_check", return_value=False):
         result = runner.invoke(rapids, ["doctor"])
         assert result.exit_code == 1
         assert "Health checks failed" in result.output
@@ -51,59 +70,374 @@ def test_doctor_command_failure():
 def test_doctor_command_verbose():
     """Test doctor command with verbose flag."""
     runner = CliRunner()
-    with patch("rapids_cli.cli.doctor_check", return_value=True) as mock_check:
+    with patch("rapids_cli.doctor.doctor_check", return_value=True) as mock_check:
         result = runner.invoke(rapids, ["doctor", "--verbose"])
         assert result.exit_code == 0
-        mock_check.assert_called_once_with(True, False, ())
+        mock_check.assert_called_once_with(True, False, (), **_DEFAULT_OPTIONS)
 
 
 def test_doctor_command_dry_run():
     """Test doctor command with dry-run flag."""
     runner = CliRunner()
-    with patch("rapids_cli.cli.doctor_check", return_value=True) as mock_check:
+    with patch("rapids_cli.doctor.doctor_check", return_value=True) as mock_check:
         result = runner.invoke(rapids, ["doctor", "--dry-run"])
         assert result.exit_code == 0
-        mock_check.assert_called_once_with(False, True, ())
+        mock_check.assert_called_once_with(False, True, (), **_DEFAULT_OPTIONS)
 
 
 def test_doctor_command_with_filters():
     """Test doctor command with filters."""
     runner = CliRunner()
-    with patch("rapids_cli.cli.doctor_check", return_value=True) as mock_check:
+    with patch("rapids_cli.doctor.doctor_check", return_value=True) as mock_check:
         result = runner.invoke(rapids, ["doctor", "cudf", "cuml"])
         assert result.exit_code == 0
-        mock_check.assert_called_once_with(False, False, ("cudf", "cuml"))
+        mock_check.assert_called_once_with(
+            False, False, ("cudf", "cuml"), **_DEFAULT_OPTIONS
+        )
 
 
 def test_debug_command_console():
     """Test debug command with console output."""
     runner = CliRunner()
-    with patch("rapids_cli.cli.run_debug") as mock_debug:
+    with patch("rapids_cli.debug.run_debug") as mock_debug:
         result = runner.invoke(rapids, ["debug"])
         assert result.exit_code == 0
-        mock_debug.assert_called_once_with(output_format="console")
+        mock_debug.assert_called_once_with(
+            output_format="console", nvidia_smi=False, only=None, skip=None, bundle=None
+        )
 
 
 def test_debug_command_json():
     """Test debug command with JSON output."""
     runner = CliRunner()
-    with patch("rapids_cli.cli.run_debug") as mock_debug:
+    with patch("rapids_cli.debug.run_debug") as mock_debug:
         result = runner.invoke(rapids, ["debug", "--json"])
         assert result.exit_code == 0
-        mock_debug.assert_called_once_with(output_format="json")
+        mock_debug.assert_called_once_with(
+            output_format="json", nvidia_smi=False, only=None, skip=None, bundle=None
+        )
+
+
+def test_debug_command_nvidia_smi():
+    """Test debug command with the raw nvidia-smi output included."""
+    runner = CliRunner()
+    with patch("rapids_cli.debug.run_debug") as mock_debug:
+        result = runner.invoke(rapids, ["debug", "--nvidia-smi"])
+        assert result.exit_code == 0
+        mock_debug.assert_called_once_with(
+            output_format="console", nvidia_smi=True, only=None, skip=None, bundle=None
+        )
 
 
 def test_doctor_standalone():
     """Test doctor command as standalone function."""
     runner = CliRunner()
-    with patch("rapids_cli.cli.doctor_check", return_value=True):
+    with patch("rapids_cli.doctor.doctor_check", return_value=True):
         result = runner.invoke(doctor)
         assert result.exit_code == 0
 
 
+def test_debug_command_sections():
+    """Test debug command parses --only and --skip section lists."""
+    runner = CliRunner()
+    with patch("rapids_cli.debug.run_debug") as mock_debug:
+        result = runner.invoke(
+            rapids, ["debug", "--only", "gpu, python", "--skip", "python"]
+        )
+        assert result.exit_code == 0
+        mock_debug.assert_called_once_with(
+            output_format="console",
+            nvidia_smi=False,
+            only=["gpu", "python"],
+            skip=["python"],
+            bundle=None,
+        )
+    result = runner.invoke(rapids, ["debug", "--skip", "pip,gpus"])
+    assert result.exit_code == 2
+    assert "unknown section(s) gpus" in result.output
+    assert SectionList().convert(["pip"], None, None) == ["pip"]
+
+
+def test_debug_command_bundle():
+    """Test debug command writes a bundle and rejects --json with it."""
+    runner = CliRunner()
+    with patch("rapids_cli.debug.run_debug") as mock_debug:
+        result = runner.invoke(rapids, ["debug", "--bundle", "out.tar.gz"])
+        assert result.exit_code == 0
+        mock_debug.assert_called_once_with(
+            output_format="console",
+            nvidia_smi=False,
+            only=None,
+            skip=None,
+            bundle="out.tar.gz",
+        )
+    result = runner.invoke(rapids, ["debug", "--json", "--bundle", "out.tar.gz"])
+    assert result.exit_code == 2
+    assert "cannot be used together" in result.output
+
+
+def test_debug_command_diff(tmp_path):
+    """Test debug command compares reports with --diff."""
+    old = tmp_path / "old.json"
+    old.write_text("{}")
+    new = tmp_path / "new.json"
+    new.write_text("{}")
+    runner = CliRunner()
+    with patch("rapids_cli.debug.run_diff") as mock_diff:
+        result = runner.invoke(rapids, ["debug", "--diff", str(old)])
+        assert result.exit_code == 0
+        mock_diff.assert_called_once_with(
+            str(old), "live", output_format="console", only=None, skip=None
+        )
+        mock_diff.reset_mock()
+        result = runner.invoke(
+            rapids, ["debug", "--json", "--diff", str(old), str(new)]
+        )
+        assert result.exit_code == 0
+        mock_diff.assert_called_once_with(
+            str(old), str(new), output_format="json", only=None, skip=None
+        )
+        mock_diff.reset_mock()
+        result = runner.invoke(rapids, ["debug", "--diff", str(old), "live"])
+        assert result.exit_code == 0
+        assert mock_diff.call_args.args == (str(old), "live")
+    result = runner.invoke(rapids, ["debug", "--diff", str(old), "--bundle", "x"])
+    assert result.exit_code == 2
+    result = runner.invoke(rapids, ["debug", str(new)])
+    assert result.exit_code == 2
+    assert "needs --diff" in result.output
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        (["missing.json"], "does not exist"),
+        (["--nvidia-smi"], "cannot be used together"),
+    ],
+)
+def test_debug_command_diff_rejects(tmp_path, args, message):
+    """Test --diff reports a missing NEW report and --nvidia-smi as usage errors."""
+    old = tmp_path / "old.json"
+    old.write_text("{}")
+    with patch("rapids_cli.debug.run_diff") as mock_diff:
+        result = CliRunner().invoke(rapids, ["debug", "--diff", str(old), *args])
+    assert result.exit_code == 2
+    assert message in " ".join(result.output.split())
+    mock_diff.assert_not_called()
+
+
 def test_debug_standalone():
     """Test debug command as standalone function."""
     runner = CliRunner()
-    with patch("rapids_cli.cli.run_debug"):
+    with patch("rapids_cli.debug.run_debug"):
         result = runner.invoke(debug)
         assert result.exit_code == 0
+
+
+def test_doctor_command_daemon():
+    """Test doctor command starts the daemon."""
+    runner = CliRunner()
+    with patch("rapids_cli.doctor.daemon.serve") as mock_serve:
+        result = runner.invoke(rapids, ["doctor", "--daemon", "--socket", "/tmp/s"])
+        assert result.exit_code == 0
+        mock_serve.assert_called_once_with("/tmp/s", verbose=False)
+
+
+def test_doctor_command_client():
+    """Test doctor command reports failures from the daemon client."""
+    runner = CliRunner()
+    with patch(
+        "rapids_cli.doctor.daemon.run_client", return_value=False
+    ) as mock_client:
+        result = runner.invoke(rapids, ["doctor", "--client", "cudf"])
+        assert result.exit_code == 1
+        mock_client.assert_called_once_with(
+            False,
+            ("cudf",),
+            None,
+            budget=None,
+            check_timeout=None,
+            fail_fast=False,
+            devices=None,
+        )
+
+
+@pytest.mark.parametrize(
+    "args, rejected",
+    [
+        (["--client", "--dry-run"], "--client cannot be combined with --dry-run"),
+        (["--client", "--isolate", "--jobs", "2"], "--isolate, --jobs"),
+        (["--client", "--max-rss", "1G"], "--max-rss"),
+        (["--daemon", "cudf"], "--daemon cannot be combined with check filters"),
+        (["--daemon", "--budget", "0"], "--budget"),
+        (["--daemon", "--fail-fast", "--devices", "0"], "--fail-fast, --devices"),
+    ],
+)
+def test_doctor_command_rejects_options_not_applying(args, rejected):
+    """Test --client and --daemon reject options they would otherwise ignore."""
+    runner = CliRunner()
+    with (
+        patch("rapids_cli.doctor.daemon.run_client") as mock_client,
+        patch("rapids_cli.doctor.daemon.serve") as mock_serve,
+    ):
+        result = runner.invoke(rapids, ["doctor", *args])
+    assert result.exit_code == 2
+    assert rejected in " ".join(result.output.split())
+    mock_client.assert_not_called()
+    mock_serve.assert_not_called()
+
+
+def test_doctor_command_client_reports_daemon_errors():
+    """Test a failing daemon is reported as an error, not a traceback."""
+    from rapids_cli.doctor.daemon import DaemonError
+
+    runner = CliRunner()
+    with patch(
+        "rapids_cli.doctor.daemon.run_client",
+        side_effect=DaemonError("Doctor daemon failed: KeyError: 'boom'"),
+    ):
+        result = runner.invoke(rapids, ["doctor", "--client"])
+    assert result.exit_code == 1
+    assert "Doctor daemon failed: KeyError" in result.output
+    assert not isinstance(result.exception, DaemonError)
+
+
+def test_doctor_command_client_forwards_check_timeout():
+    """Test --check-timeout applies to checks run by the daemon."""
+    runner = CliRunner()
+    with patch("rapids_cli.doctor.daemon.run_client", return_value=True) as client:
+        result = runner.invoke(rapids, ["doctor", "--client", "--check-timeout", "5s"])
+    assert result.exit_code == 0
+    assert client.call_args.kwargs["check_timeout"] == 5.0
+
+
+def test_cli_import_is_lazy():
+    """Test importing the CLI does not import the commands' modules."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, rapids_cli.cli; "
+        "print(sorted(m for m in ('rapids_cli.debug', 'rapids_cli.doctor', "
+        "'rich.traceback') if m in sys.modules))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "[]"
+
+
+def test_rich_excepthook_installs_rich_traceback():
+    """Test uncaught exceptions are rendered by rich once one occurs."""
+    from rapids_cli import cli
+
+    with patch("rich.traceback.install") as install, patch("sys.excepthook") as hook:
+        cli._rich_excepthook(ValueError, ValueError("x"), None)
+    install.assert_called_once_with(show_locals=True)
+    hook.assert_called_once()
+
+
+def test_doctor_command_daemon_and_client():
+    """Test --daemon and --client cannot be combined."""
+    runner = CliRunner()
+    result = runner.invoke(rapids, ["doctor", "--daemon", "--client"])
+    assert result.exit_code == 2
+    assert "mutually exclusive" in result.output
+
+
+@pytest.mark.parametrize(
+    "budget, expected",
+    [("250ms", 0.25), ("2s", 2.0), ("1.5", 1.5), ("1m", 60.0)],
+)
+def test_doctor_command_budget(budget, expected):
+    """Test doctor command parses --budget durations into seconds."""
+    runner = CliRunner()
+    with patch("rapids_cli.doctor.doctor_check", return_value=True) as mock_check:
+        result = runner.invoke(rapids, ["doctor", "--budget", budget])
+        assert result.exit_code == 0
+        mock_check.assert_called_once_with(
+            False, False, (), **{**_DEFAULT_OPTIONS, "budget": expected}
+        )
+
+
+def test_doctor_command_invalid_budget():
+    """Test doctor command rejects malformed durations."""
+    runner = CliRunner()
+    result = runner.invoke(rapids, ["doctor", "--budget", "soon"])
+    assert result.exit_code == 2
+    assert "is not a duration" in result.output
+
+
+def test_duration_accepts_numbers():
+    """Test Duration passes through already-numeric defaults."""
+    assert Duration().convert(3, None, None) == 3.0
+
+
+def test_doctor_command_isolate():
+    """Test doctor command forwards process isolation options."""
+    runner = CliRunner()
+    with patch("rapids_cli.doctor.doctor_check", return_value=True) as mock_check:
+        result = runner.invoke(
+            rapids,
+            ["doctor", "--jobs", "4", "--check-timeout", "30s", "--max-rss", "512M"],
+        )
+        assert result.exit_code == 0
+        mock_check.assert_called_once_with(
+            False,
+            False,
+            (),
+            budget=None,
+            isolate=True,
+            jobs=4,
+            check_timeout=30.0,
+            max_rss=512 * 2**20,
+            fail_fast=False,
+            devices=None,
+        )
+
+
+def test_doctor_command_fail_fast():
+    """Test doctor command forwards --fail-fast."""
+    runner = CliRunner()
+    with patch("rapids_cli.doctor.doctor_check", return_value=False) as mock_check:
+        result = runner.invoke(rapids, ["doctor", "--fail-fast"])
+        assert result.exit_code == 1
+        mock_check.assert_called_once_with(
+            False, False, (), **{**_DEFAULT_OPTIONS, "fail_fast": True}
+        )
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [("1024", 1024), ("512M", 512 * 2**20), ("2GiB", 2 * 2**30), ("1.5k", 1536)],
+)
+def test_byte_size(size, expected):
+    """Test ByteSize parses binary size suffixes."""
+    assert ByteSize().convert(size, None, None) == expected
+    assert ByteSize().convert(expected, None, None) == expected
+
+
+def test_doctor_command_invalid_max_rss():
+    """Test doctor command rejects malformed sizes."""
+    runner = CliRunner()
+    result = runner.invoke(rapids, ["doctor", "--max-rss", "lots"])
+    assert result.exit_code == 2
+    assert "is not a size" in result.output
+
+
+def test_doctor_command_devices():
+    """Test doctor command parses --devices into GPU indices."""
+    runner = CliRunner()
+    with patch("rapids_cli.doctor.doctor_check", return_value=True) as mock_check:
+        result = runner.invoke(rapids, ["doctor", "--devices", "2, GPU-8f2a,2"])
+        assert result.exit_code == 0
+        mock_check.assert_called_once_with(
+            False, False, (), **{**_DEFAULT_OPTIONS, "devices": ["2", "GPU-8f2a"]}
+        )
+
+
+def test_doctor_command_invalid_devices():
+    """Test doctor command rejects malformed device lists."""
+    runner = CliRunner()
+    result = runner.invoke(rapids, ["doctor", "--devices", "0,gpu1"])
+    assert result.exit_code == 2
+    assert "is not a list of GPU" in result.output
+    assert DeviceList().convert(["1"], None, None) == ["1"]
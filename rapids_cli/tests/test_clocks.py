@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import functools
+
+import pytest
+
+from rapids_cli.doctor.checks.clocks import (
+    HW_POWER_BRAKE_SLOWDOWN,
+    SW_POWER_CAP,
+    SW_THERMAL_SLOWDOWN,
+    check_gpu_clocks,
+)
+from rapids_cli.tests.fakes import FailingGpuInfo
+
+
+@pytest.fixture
+def make_device(make_device):
+    """Build GPUs running at full clocks within their default power limit."""
+    return functools.partial(
+        make_device,
+        clock_event_reasons=0,
+        sm_clock_mhz=1410,
+        sm_max_clock_mhz=1410,
+        power_limit_mw=400000,
+        default_power_limit_mw=400000,
+        sm_application_clock_mhz=1410,
+        sm_default_application_clock_mhz=1410,
+        temperature_c=45,
+    )
+
+
+def test_check_gpu_clocks_healthy(make_device, set_devices, run_with_findings):
+    gpu_info = set_devices(make_device(0), make_device(1))
+    assert run_with_findings(check_gpu_clocks, verbose=True) == (
+        "Clocks and power limits checked on 2 GPU(s)",
+        [],
+    )
+    assert run_with_findings(check_gpu_clocks) == (True, [])
+    assert gpu_info.usage_refreshes == 2
+
+
+def test_check_gpu_clocks_thermal_throttle(make_device, set_devices, run_with_findings):
+    set_devices(
+        make_device(
+            1,
+            clock_event_reasons=SW_THERMAL_SLOWDOWN,
+            sm_clock_mhz=900,
+            temperature_c=88,
+        )
+    )
+    result, (finding,) = run_with_findings(check_gpu_clocks)
+    assert result is True
+    assert (finding.severity, finding.code) == ("warn", "gpu-thermal-throttle")
+    assert "GPU 1 is thermally throttled at 88 C (SM clock 900 MHz of 1410 MHz)" in (
+        finding.message
+    )
+    assert finding.metrics["temperature_c"] == 88
+
+
+def test_check_gpu_clocks_power(make_device, set_devices, run_with_findings):
+    set_devices(
+        make_device(
+            0,
+            clock_event_reasons=SW_POWER_CAP | HW_POWER_BRAKE_SLOWDOWN,
+            power_limit_mw=250000,
+        )
+    )
+    _, findings = run_with_findings(check_gpu_clocks)
+    assert [(f.severity, f.code) for f in findings] == [
+        ("warn", "gpu-hw-slowdown"),
+        ("info", "gpu-power-capped"),
+        ("warn", "gpu-power-limit-lowered"),
+    ]
+    assert "power limit is 250 W, below its default of 400 W" in findings[2].message
+
+
+def test_check_gpu_clocks_application_clocks_lowered(
+    make_device, set_devices, run_with_findings
+):
+    set_devices(
+        make_device(
+            0,
+            sm_application_clock_mhz=1095,
+            memory_application_clock_mhz=1215,
+            memory_default_application_clock_mhz=1215,
+        )
+    )
+    _, (finding,) = run_with_findings(check_gpu_clocks)
+    assert finding.code == "gpu-application-clocks-lowered"
+    assert "SM application clock is locked at 1095 MHz of 1410 MHz" in finding.message
+    assert finding.metrics["kind"] == "sm"
+
+
+def test_check_gpu_clocks_unreported(make_device, set_devices):
+    set_devices(make_device(0, clock_event_reasons=None))
+    assert check_gpu_clocks() is False
+
+
+def test_check_gpu_clocks_no_gpu(set_gpu_info):
+    set_gpu_info(FailingGpuInfo())
+    with pytest.raises(ValueError, match="GPU not found"):
+        check_gpu_clocks()
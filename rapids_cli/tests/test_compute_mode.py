@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import functools
+
+import pytest
+
+from rapids_cli.doctor.checks.compute_mode import check_gpu_compute_mode
+from rapids_cli.tests.fakes import FailingGpuInfo, FakeSystemInfo
+
+
+@pytest.fixture
+def make_device(make_device):
+    """Build GPUs in the default compute mode with persistence mode on."""
+    return functools.partial(make_device, persistence_mode=True, compute_mode="default")
+
+
+@pytest.fixture(autouse=True)
+def _no_mps(set_system_info):
+    set_system_info(FakeSystemInfo())
+
+
+def test_defaults(make_device, set_devices, run_with_findings):
+    gpu_info = set_devices(make_device(0))
+    assert run_with_findings(check_gpu_compute_mode, verbose=True) == (
+        "Compute mode checked on 1 GPU(s), MPS not running",
+        [],
+    )
+    assert gpu_info.usage_refreshes == 1
+
+
+def test_persistence_mode_off(make_device, set_devices, run_with_findings):
+    set_devices(make_device(0), make_device(1, persistence_mode=False))
+    result, (finding,) = run_with_findings(check_gpu_compute_mode)
+    assert result is True
+    assert (finding.severity, finding.code) == ("perf-advice", "persistence-mode-off")
+    assert "GPU 1," in finding.message
+    assert finding.metrics == {"gpus": [1]}
+
+
+def test_prohibited(make_device, set_devices, run_with_findings):
+    set_devices(make_device(0, compute_mode="prohibited"))
+    _, (finding,) = run_with_findings(check_gpu_compute_mode)
+    assert (finding.severity, finding.code) == ("error", "gpu-compute-prohibited")
+
+
+def test_exclusive_process_without_mps(make_device, set_devices, run_with_findings):
+    set_devices(*(make_device(i, compute_mode="exclusive_process") for i in range(2)))
+    _, (finding,) = run_with_findings(check_gpu_compute_mode)
+    assert finding.code == "exclusive-process-without-mps"
+    assert "GPU 0, 1 " in finding.message
+
+
+def test_exclusive_thread_without_mps(make_device, set_devices, run_with_findings):
+    set_devices(
+        make_device(0, compute_mode="exclusive_process"),
+        make_device(1, compute_mode="exclusive_thread"),
+    )
+    _, (process, thread) = run_with_findings(check_gpu_compute_mode)
+    assert process.message.startswith("GPU 0 is in Exclusive Process compute mode")
+    assert thread.code == "exclusive-thread-without-mps"
+    assert thread.message.startswith("GPU 1 is in Exclusive Thread compute mode")
+    assert "only one thread of one process at a time" in thread.message
+
+
+def test_exclusive_process_with_mps(
+    make_device, set_devices, set_system_info, run_with_findings
+):
+    set_devices(make_device(0, compute_mode="exclusive_process"))
+    set_system_info(FakeSystemInfo(mps_pipe_directory="/tmp/nvidia-mps"))
+    result, (finding,) = run_with_findings(check_gpu_compute_mode, verbose=True)
+    assert result == "Compute mode checked on 1 GPU(s), MPS running"
+    assert (finding.severity, finding.code) == ("info", "mps-running")
+    assert finding.metrics == {
+        "pipe_directory": "/tmp/nvidia-mps",
+        "exclusive_gpus": [0],
+    }
+
+
+def test_no_data(make_device, set_devices, run_with_findings):
+    set_devices(make_device(0, persistence_mode=None, compute_mode=None))
+    assert run_with_findings(check_gpu_compute_mode) == (False, [])
+
+
+def test_no_gpu(set_gpu_info):
+    set_gpu_info(FailingGpuInfo())
+    with pytest.raises(ValueError, match="GPU not found"):
+        check_gpu_compute_mode()
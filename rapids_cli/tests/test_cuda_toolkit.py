@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 import pytest
 
+from rapids_cli import providers
 from rapids_cli.doctor.checks.cuda_toolkit import (
     CudaToolkitInfo,
     _ctypes_cuda_version,
@@ -12,6 +13,8 @@ from rapids_cli.doctor.checks.cuda_toolkit import (
     _get_toolkit_cuda_major,
     cuda_toolkit_check,
 )
+from rapids_cli.hardware import HardwareInfoError
+from rapids_cli.providers import get_toolkit_info
 
 
 def _make_info(**overrides):
@@ -110,6 +113,23 @@ def test_check_driver_query_fails(set_toolkit_info):
         cuda_toolkit_check()
 
 
+def test_toolkit_probe_timeout_is_remembered():
+    error = HardwareInfoError("CUDA driver version query timed out after 5s")
+    with patch(
+        "rapids_cli.doctor.checks.cuda_toolkit._gather_toolkit_info",
+        side_effect=error,
+    ) as gather:
+        for _ in range(2):
+            with pytest.raises(HardwareInfoError, match="timed out"):
+                cuda_toolkit_check()
+        assert gather.call_count == 1
+        # A reset, e.g. by a rebuilding daemon, probes again.
+        providers.reset_providers()
+        with pytest.raises(HardwareInfoError):
+            get_toolkit_info()
+        assert gather.call_count == 2
+
+
 def test_check_toolkit_newer_than_driver(set_toolkit_info):
     """CUDA 13 toolkit + CUDA 12 driver = error."""
     set_toolkit_info(
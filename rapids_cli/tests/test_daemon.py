@@ -0,0 +1,369 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import os
+import socket
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rapids_cli import providers
+from rapids_cli.doctor import daemon
+from rapids_cli.doctor.checks.ecc import check_gpu_memory_errors
+from rapids_cli.doctor.daemon import (
+    DaemonError,
+    DoctorDaemon,
+    DoctorServer,
+    default_socket_path,
+    request,
+    run_client,
+    serve,
+    system_fingerprint,
+)
+from rapids_cli.hardware import DeviceInfo, MigInstance
+from rapids_cli.tests.fakes import FakeGpuInfo, FakeSystemInfo
+
+
+def mock_passing_check(verbose=False, **kwargs):
+    """Mock check that passes."""
+    return "Check passed"
+
+
+def mock_failing_check(verbose=False, **kwargs):
+    """Mock check that fails."""
+    raise ValueError("Check failed")
+
+
+def _make_ep(name, value, check_fn):
+    ep = MagicMock()
+    ep.name = name
+    ep.value = value
+    ep.load.return_value = check_fn
+    return ep
+
+
+@pytest.fixture(autouse=True)
+def _isolate(monkeypatch):
+    """Keep the daemon's environment adoption and providers away from the real system."""
+    monkeypatch.setattr(os, "environ", os.environ.copy())
+    monkeypatch.setattr(daemon, "NvmlGpuInfo", FakeGpuInfo)
+    monkeypatch.setattr(daemon, "DefaultSystemInfo", FakeSystemInfo)
+
+
+@pytest.fixture
+def eps():
+    eps = [
+        _make_ep("passing", "test.module:passing", mock_passing_check),
+        _make_ep("failing", "other.module:failing", mock_failing_check),
+    ]
+    with patch("rapids_cli.doctor.doctor.entry_points", return_value=eps):
+        yield eps
+
+
+@pytest.fixture
+def server(tmp_path, eps):
+    socket_path = str(tmp_path / "doctor.sock")
+    server = DoctorServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_default_socket_path(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    assert default_socket_path() == f"/run/user/1000/rapids-doctor-{os.getuid()}.sock"
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setattr(daemon.tempfile, "gettempdir", lambda: str(tmp_path))
+    path = default_socket_path()
+    assert path == str(tmp_path / f"rapids-doctor-{os.getuid()}" / "doctor.sock")
+
+
+def test_server_creates_private_socket(tmp_path, eps):
+    socket_path = tmp_path / "private" / "doctor.sock"
+    with DoctorServer(str(socket_path)):
+        assert socket_path.parent.stat().st_mode & 0o777 == 0o700
+        assert socket_path.stat().st_mode & 0o077 == 0
+
+
+def test_server_refuses_directory_writable_by_others(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    with pytest.raises(PermissionError, match="can be modified by other users"):
+        DoctorServer(str(shared / "doctor.sock"))
+
+
+def test_client_refuses_socket_of_other_user(server, monkeypatch, capsys):
+    monkeypatch.setattr(os, "getuid", lambda: os.geteuid() + 1)
+    with pytest.raises(PermissionError):
+        request({}, server.server_address)
+    with patch("rapids_cli.doctor.daemon.doctor_check", return_value=True) as local:
+        assert run_client(False, None, server.server_address) is True
+    local.assert_called_once()
+    assert "not trusted" in capsys.readouterr().out
+
+
+def test_server_drops_clients_of_other_users(server, monkeypatch):
+    monkeypatch.setattr(daemon, "_peer_uid", lambda sock: os.getuid() + 1)
+    with pytest.raises(ConnectionError):
+        request({}, server.server_address)
+    monkeypatch.setattr(daemon, "_peer_uid", lambda sock: os.getuid())
+    assert "results" in request({"env": {}}, server.server_address)
+
+
+def test_peer_uid_of_socket_pair():
+    left, right = socket.socketpair()
+    with left, right:
+        assert daemon._peer_uid(left) == os.getuid()
+        assert daemon._peer_pid(left) == os.getpid()
+
+
+def test_system_fingerprint_tracks_relevant_env():
+    base = system_fingerprint({"CUDA_HOME": "/usr/local/cuda"})
+    assert base == system_fingerprint(
+        {"CUDA_HOME": "/usr/local/cuda", "UNRELATED": "x"}
+    )
+    assert base != system_fingerprint({"CUDA_HOME": "/opt/cuda"})
+
+
+def test_system_fingerprint_tracks_driver(tmp_path, monkeypatch):
+    version_file = tmp_path / "version"
+    version_file.write_text("NVRM version: 550.54")
+    monkeypatch.setattr(daemon, "_DRIVER_VERSION_FILE", version_file)
+    before = system_fingerprint({})
+    version_file.write_text("NVRM version: 560.10")
+    assert system_fingerprint({}) != before
+
+
+def test_daemon_handle_reuses_loaded_checks(eps):
+    doctor = DoctorDaemon()
+    first = doctor.handle({"env": {}})
+    second = doctor.handle({"env": {}, "filters": ["test"]})
+    assert [r["status"] for r in first["results"]] == [True, False]
+    assert [r["name"] for r in second["results"]] == ["mock_passing_check"]
+    eps[0].load.assert_called_once()
+
+
+def test_daemon_caches_non_volatile_results(eps):
+    check = MagicMock(side_effect=mock_passing_check, __name__="check", __doc__="")
+    eps[0].load.return_value = check
+    eps[0].dist.read_text.side_effect = {
+        "rapids_doctor_checks.json": '{"passing": {"volatile": false}}'
+    }.get
+    doctor = DoctorDaemon()
+    doctor.handle({"env": {}})
+    doctor.handle({"env": {}})
+    check.assert_called_once()
+    doctor.handle({"env": {"CUDA_HOME": "/a"}})
+    assert check.call_count == 2
+
+
+def test_daemon_handle_rebuilds_on_env_change(eps):
+    doctor = DoctorDaemon()
+    doctor.handle({"env": {"CUDA_HOME": "/a"}})
+    doctor.handle({"env": {"CUDA_HOME": "/b"}})
+    assert eps[0].load.call_count == 2
+    assert os.environ["CUDA_HOME"] == "/b"
+
+
+def test_daemon_scopes_cache_by_devices(eps, monkeypatch):
+    def count_gpus(verbose=False, **kwargs):
+        return f"{providers.get_gpu_info().device_count} GPU(s)"
+
+    check = MagicMock(side_effect=count_gpus, __name__="check", __doc__="")
+    eps[0].load.return_value = check
+    eps[0].dist.read_text.side_effect = {
+        "rapids_doctor_checks.json": '{"passing": {"volatile": false}}'
+    }.get
+    devices = [DeviceInfo(i, (8, 0), 16 * 1024**3) for i in range(2)]
+    monkeypatch.setattr(
+        daemon, "NvmlGpuInfo", lambda: FakeGpuInfo(device_count=2, devices=devices)
+    )
+    doctor = DoctorDaemon()
+    full = doctor.handle({"env": {}, "filters": ["test"]})
+    scoped = doctor.handle({"env": {}, "filters": ["test"], "devices": ["1"]})
+    doctor.handle({"env": {}, "filters": ["test"], "devices": ["1"]})
+    assert check.call_count == 2
+    assert full["results"][0]["value"] == "2 GPU(s)"
+    assert scoped["results"][0]["value"] == "1 GPU(s)"
+
+    visible = doctor.handle({"env": {"CUDA_VISIBLE_DEVICES": "0"}, "filters": ["test"]})
+    assert visible["results"][0]["value"] == "1 GPU(s)"
+    assert check.call_count == 3
+
+    # Naming the same GPU differently shares its cached results.
+    doctor.handle({"env": {"CUDA_VISIBLE_DEVICES": "1"}, "filters": ["test"]})
+    assert check.call_count == 3
+
+    missing = doctor.handle({"env": {}, "filters": ["test"], "devices": ["7"]})
+    assert missing["results"][0]["status"] is False
+    eps[0].load.assert_called_once()
+
+
+def test_daemon_scopes_cache_by_mig_instance(eps, monkeypatch):
+    def list_instances(verbose=False, **kwargs):
+        devices = providers.get_gpu_info().devices
+        return ",".join(mig.uuid for dev in devices for mig in dev.mig_instances)
+
+    check = MagicMock(side_effect=list_instances, __name__="check", __doc__="")
+    eps[0].load.return_value = check
+    eps[0].dist.read_text.side_effect = {
+        "rapids_doctor_checks.json": '{"passing": {"volatile": false}}'
+    }.get
+    device = DeviceInfo(
+        0,
+        (8, 0),
+        80 * 1024**3,
+        uuid="GPU-0",
+        mig_enabled=True,
+        mig_instances=[
+            MigInstance(0, 10 * 1024**3, uuid="MIG-a"),
+            MigInstance(1, 10 * 1024**3, uuid="MIG-b"),
+        ],
+    )
+    monkeypatch.setattr(
+        daemon, "NvmlGpuInfo", lambda: FakeGpuInfo(device_count=1, devices=[device])
+    )
+    doctor = DoctorDaemon()
+    first = doctor.handle({"env": {}, "filters": ["test"], "devices": ["MIG-a"]})
+    sibling = doctor.handle({"env": {}, "filters": ["test"], "devices": ["MIG-b"]})
+    doctor.handle({"env": {"CUDA_VISIBLE_DEVICES": "MIG-a"}, "filters": ["test"]})
+    assert first["results"][0]["value"] == "MIG-a"
+    assert sibling["results"][0]["value"] == "MIG-b"
+    assert check.call_count == 2
+
+
+def test_daemon_scopes_cache_by_search_path(eps):
+    check = MagicMock(side_effect=mock_passing_check, __name__="check", __doc__="")
+    eps[0].load.return_value = check
+    eps[0].dist.read_text.side_effect = {
+        "rapids_doctor_checks.json": '{"passing": {"volatile": false}}'
+    }.get
+    doctor = DoctorDaemon()
+    doctor.handle({"env": {"PATH": "/a"}})
+    doctor.handle({"env": {"PATH": "/b"}})
+    assert os.environ["PATH"] == "/b"
+    doctor.handle({"env": {"PATH": "/a"}})
+    assert check.call_count == 2
+    eps[0].load.assert_called_once()
+
+
+def test_daemon_checks_client_process_limits(eps, monkeypatch):
+    def memory_limit(verbose=False, **kwargs):
+        return f"limit {providers.get_system_info().memory_limit_bytes}"
+
+    check = MagicMock(side_effect=memory_limit, __name__="check", __doc__="")
+    eps[0].load.return_value = check
+    eps[0].dist.read_text.side_effect = {
+        "rapids_doctor_checks.json": '{"passing": {"volatile": false}}'
+    }.get
+    limits = {1: 8 * 1024**3, 2: 4 * 1024**3, 3: 8 * 1024**3}
+    monkeypatch.setattr(
+        daemon,
+        "ProcessSystemInfo",
+        lambda provider, pid: FakeSystemInfo(memory_limit_bytes=limits[pid]),
+    )
+    doctor = DoctorDaemon()
+    first = doctor.handle({"env": {}, "filters": ["test"]}, pid=1)
+    second = doctor.handle({"env": {}, "filters": ["test"]}, pid=2)
+    doctor.handle({"env": {}, "filters": ["test"]}, pid=3)
+    assert first["results"][0]["value"] == f"limit {8 * 1024**3}"
+    assert second["results"][0]["value"] == f"limit {4 * 1024**3}"
+    # Clients with the same limits share cached results.
+    assert check.call_count == 2
+
+
+def test_server_passes_client_pid(server, monkeypatch):
+    pids = []
+    monkeypatch.setattr(
+        server.doctor, "handle", lambda request, pid: pids.append(pid) or {}
+    )
+    request({}, server.server_address)
+    assert pids == [os.getpid()]
+
+
+def test_daemon_rereads_memory_errors(eps, make_device, monkeypatch):
+    eps[0].load.return_value = check_gpu_memory_errors
+    eps[0].dist.read_text.side_effect = {
+        "rapids_doctor_checks.json": '{"passing": {"volatile": true}}'
+    }.get
+    device = make_device(0, ecc_enabled=True, ecc_uncorrected_volatile=0)
+    gpu_info = FakeGpuInfo(device_count=1, devices=[device])
+    monkeypatch.setattr(daemon, "NvmlGpuInfo", lambda: gpu_info)
+    doctor = DoctorDaemon()
+    healthy = doctor.handle({"env": {}, "filters": ["test"]})
+    assert healthy["results"][0]["status"] is True
+
+    device.ecc_uncorrected_volatile = 2
+    failing = doctor.handle({"env": {}, "filters": ["test"]})
+    assert failing["results"][0]["status"] is False
+    assert gpu_info.health_refreshes == 2
+    eps[0].load.assert_called_once()
+
+
+def test_client_round_trip(server, capsys):
+    assert run_client(False, ["test"], server.server_address) is True
+    assert "All checks passed!" in capsys.readouterr().out
+
+    assert run_client(True, None, server.server_address) is False
+    captured = capsys.readouterr().out
+    assert "mock_failing_check failed" in captured
+    assert "Check failed" in captured
+    assert "Traceback" in captured
+
+
+def test_request_surfaces_daemon_errors(server):
+    with patch.object(server.doctor, "handle", side_effect=KeyError("boom")):
+        with pytest.raises(DaemonError, match="Doctor daemon failed: KeyError"):
+            request({}, server.server_address)
+
+
+def test_client_falls_back_without_daemon(tmp_path, capsys):
+    with patch("rapids_cli.doctor.daemon.doctor_check", return_value=True) as local:
+        assert run_client(False, ["cudf"], str(tmp_path / "missing.sock")) is True
+    local.assert_called_once_with(
+        False,
+        False,
+        ["cudf"],
+        budget=None,
+        check_timeout=None,
+        fail_fast=False,
+        devices=None,
+    )
+    assert "running checks locally" in capsys.readouterr().out
+
+
+def test_client_reports_daemon_timeout_without_local_run():
+    with (
+        patch("rapids_cli.doctor.daemon.request", side_effect=TimeoutError),
+        patch("rapids_cli.doctor.daemon.doctor_check") as local,
+    ):
+        with pytest.raises(DaemonError, match="did not answer within 30s"):
+            run_client(False)
+    local.assert_not_called()
+
+
+def test_server_refuses_second_daemon(server):
+    with pytest.raises(RuntimeError, match="already serving"):
+        DoctorServer(server.server_address)
+
+
+def test_server_replaces_stale_socket(tmp_path):
+    socket_path = str(tmp_path / "doctor.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+    with DoctorServer(socket_path) as server:
+        assert os.path.exists(server.server_address)
+    assert not os.path.exists(socket_path)
+
+
+def test_serve_warms_up_and_stops_on_interrupt(tmp_path, eps, capsys):
+    socket_path = str(tmp_path / "doctor.sock")
+    with patch.object(DoctorServer, "serve_forever", side_effect=KeyboardInterrupt):
+        serve(socket_path)
+    eps[0].load.assert_called_once()
+    assert "Serving doctor results on" in capsys.readouterr().out
@@ -1,15 +1,30 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
+import io
 import json
-from unittest.mock import patch
+import tarfile
+from unittest.mock import Mock, patch
+
+import pytest
 
 from rapids_cli.debug.debug import (
     gather_command_output,
     gather_cuda_version,
+    gather_environment,
+    gather_gpu_usage,
+    gather_gpudirect,
+    gather_gpus,
+    gather_host_memory,
+    gather_numa_topology,
     gather_package_versions,
     gather_tools,
+    read_driver_gpu_information,
     run_debug,
+    select_sections,
+    write_bundle,
 )
+from rapids_cli.gpudirect import RdmaPort
+from rapids_cli.hardware import DeviceInfo, GpuProcess, MigInstance
 from rapids_cli.tests.fakes import FakeGpuInfo, FakeSystemInfo
 
 
@@ -64,6 +79,14 @@ def test_run_debug_console(capsys, set_gpu_info, set_system_info):
     set_gpu_info(
         FakeGpuInfo(
             device_count=1,
+            devices=[
+                DeviceInfo(
+                    index=0,
+                    compute_capability=(9, 0),
+                    memory_total_bytes=0,
+                    name="NVIDIA H100",
+                )
+            ],
             cuda_driver_version=12040,
             driver_version="550.54.15",
         )
@@ -86,6 +109,7 @@ def test_run_debug_console(capsys, set_gpu_info, set_system_info):
 
     captured = capsys.readouterr()
     assert "RAPIDS Debug Information" in captured.out
+    assert "name: NVIDIA H100" in captured.out
 
 
 def test_run_debug_json(capsys, set_gpu_info, set_system_info):
@@ -116,12 +140,246 @@ def test_run_debug_json(capsys, set_gpu_info, set_system_info):
         patch("pathlib.Path.read_text", return_value='NAME="Ubuntu"\nVERSION="22.04"'),
     ):
         run_debug(output_format="json")
+        output = json.loads(capsys.readouterr().out)
+        run_debug(output_format="json", nvidia_smi=True)
+        with_smi = json.loads(capsys.readouterr().out)
 
-    captured = capsys.readouterr()
-    output = json.loads(captured.out)
     assert isinstance(output, dict)
     assert "date" in output
     assert "platform" in output
     assert "driver_version" in output
     assert "cuda_version" in output
     assert "package_versions" in output
+    assert output["gpus"] == {}
+    assert "nvidia_smi_output" not in output
+    assert with_smi["nvidia_smi_output"] == "test output"
+
+
+def test_select_sections():
+    assert select_sections(only=["python", "gpu"]) == ["gpu", "python"]
+    assert "nvidia_smi" not in select_sections()
+    assert "nvidia_smi" in select_sections(nvidia_smi=True)
+    default = select_sections(skip=["conda", "pip"])
+    assert "conda" not in default and "pip" not in default and "gpu" in default
+    with pytest.raises(ValueError, match="Unknown debug section"):
+        select_sections(only=["gpus"])
+
+
+def test_run_debug_only_gathers_selected_sections(capsys, set_gpu_info):
+    set_gpu_info(FakeGpuInfo(device_count=0, driver_version="550.54.15"))
+    with (
+        patch("rapids_cli.debug.debug.gather_package_versions") as packages,
+        patch("rapids_cli.debug.debug.gather_command_output") as command,
+    ):
+        run_debug(output_format="json", only=["driver", "python"])
+    packages.assert_not_called()
+    command.assert_not_called()
+    output = json.loads(capsys.readouterr().out)
+    assert list(output) == [
+        "driver_version",
+        "cuda_version",
+        "python_version_full",
+        "python_version",
+        "python_hash_info",
+    ]
+
+
+def test_write_bundle(tmp_path, set_gpu_info):
+    set_gpu_info(FakeGpuInfo(device_count=0, driver_version="550.54.15"))
+    path = tmp_path / "debug.tar.gz"
+    manifest = write_bundle(path, ["driver", "python"])
+
+    with tarfile.open(path) as tar:
+        names = tar.getnames()
+        driver = json.load(tar.extractfile("rapids-debug/driver.json"))
+        stored = json.load(tar.extractfile("rapids-debug/manifest.json"))
+    assert names == [
+        "rapids-debug/driver.json",
+        "rapids-debug/python.json",
+        "rapids-debug/manifest.json",
+    ]
+    assert driver["driver_version"] == "550.54.15"
+    assert stored == manifest
+    sections = manifest["sections"]
+    assert [section["name"] for section in sections] == ["driver", "python"]
+    assert sections[0]["keys"] == ["driver_version", "cuda_version"]
+    assert all(section["seconds"] >= 0 for section in sections)
+    assert manifest["total_bytes"] == sum(section["bytes"] for section in sections)
+
+
+def test_write_bundle_to_stdout(set_gpu_info):
+    set_gpu_info(FakeGpuInfo(device_count=0))
+    buffer = io.BytesIO()
+    with patch("sys.stdout", Mock(buffer=buffer)):
+        write_bundle("-", ["python"])
+    with tarfile.open(fileobj=io.BytesIO(buffer.getvalue())) as tar:
+        assert "rapids-debug/python.json" in tar.getnames()
+
+
+def test_run_debug_bundle(tmp_path, capsys, set_gpu_info):
+    set_gpu_info(FakeGpuInfo(device_count=0))
+    path = tmp_path / "debug.tar.gz"
+    run_debug(only=["python"], bundle=str(path))
+    assert "Wrote 1 debug section(s)" in capsys.readouterr().out
+    assert tarfile.is_tarfile(path)
+
+
+def test_gather_environment(monkeypatch):
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "0,1")
+    monkeypatch.setenv("UCX_TLS", "rc,cuda_copy")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+    monkeypatch.setenv("PATH", "/home/user/bin")
+    monkeypatch.setenv("RAPIDS_GITHUB_TOKEN", "ghp_secret")
+    environment = gather_environment()
+    assert environment["CUDA_VISIBLE_DEVICES"] == "0,1"
+    assert environment["UCX_TLS"] == "rc,cuda_copy"
+    assert environment["RAPIDS_GITHUB_TOKEN"] == "<redacted>"
+    assert "AWS_SECRET_ACCESS_KEY" not in environment
+    assert "PATH" not in environment
+
+
+def test_gather_gpus(tmp_path, set_gpu_info):
+    information = tmp_path / "0000:3b:00.0" / "information"
+    information.parent.mkdir()
+    information.write_text(
+        "Model: \t\t NVIDIA A100-SXM4-80GB\n"
+        "GPU UUID: \t GPU-2f0b\n"
+        "Bus Location: \t 0000:3b:00.0\n"
+    )
+    devices = [
+        DeviceInfo(
+            index=0,
+            compute_capability=(8, 0),
+            memory_total_bytes=80 * 1024**3,
+            pci_bus_id="0000:3b:00.0",
+            name="NVIDIA A100-SXM4-80GB",
+        ),
+        DeviceInfo(index=1, compute_capability=(8, 0), memory_total_bytes=0),
+    ]
+    set_gpu_info(FakeGpuInfo(device_count=2, devices=devices))
+    gpus = gather_gpus(tmp_path)
+    assert gpus["GPU 0"]["name"] == "NVIDIA A100-SXM4-80GB"
+    assert gpus["GPU 0"]["compute_capability"] == (8, 0)
+    assert gpus["GPU 0"]["driver_information"] == {
+        "Model": "NVIDIA A100-SXM4-80GB",
+        "GPU UUID": "GPU-2f0b",
+        "Bus Location": "0000:3b:00.0",
+    }
+    assert "driver_information" not in gpus["GPU 1"]
+    assert "processes" not in gpus["GPU 0"]
+    assert read_driver_gpu_information("0000:af:00.0", tmp_path) == {}
+
+
+def test_gather_numa_topology(sysfs, set_gpu_info):
+    sysfs.add_numa_node(0, "0-27", 256 * 1024**2)
+    sysfs.add_pci_device("0000:3b:00.0", 0, "0-27")
+    devices = [
+        DeviceInfo(
+            index=0,
+            compute_capability=(8, 0),
+            memory_total_bytes=0,
+            pci_bus_id="0000:3b:00.0",
+        ),
+        DeviceInfo(index=1, compute_capability=(8, 0), memory_total_bytes=0),
+    ]
+    set_gpu_info(FakeGpuInfo(device_count=2, devices=devices))
+    with patch("rapids_cli.debug.debug.process_affinity", return_value={0, 1, 2}):
+        assert gather_numa_topology() == {
+            "GPU 0": "NUMA node 0 (0000:3b:00.0), local CPUs 0-27",
+            "Node 0": "CPUs 0-27, 256.0 GiB",
+            "Process affinity": "0-2",
+        }
+
+
+def test_gather_host_memory():
+    with (
+        patch("rapids_cli.debug.debug.shm_usage", return_value=None),
+        patch("rapids_cli.debug.debug.memlock_limits", return_value=(65536, None)),
+        patch("rapids_cli.debug.debug.transparent_hugepage_mode", return_value="never"),
+        patch("rapids_cli.debug.debug.hugepages", return_value={}),
+    ):
+        assert gather_host_memory() == {
+            "dev_shm_size_bytes": None,
+            "dev_shm_free_bytes": None,
+            "memlock_soft_bytes": 65536,
+            "memlock_hard_bytes": None,
+            "transparent_hugepage": "never",
+            "hugepages_total": None,
+            "hugepages_free": None,
+            "hugepage_size_bytes": None,
+        }
+
+
+def test_gather_gpudirect(tmp_path, monkeypatch):
+    cufile = tmp_path / "cufile.json"
+    cufile.write_text('{"properties": {"allow_compat_mode": false}}')
+    monkeypatch.setenv("CUFILE_ENV_PATH_JSON", str(cufile))
+    with (
+        patch("rapids_cli.debug.debug.loaded_modules", return_value={"nvidia_fs"}),
+        patch(
+            "rapids_cli.debug.debug.rdma_ports",
+            return_value=[RdmaPort("mlx5_0", 1, "Ethernet", "ACTIVE")],
+        ),
+    ):
+        assert gather_gpudirect() == {
+            "nvidia_peermem": False,
+            "nvidia_fs": True,
+            "rdma_ports": "mlx5_0/1 (Ethernet, ACTIVE)",
+            "cufile_json": str(cufile),
+            "gds_compat_mode": False,
+        }
+        cufile.write_text("{")
+        assert gather_gpudirect()["cufile_json"].startswith(f"{cufile} (invalid:")
+
+
+def test_gather_gpu_usage(set_gpu_info):
+    device = DeviceInfo(
+        index=0,
+        compute_capability=(8, 0),
+        memory_total_bytes=80 * 1024**3,
+        memory_used_bytes=30 * 1024**3,
+        memory_free_bytes=50 * 1024**3,
+        gpu_utilization_percent=97,
+        memory_utilization_percent=40,
+        processes=[GpuProcess(pid=4242, name="python", used_memory_bytes=1024)],
+    )
+    set_gpu_info(FakeGpuInfo(device_count=1, devices=[device]))
+    assert gather_gpu_usage() == {
+        "GPU 0": {
+            "memory_used_bytes": 30 * 1024**3,
+            "memory_free_bytes": 50 * 1024**3,
+            "gpu_utilization_percent": 97,
+            "memory_utilization_percent": 40,
+            "processes": [{"pid": 4242, "name": "python", "used_memory_bytes": 1024}],
+        }
+    }
+
+
+def test_gather_gpu_usage_of_mig_instances(tmp_path, set_gpu_info):
+    holder = GpuProcess(pid=7, used_memory_bytes=1024)
+    device = DeviceInfo(
+        index=0,
+        compute_capability=(8, 0),
+        memory_total_bytes=40 * 1024**3,
+        mig_enabled=True,
+        mig_instances=[
+            MigInstance(
+                1,
+                10 * 1024**3,
+                memory_used_bytes=1024,
+                memory_free_bytes=10 * 1024**3 - 1024,
+                processes=[holder],
+            )
+        ],
+    )
+    set_gpu_info(FakeGpuInfo(device_count=1, devices=[device]))
+    assert gather_gpu_usage()["GPU 0"]["mig_instances"] == {
+        "MIG 1": {
+            "memory_used_bytes": 1024,
+            "memory_free_bytes": 10 * 1024**3 - 1024,
+            "processes": [{"pid": 7, "name": None, "used_memory_bytes": 1024}],
+        }
+    }
+    (instance,) = gather_gpus(tmp_path)["GPU 0"]["mig_instances"]
+    assert instance["memory_total_bytes"] == 10 * 1024**3
+    assert "processes" not in instance
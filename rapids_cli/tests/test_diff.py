@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import json
+from unittest.mock import patch
+
+from rapids_cli.debug.debug import write_bundle
+from rapids_cli.debug.diff import (
+    diff_reports,
+    load_report,
+    parse_conda_list,
+    parse_pip_freeze,
+    run_diff,
+)
+from rapids_cli.tests.fakes import FakeGpuInfo
+
+OLD = {
+    "date": "2026-01-01 00:00:00",
+    "driver_version": "550.54.15",
+    "cuda_version": "12.4",
+    "gpus": {
+        "GPU 0": {
+            "name": "NVIDIA H100",
+            "temperature_c": 40,
+            "pcie_link_generation": 5,
+            "ecc": 0,
+        }
+    },
+    "package_versions": {"numpy": "1.26.4", "cudf": "24.12.0", "six": "1.16.0"},
+    "pip_packages": "numpy==1.26.4\ncudf @ file:///tmp/cudf.whl\n-e /src/rmm",
+    "tools": {"nvcc": None},
+}
+
+
+def _write(path, report):
+    path.write_text(json.dumps(report))
+    return path
+
+
+def test_parse_pip_freeze():
+    assert parse_pip_freeze(OLD["pip_packages"] + "\n# comment\n") == {
+        "numpy": "1.26.4",
+        "cudf": "file:///tmp/cudf.whl",
+        "-e /src/rmm": "",
+    }
+
+
+def test_parse_conda_list():
+    text = (
+        "# packages in environment at /opt/conda:\n"
+        "#\n"
+        "# Name    Version   Build  Channel\n"
+        "cudf      24.12.00  cuda12_0  rapidsai\n"
+        "numpy     1.26.4    py312_0\n"
+    )
+    assert parse_conda_list(text) == {
+        "cudf": "24.12.00 cuda12_0 rapidsai",
+        "numpy": "1.26.4 py312_0",
+    }
+
+
+def test_diff_reports():
+    new = {
+        "date": "2026-02-01 00:00:00",
+        "driver_version": "560.28.03",
+        "cuda_version": "12.4",
+        "gpus": {
+            "GPU 0": {
+                "name": "NVIDIA H100",
+                "temperature_c": 70,
+                "pcie_link_generation": 1,
+                "ecc": 3,
+            }
+        },
+        "package_versions": {"numpy": "2.1.0", "cudf": "24.12.0", "cupy": "13.3.0"},
+        "pip_packages": "numpy==2.1.0\ncudf @ file:///tmp/cudf.whl\n-e /src/rmm",
+        "tools": {"nvcc": "Cuda compilation tools, release 12.4"},
+        "environment": {"CUDA_VISIBLE_DEVICES": "0"},
+    }
+    assert diff_reports(OLD, new) == {
+        "driver_version": {"old": "550.54.15", "new": "560.28.03"},
+        "gpus": {"changed": {"GPU 0/ecc": {"old": 0, "new": 3}}},
+        "package_versions": {
+            "removed": {"six": "1.16.0"},
+            "added": {"cupy": "13.3.0"},
+            "changed": {"numpy": {"old": "1.26.4", "new": "2.1.0"}},
+        },
+        "pip_packages": {"changed": {"numpy": {"old": "1.26.4", "new": "2.1.0"}}},
+        "tools": {
+            "changed": {
+                "nvcc": {"old": None, "new": "Cuda compilation tools, release 12.4"}
+            }
+        },
+        "environment": {"new": {"CUDA_VISIBLE_DEVICES": "0"}},
+    }
+    assert diff_reports(OLD, OLD) == {}
+
+
+def test_load_report_from_bundle(tmp_path, set_gpu_info):
+    set_gpu_info(FakeGpuInfo(device_count=0, driver_version="550.54.15"))
+    path = tmp_path / "debug.tar.gz"
+    write_bundle(path, ["driver", "python"])
+    report = load_report(path)
+    assert report["driver_version"] == "550.54.15"
+    assert "python_version" in report
+    assert "sections" not in report
+
+
+def test_run_diff_files(tmp_path, capsys):
+    old = _write(tmp_path / "old.json", OLD)
+    new = _write(tmp_path / "new.json", {**OLD, "cuda_version": "12.8"})
+
+    run_diff(old, new, output_format="json")
+    assert json.loads(capsys.readouterr().out) == {
+        "cuda_version": {"old": "12.4", "new": "12.8"}
+    }
+
+    run_diff(old, new, output_format="json", skip=["driver"])
+    assert json.loads(capsys.readouterr().out) == {}
+
+    run_diff(old, new)
+    output = capsys.readouterr().out
+    assert "RAPIDS Debug Diff" in output
+    assert "12.8" in output
+
+
+def test_run_diff_console_entries(tmp_path, capsys):
+    old = _write(tmp_path / "old.json", OLD)
+    new = _write(
+        tmp_path / "new.json",
+        {**OLD, "package_versions": {"numpy": "2.1.0", "cupy": "13.3.0"}},
+    )
+    run_diff(old, new, only=["packages"])
+    output = capsys.readouterr().out
+    for text in ("six", "1.16.0", "cupy", "13.3.0", "numpy", "2.1.0"):
+        assert text in output
+
+    run_diff(old, old)
+    assert "No differences" in capsys.readouterr().out
+
+
+def test_run_diff_live_gathers_sections_of_old_report(tmp_path, capsys, set_gpu_info):
+    set_gpu_info(
+        FakeGpuInfo(
+            device_count=0, driver_version="560.28.03", cuda_driver_version=12040
+        )
+    )
+    old = _write(tmp_path / "old.json", OLD)
+    with patch("rapids_cli.debug.debug.gather_package_versions") as packages:
+        run_diff(old, output_format="json", only=["driver"])
+    packages.assert_not_called()
+    assert json.loads(capsys.readouterr().out) == {
+        "driver_version": {"old": "550.54.15", "new": "560.28.03"}
+    }
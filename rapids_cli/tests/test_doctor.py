@@ -1,9 +1,33 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
+import json
+import subprocess
+import sys
+import time
 import warnings
 from unittest.mock import MagicMock, patch
 
-from rapids_cli.doctor.doctor import CheckResult, doctor_check
+import pytest
+
+from rapids_cli.doctor.doctor import (
+    DEFAULT_CHECK_COST,
+    CancellationToken,
+    CheckCancelledError,
+    CheckResult,
+    CheckSpec,
+    RemoteCheckError,
+    doctor_check,
+    estimate_cost,
+    iter_checks,
+    load_timings,
+    plan_checks,
+    report_results,
+    run_checks,
+    save_timings,
+)
+from rapids_cli.doctor.findings import Finding
+from rapids_cli.doctor.manifest import CheckMetadata
+from rapids_cli.tests.fakes import FakeGpuInfo
 
 
 def mock_passing_check(verbose=False, **kwargs):
@@ -172,3 +196,407 @@ def test_doctor_check_import_error():
         result = doctor_check(verbose=False, dry_run=False)
         # Should still pass with no checks discovered
         assert result is True
+
+
+def test_check_result_round_trip():
+    """Test CheckResult survives serialization to and from a dict."""
+    try:
+        raise ValueError("Check failed")
+    except ValueError as e:
+        error = e
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        warnings.warn("careful", stacklevel=1)
+    result = CheckResult(
+        name="test_check",
+        description="Test check description",
+        status=False,
+        value=None,
+        error=error,
+        warnings=caught,
+    )
+    restored = CheckResult.from_dict(result.to_dict())
+    assert isinstance(restored.error, RemoteCheckError)
+    assert str(restored.error) == "Check failed"
+    assert restored.error.error_type == "ValueError"
+    assert "Traceback" in restored.error.traceback
+    assert [str(w.message) for w in restored.warnings] == ["careful"]
+    assert restored.to_dict() == result.to_dict()
+
+
+def test_check_result_round_trip_findings():
+    finding = Finding("perf-advice", "Use more RAM", code="ram", metrics={"r": 1})
+    result = CheckResult(
+        name="test_check",
+        description="",
+        status=True,
+        value=None,
+        error=None,
+        warnings=None,
+        findings=[finding],
+    )
+    assert CheckResult.from_dict(result.to_dict()).findings == [finding]
+
+
+def cheap_check(verbose=False, **kwargs):
+    """Check that is cheap."""
+    return True
+
+
+def expensive_check(verbose=False, **kwargs):
+    """Check that is expensive."""
+    return True
+
+
+expensive_check.cost = 10.0  # type: ignore[attr-defined]
+
+
+def slow_check(verbose=False, **kwargs):
+    """Check that overruns its declared cost."""
+    time.sleep(1)
+
+
+slow_check.cost = 0.001  # type: ignore[attr-defined]
+
+
+def _spec(name, check_fn, **metadata):
+    return CheckSpec(
+        name, f"mod:{name}", metadata=CheckMetadata(**metadata), check_fn=check_fn
+    )
+
+
+def test_check_description_is_first_docstring_line():
+    spec = _spec("cheap", cheap_check)
+    (result,) = run_checks([spec])
+    assert spec.description == result.description == "Check that is cheap."
+
+
+def test_estimate_cost_prefers_recorded_timings():
+    expensive = _spec("expensive", expensive_check)
+    assert estimate_cost(expensive, {"mod:expensive": 0.5}) == 0.5
+    assert estimate_cost(expensive, {}) == 10.0
+    assert estimate_cost(_spec("expensive", expensive_check, cost=2.0), {}) == 2.0
+    assert estimate_cost(_spec("cheap", cheap_check), {}) == DEFAULT_CHECK_COST
+
+
+def test_run_checks_records_timings():
+    results = run_checks([_spec("cheap", cheap_check)])
+    assert results[0].duration > 0
+    assert load_timings()["mod:cheap"] == pytest.approx(results[0].duration)
+
+
+def test_load_timings_ignores_corrupt_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    path = tmp_path / "rapids-cli" / "doctor_timings.json"
+    path.parent.mkdir()
+    path.write_text("not json")
+    assert load_timings() == {}
+    path.write_text("[]")
+    assert load_timings() == {}
+
+
+def test_run_checks_budget_runs_cheapest_first():
+    save_timings({"mod:cheap": 0.001})
+    started = []
+    results = run_checks(
+        [_spec("expensive", expensive_check), _spec("cheap", cheap_check)],
+        budget=1.0,
+        on_start=lambda i, n, name: started.append(name),
+    )
+    assert started == ["cheap_check"]
+    assert [(r.name, r.skip_reason) for r in results] == [
+        ("cheap_check", None),
+        ("expensive_check", "not run (budget)"),
+    ]
+
+
+def test_run_checks_budget_cancels_stragglers():
+    token = CancellationToken()
+    start = time.monotonic()
+    results = run_checks(
+        [_spec("slow", slow_check), _spec("cheap", cheap_check)],
+        budget=0.05,
+        cancel_token=token,
+    )
+    assert time.monotonic() - start < 0.5
+    assert results[0].skip_reason == "cancelled (budget)"
+    assert "mod:slow" not in load_timings()
+    # The abandoned check is asked to stop and nothing else starts.
+    assert token.cancelled and token.reason == "budget"
+    assert results[1].skip_reason == "cancelled (budget)"
+
+
+class SlowGpuInfo(FakeGpuInfo):
+    """GPU provider whose first query blocks, like an NVML load on a bad node."""
+
+    def __getattribute__(self, name):
+        if name == "device_count":
+            time.sleep(2)
+        return super().__getattribute__(name)
+
+
+def test_run_checks_budget_bounds_gpu_probe(set_gpu_info):
+    set_gpu_info(SlowGpuInfo(device_count=1))
+    start = time.monotonic()
+    (result,) = run_checks(
+        [_spec("cheap", cheap_check, requires_gpu=True, cost=0.001)], budget=0.25
+    )
+    assert time.monotonic() - start < 1
+    assert result.skip_reason == "not run (budget)"
+
+
+def test_run_checks_no_gpu_probe_once_budget_is_spent(set_gpu_info):
+    gpu_info = MagicMock()
+    set_gpu_info(gpu_info)
+    (result,) = run_checks([_spec("cheap", cheap_check, requires_gpu=True)], budget=0)
+    assert result.skip_reason == "not run (budget)"
+    assert not gpu_info.mock_calls
+
+
+def test_doctor_check_fails_when_budget_runs_nothing(capsys):
+    ep = MagicMock()
+    ep.name = "expensive"
+    ep.value = "test.module:expensive"
+    ep.load.return_value = expensive_check
+    with patch("rapids_cli.doctor.doctor.entry_points", return_value=[ep]):
+        assert doctor_check(verbose=False, dry_run=False, budget=0.001) is False
+    captured = capsys.readouterr().out
+    assert "expensive_check not run (budget)" in captured
+    assert "No checks ran" in captured
+    assert "All checks passed!" not in captured
+
+
+def test_doctor_check_passes_when_filters_match_nothing(capsys):
+    ep = MagicMock()
+    ep.name = "expensive"
+    ep.value = "test.module:expensive"
+    ep.load.return_value = expensive_check
+    with patch("rapids_cli.doctor.doctor.entry_points", return_value=[ep]):
+        assert doctor_check(verbose=False, dry_run=False, filters=["cudf"]) is True
+    assert "No checks ran" not in capsys.readouterr().out
+
+
+def test_doctor_check_budget_reports_not_run(capsys):
+    mock_ep1 = MagicMock()
+    mock_ep1.name = "cheap"
+    mock_ep1.value = "test.module:cheap"
+    mock_ep1.load.return_value = cheap_check
+
+    mock_ep2 = MagicMock()
+    mock_ep2.name = "expensive"
+    mock_ep2.value = "test.module:expensive"
+    mock_ep2.load.return_value = expensive_check
+
+    with patch(
+        "rapids_cli.doctor.doctor.entry_points", return_value=[mock_ep1, mock_ep2]
+    ):
+        result = doctor_check(verbose=False, dry_run=False, budget=0.25)
+        assert result is True
+
+    captured = capsys.readouterr()
+    assert "expensive_check not run (budget)" in captured.out
+    assert "All checks passed!" in captured.out
+
+
+def _manifest_ep(name, value, check_fn, manifest):
+    ep = MagicMock()
+    ep.name = name
+    ep.value = value
+    ep.load.return_value = check_fn
+    ep.dist.read_text.side_effect = {
+        "extra_metadata/rapids_doctor_checks.json": json.dumps(manifest)
+    }.get
+    return ep
+
+
+def test_plan_checks_reads_manifest_without_loading():
+    manifest = {"cudf_io": {"tags": ["io"]}}
+    ep = _manifest_ep("cudf_io", "cudf.checks:io_check", cheap_check, manifest)
+    with patch("rapids_cli.doctor.doctor.entry_points", return_value=[ep]):
+        (spec,) = plan_checks()
+        assert spec.metadata.tags == ["io"]
+        assert spec.display_name == "cudf_io"
+        assert spec.description == ""
+        assert [s.name for s in plan_checks(["io"])] == ["cudf_io"]
+        assert [s.name for s in plan_checks(["cudf_io"])] == ["cudf_io"]
+        assert plan_checks(["cuml"]) == []
+    ep.load.assert_not_called()
+
+
+def test_doctor_check_dry_run_does_not_import():
+    mock_ep = MagicMock()
+    mock_ep.name = "heavy_check"
+    mock_ep.value = "heavy.module:check"
+    with patch("rapids_cli.doctor.doctor.entry_points", return_value=[mock_ep]):
+        assert doctor_check(verbose=False, dry_run=True) is True
+    mock_ep.load.assert_not_called()
+
+
+def test_run_checks_skips_gpu_checks_without_gpu(set_gpu_info):
+    set_gpu_info(FakeGpuInfo(device_count=0))
+    spec = CheckSpec("gpu_check", "mod:gpu", metadata=CheckMetadata(requires_gpu=True))
+    spec.entry_point = MagicMock()
+    (result,) = run_checks([spec])
+    assert (result.name, result.skip_reason) == ("gpu_check", "not run (no GPU)")
+    spec.entry_point.load.assert_not_called()
+
+
+def test_run_checks_runs_prerequisites_first():
+    results = run_checks(
+        [
+            _spec("dependent", cheap_check, requires=["failing"]),
+            _spec("failing", mock_failing_check),
+            _spec("independent", cheap_check),
+        ]
+    )
+    assert [(r.name, r.status, r.skip_reason) for r in results] == [
+        ("mock_failing_check", False, None),
+        ("cheap_check", False, "not run (requires failing)"),
+        ("cheap_check", True, None),
+    ]
+
+
+def test_run_checks_reuses_cached_results():
+    check = MagicMock(side_effect=cheap_check, __name__="check", __doc__="Check.")
+    cache: dict[str, CheckResult] = {}
+    specs = [_spec("stable", check, volatile=False), _spec("volatile", check)]
+    run_checks(specs, cache=cache)
+    results = run_checks(specs, cache=cache)
+    assert list(cache) == ["mod:stable"]
+    assert [r.status for r in results] == [True, True]
+    assert check.call_count == 3
+
+
+def test_run_checks_fail_fast():
+    results = run_checks(
+        [
+            _spec("passing", cheap_check),
+            _spec("failing", mock_failing_check),
+            _spec("skipped", cheap_check),
+        ],
+        fail_fast=True,
+    )
+    assert [(r.status, r.skip_reason) for r in results] == [
+        (True, None),
+        (False, None),
+        (False, "cancelled (fail-fast)"),
+    ]
+    assert set(load_timings()) == {"mod:passing", "mod:failing"}
+
+
+def cooperative_check(verbose=False, cancel_token=None, **kwargs):
+    """Check that stops when its run is cancelled."""
+    cancel_token.cancel("test")
+    cancel_token.raise_if_cancelled()
+
+
+def test_run_checks_cooperative_cancellation():
+    token = CancellationToken()
+    results = run_checks(
+        [_spec("cooperative", cooperative_check), _spec("later", cheap_check)],
+        cancel_token=token,
+    )
+    assert [r.skip_reason for r in results] == ["cancelled (test)"] * 2
+    assert results[0].error is None
+    assert load_timings() == {}
+
+
+def test_cancellation_token():
+    token = CancellationToken()
+    assert token.wait(0) is False
+    token.raise_if_cancelled()
+    token.cancel("first")
+    token.cancel("second")
+    assert token.cancelled and token.wait(0)
+    assert token.skip_reason == "cancelled (first)"
+    with pytest.raises(CheckCancelledError):
+        token.raise_if_cancelled()
+
+
+def test_iter_checks_streams_results():
+    mock_ep1 = MagicMock()
+    mock_ep1.name = "passing"
+    mock_ep1.value = "test.module:passing"
+    mock_ep1.load.return_value = mock_passing_check
+
+    mock_ep2 = MagicMock()
+    mock_ep2.name = "failing"
+    mock_ep2.value = "test.module:failing"
+    mock_ep2.load.return_value = mock_failing_check
+
+    with (
+        patch(
+            "rapids_cli.doctor.doctor.entry_points", return_value=[mock_ep1, mock_ep2]
+        ),
+        patch("rapids_cli.doctor.doctor.NvmlGpuInfo", FakeGpuInfo),
+        patch("rapids_cli.doctor.doctor.DefaultSystemInfo", MagicMock),
+    ):
+        results = iter_checks()
+        first = next(results)
+        assert (first.name, first.status) == ("mock_passing_check", True)
+        mock_ep2.load.assert_not_called()
+        results.close()
+        assert list(load_timings()) == ["test.module:passing"]
+
+        (result,) = iter_checks(["failing"])
+        assert isinstance(result.error, ValueError)
+
+
+def test_iter_checks_does_not_import_rich():
+    code = (
+        "import sys\n"
+        "from rapids_cli.doctor import iter_checks\n"
+        "assert not any(m.startswith('rich') for m in sys.modules)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def findings_check(verbose=False, findings=None, **kwargs):
+    """Check that reports findings of every severity."""
+    findings.info("Found 2 GPUs", metrics={"gpus": 2})
+    findings.perf_advice("Enable persistence mode", code="persistence-off")
+    findings.warn("Driver is old", code="old-driver")
+    findings.error("PCIe link degraded", code="pcie-link-degraded")
+    return "done"
+
+
+def test_run_checks_collects_findings(capsys):
+    (result,) = run_checks([_spec("findings", findings_check)])
+    assert result.status is False
+    assert result.error is None
+    assert [f.code for f in result.findings] == [
+        None,
+        "persistence-off",
+        "old-driver",
+        "pcie-link-degraded",
+    ]
+
+    assert report_results([result], verbose=True) is False
+    captured = capsys.readouterr().out
+    assert "findings_check: Found 2 GPUs" in captured
+    assert "Performance advice: Enable persistence mode" in captured
+    assert "Warning: Driver is old" in captured
+    assert "findings_check failed" in captured
+    assert "PCIe link degraded" in captured
+
+
+def test_run_checks_converts_warnings_to_findings():
+    (result,) = run_checks([_spec("warning", mock_warning_check)])
+    assert result.status is True
+    assert [(f.severity, f.message, f.code) for f in result.findings] == [
+        ("warn", "This is a warning", "UserWarning")
+    ]
+
+
+def findings_warning_check(verbose=False, findings=None, **kwargs):
+    """Check that takes findings but emits a Python warning."""
+    warnings.warn("Not recorded", stacklevel=2)
+    return True
+
+
+def test_run_checks_leaves_warnings_of_findings_checks_alone():
+    with pytest.warns(UserWarning, match="Not recorded"):
+        (result,) = run_checks([_spec("warning", findings_warning_check)])
+    assert result.status is True
+    assert result.findings == []
+    assert result.warnings is None
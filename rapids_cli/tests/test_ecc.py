@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import functools
+
+import pytest
+
+from rapids_cli.doctor.checks.ecc import (
+    RETIRED_PAGES_RMA_THRESHOLD,
+    check_gpu_memory_errors,
+)
+from rapids_cli.tests.fakes import FailingGpuInfo
+
+
+@pytest.fixture
+def make_device(make_device):
+    """Build GPUs with ECC enabled and no memory errors or repairs."""
+    return functools.partial(
+        make_device,
+        ecc_enabled=True,
+        ecc_corrected_volatile=0,
+        ecc_uncorrected_volatile=0,
+        ecc_corrected_aggregate=0,
+        ecc_uncorrected_aggregate=0,
+        remapped_rows_correctable=0,
+        remapped_rows_uncorrectable=0,
+        row_remap_pending=False,
+        row_remap_failed=False,
+    )
+
+
+def test_healthy(make_device, set_devices, run_with_findings):
+    gpu_info = set_devices(make_device(0))
+    assert run_with_findings(check_gpu_memory_errors, verbose=True) == (
+        "Memory errors checked on 1 GPU(s)",
+        [],
+    )
+    assert gpu_info.health_refreshes == 1
+
+
+def test_row_remap_failed(make_device, set_devices, run_with_findings):
+    set_devices(make_device(0, row_remap_failed=True))
+    result, (finding,) = run_with_findings(check_gpu_memory_errors)
+    assert result is True
+    assert (finding.severity, finding.code) == ("error", "gpu-row-remap-failed")
+
+
+def test_row_remap_pending(make_device, set_devices, run_with_findings):
+    set_devices(make_device(1, row_remap_pending=True, ecc_uncorrected_volatile=2))
+    _, (finding,) = run_with_findings(check_gpu_memory_errors)
+    assert (finding.severity, finding.code) == ("error", "gpu-reset-required")
+
+
+@pytest.mark.parametrize(
+    "counter, severity, code",
+    [
+        ("ecc_uncorrected_volatile", "error", "gpu-uncorrectable-ecc"),
+        ("ecc_uncorrected_aggregate", "info", "gpu-past-uncorrectable-ecc"),
+    ],
+)
+def test_uncorrectable_ecc(
+    make_device, set_devices, run_with_findings, counter, severity, code
+):
+    set_devices(make_device(0, **{counter: 3}))
+    _, (finding,) = run_with_findings(check_gpu_memory_errors)
+    assert (finding.severity, finding.code) == (severity, code)
+
+
+@pytest.mark.parametrize(
+    "sbe, dbe, pending, expected",
+    [
+        (2, 1, False, [("warn", "gpu-retired-pages")]),
+        (
+            RETIRED_PAGES_RMA_THRESHOLD,
+            0,
+            True,
+            [("error", "gpu-retired-pages-rma"), ("error", "gpu-reset-required")],
+        ),
+    ],
+)
+def test_retired_pages(
+    make_device, set_devices, run_with_findings, sbe, dbe, pending, expected
+):
+    # Pre-Ampere GPUs retire pages instead of remapping rows.
+    device = make_device(
+        0,
+        compute_capability=(7, 0),
+        remapped_rows_correctable=None,
+        remapped_rows_uncorrectable=None,
+        row_remap_pending=None,
+        row_remap_failed=None,
+        retired_pages_sbe=sbe,
+        retired_pages_dbe=dbe,
+        retired_pages_pending=pending,
+    )
+    set_devices(device)
+    _, findings = run_with_findings(check_gpu_memory_errors)
+    assert [(f.severity, f.code) for f in findings] == expected
+
+
+def test_ecc_disabled(make_device, set_devices, run_with_findings):
+    set_devices(make_device(0, ecc_enabled=False))
+    _, (finding,) = run_with_findings(check_gpu_memory_errors)
+    assert (finding.severity, finding.code) == ("info", "ecc-disabled")
+
+
+def test_no_data(make_device, set_devices, run_with_findings):
+    device = make_device(
+        0,
+        ecc_enabled=None,
+        remapped_rows_correctable=None,
+        remapped_rows_uncorrectable=None,
+        row_remap_pending=None,
+        row_remap_failed=None,
+    )
+    set_devices(device)
+    assert run_with_findings(check_gpu_memory_errors) == (False, [])
+
+
+def test_no_gpu(set_gpu_info):
+    set_gpu_info(FailingGpuInfo())
+    with pytest.raises(ValueError, match="GPU not found"):
+        check_gpu_memory_errors()
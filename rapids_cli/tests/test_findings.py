@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from rapids_cli.doctor.findings import Finding, FindingsCollector
+
+
+def test_collector_records_findings_in_order():
+    findings = FindingsCollector()
+    findings.info("a")
+    findings.warn("b", code="w")
+    findings.error("c", metrics={"n": 1})
+    findings.perf_advice("d")
+    assert [(f.severity, f.message) for f in findings.findings] == [
+        ("info", "a"),
+        ("warn", "b"),
+        ("error", "c"),
+        ("perf-advice", "d"),
+    ]
+    assert findings.findings[2].metrics == {"n": 1}
+
+
+def test_collector_rejects_unknown_severity():
+    with pytest.raises(ValueError, match="Unknown severity 'fatal'"):
+        FindingsCollector().add("fatal", "boom")  # type: ignore[arg-type]
+
+
+def test_finding_round_trip():
+    finding = Finding("warn", "Low ratio", code="ratio", metrics={"ratio": 1.5})
+    assert Finding.from_dict(finding.to_dict()) == finding
@@ -7,7 +7,8 @@ from rapids_cli.doctor.checks.gpu import (
     check_gpu_compute_capability,
     gpu_check,
 )
-from rapids_cli.hardware import DeviceInfo
+from rapids_cli.doctor.findings import FindingsCollector
+from rapids_cli.hardware import DeviceInfo, MigInstance
 from rapids_cli.tests.fakes import FailingGpuInfo, FakeGpuInfo
 
 
@@ -28,6 +29,38 @@ def test_gpu_check_nvml_error(set_gpu_info):
         gpu_check(verbose=False)
 
 
+def _mig_gpu(index, instances=()):
+    return DeviceInfo(
+        index=index,
+        compute_capability=(8, 0),
+        memory_total_bytes=40 * 1024**3,
+        uuid=f"GPU-{index}",
+        mig_enabled=True,
+        mig_instances=list(instances),
+    )
+
+
+def test_gpu_check_mig(set_gpu_info, monkeypatch):
+    monkeypatch.delenv("CUDA_VISIBLE_DEVICES", raising=False)
+    devices = [
+        _mig_gpu(0, [MigInstance(0, 5 * 1024**3), MigInstance(1, 5 * 1024**3)]),
+        _mig_gpu(1),
+    ]
+    set_gpu_info(FakeGpuInfo(device_count=2, devices=devices))
+    findings = FindingsCollector()
+    assert gpu_check(verbose=True, findings=findings) == (
+        "GPU(s) detected: 2, 2 in MIG mode with 2 visible MIG instance(s)"
+    )
+    (finding,) = findings.findings
+    assert (finding.code, finding.metrics["gpu"]) == ("mig-no-instances", 1)
+
+
+def test_gpu_check_mig_without_visible_instances(set_gpu_info):
+    set_gpu_info(FakeGpuInfo(device_count=1, devices=[_mig_gpu(0)]))
+    with pytest.raises(ValueError, match="no MIG instance is visible"):
+        gpu_check(verbose=False)
+
+
 def test_check_gpu_compute_capability_success(set_gpu_info):
     devices = [
         DeviceInfo(
@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from rapids_cli import gpudirect
+from rapids_cli.doctor.checks.gpudirect import check_gpudirect
+from rapids_cli.gpudirect import (
+    RdmaPort,
+    cufile_json_path,
+    gds_compat_mode_allowed,
+    loaded_modules,
+    rdma_ports,
+    read_cufile_json,
+)
+
+CUFILE_JSON = """\
+{
+    // cuFile configuration
+    "logging": {"level": "ERROR"},
+    "properties": {
+        // fail instead of falling back to POSIX I/O
+        "allow_compat_mode": false
+    }
+}
+"""
+
+
+class FakeHost:
+    """Fixture filesystem for /proc/modules, /sys/class/infiniband and cufile.json."""
+
+    def __init__(self, root):
+        self.root = root
+        self.modules = root / "modules"
+        self.infiniband = root / "infiniband"
+        self.cufile = root / "cufile.json"
+        self.modules.write_text("")
+        self.infiniband.mkdir()
+
+    def load(self, *modules):
+        self.modules.write_text(
+            "".join(f"{name} 98304 0 - Live 0x0000000000000000\n" for name in modules)
+        )
+
+    def add_port(self, device, port, link_layer="InfiniBand", state="4: ACTIVE"):
+        path = self.infiniband / device / "ports" / str(port)
+        path.mkdir(parents=True)
+        (path / "link_layer").write_text(f"{link_layer}\n")
+        (path / "state").write_text(f"{state}\n")
+
+
+@pytest.fixture
+def host(monkeypatch, tmp_path):
+    host = FakeHost(tmp_path)
+    monkeypatch.setattr(gpudirect, "PROC_MODULES", host.modules)
+    monkeypatch.setattr(gpudirect, "INFINIBAND_CLASS", host.infiniband)
+    monkeypatch.setattr(gpudirect, "CUFILE_JSON", host.cufile)
+    monkeypatch.delenv("CUFILE_ENV_PATH_JSON", raising=False)
+    return host
+
+
+def test_loaded_modules(host):
+    host.load("nvidia", "nvidia_fs")
+    assert loaded_modules() == {"nvidia", "nvidia_fs"}
+    assert loaded_modules(host.root / "missing") == set()
+
+
+def test_rdma_ports(host):
+    host.add_port("mlx5_1", 1, link_layer="Ethernet", state="1: DOWN")
+    host.add_port("mlx5_0", 1)
+    assert rdma_ports() == [
+        RdmaPort("mlx5_0", 1, "InfiniBand", "ACTIVE"),
+        RdmaPort("mlx5_1", 1, "Ethernet", "DOWN"),
+    ]
+
+
+def test_read_cufile_json(host, monkeypatch):
+    assert read_cufile_json() is None
+    host.cufile.write_text(CUFILE_JSON)
+    config = read_cufile_json()
+    assert config["logging"] == {"level": "ERROR"}
+    assert gds_compat_mode_allowed(config) is False
+    assert gds_compat_mode_allowed({}) is True
+
+    custom = host.root / "custom.json"
+    custom.write_text("[]")
+    monkeypatch.setenv("CUFILE_ENV_PATH_JSON", str(custom))
+    assert cufile_json_path() == custom
+    with pytest.raises(ValueError, match="JSON object"):
+        read_cufile_json()
+
+
+def test_check_gpudirect_ready(host, run_with_findings):
+    host.load("nvidia", "nvidia_peermem", "nvidia_fs")
+    host.add_port("mlx5_0", 1)
+    host.cufile.write_text(CUFILE_JSON)
+    assert run_with_findings(check_gpudirect, verbose=True, by_code=True) == (
+        "GPUDirect checked: 1 active RDMA port(s), nvidia_fs loaded",
+        {},
+    )
+
+
+def test_check_gpudirect_single_node(host, run_with_findings):
+    result, findings = run_with_findings(check_gpudirect, by_code=True)
+    assert result is True
+    assert findings["no-rdma-devices"].severity == "info"
+    assert findings["gpudirect-storage-unavailable"].severity == "info"
+
+
+def test_check_gpudirect_missing_modules(host, run_with_findings):
+    host.add_port("mlx5_0", 1, state="1: DOWN")
+    host.cufile.write_text("{}")
+    _, findings = run_with_findings(check_gpudirect, by_code=True)
+    assert findings["rdma-ports-down"].severity == "warn"
+    rdma = findings["gpudirect-rdma-unavailable"]
+    assert rdma.severity == "perf-advice"
+    assert "modprobe nvidia_peermem" in rdma.message
+    assert rdma.metrics == {"adapters": ["mlx5_0"], "active_ports": []}
+    assert findings["gpudirect-storage-unavailable"].severity == "perf-advice"
+
+
+def test_check_gpudirect_compat_mode_and_invalid_config(host, run_with_findings):
+    host.load("nvidia_fs")
+    host.cufile.write_text('{"properties": {"allow_compat_mode": true}}')
+    _, findings = run_with_findings(check_gpudirect, by_code=True)
+    assert findings["gds-compat-mode-allowed"].severity == "info"
+
+    host.cufile.write_text("{not json")
+    _, findings = run_with_findings(check_gpudirect, by_code=True)
+    assert findings["cufile-json-invalid"].severity == "warn"
+    assert "gds-compat-mode-allowed" not in findings
@@ -1,17 +1,37 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
+import os
+import pickle
+import resource
+import threading
 from unittest.mock import MagicMock, patch
 
 import pynvml
 import pytest
 
+from rapids_cli import cgroup
 from rapids_cli.hardware import (
+    DEFAULT_PROBE_TIMEOUT,
     DefaultSystemInfo,
     DeviceInfo,
     GpuInfoProvider,
+    GpuInfoSnapshot,
+    GpuProcess,
     HardwareInfoError,
+    MigInstance,
+    NvLinkRemote,
     NvmlGpuInfo,
+    ProcessSystemInfo,
+    SelectedGpuInfo,
     SystemInfoProvider,
+    SystemInfoSnapshot,
+    cuda_visible_devices,
+    ordinals_in_pci_bus_order,
+    probe_timeout,
+    resolve_devices,
+    sysfs_pci_address,
+    usable_memory_bytes,
+    visible_mig_instances,
 )
 from rapids_cli.tests.fakes import (
     FailingGpuInfo,
@@ -84,6 +104,45 @@ def test_nvml_gpu_info_device_data():
         assert gpu_info.driver_version == "560.10"
 
 
+def test_nvml_gpu_info_pcie_link():
+    mock_handle = MagicMock()
+    mock_memory = MagicMock()
+    mock_memory.total = 24 * 1024**3
+
+    with (
+        patch("pynvml.nvmlInit"),
+        patch("pynvml.nvmlDeviceGetCount", return_value=1),
+        patch("pynvml.nvmlSystemGetCudaDriverVersion", return_value=12060),
+        patch("pynvml.nvmlSystemGetDriverVersion", return_value="560.10"),
+        patch("pynvml.nvmlDeviceGetHandleByIndex", return_value=mock_handle),
+        patch("pynvml.nvmlDeviceGetCudaComputeCapability", return_value=(9, 0)),
+        patch("pynvml.nvmlDeviceGetMemoryInfo", return_value=mock_memory),
+        patch(
+            "pynvml.nvmlDeviceGetNvLinkState", side_effect=pynvml.NVMLError_NotSupported
+        ),
+        patch("pynvml.nvmlDeviceGetCurrPcieLinkGeneration", return_value=3),
+        patch("pynvml.nvmlDeviceGetMaxPcieLinkGeneration", return_value=4),
+        patch("pynvml.nvmlDeviceGetCurrPcieLinkWidth", return_value=8),
+        patch(
+            "pynvml.nvmlDeviceGetMaxPcieLinkWidth",
+            side_effect=pynvml.NVMLError_NotSupported,
+        ),
+        patch(
+            "pynvml.nvmlDeviceGetPciInfo",
+            return_value=MagicMock(busId="00000000:3B:00.0"),
+        ),
+        patch("pynvml.nvmlDeviceGetName", return_value="NVIDIA H100 80GB HBM3"),
+        patch("pynvml.nvmlDeviceGetUUID", return_value="GPU-2f0b"),
+    ):
+        (device,) = NvmlGpuInfo().devices
+        assert device.pci_bus_id == "0000:3b:00.0"
+        assert (device.name, device.uuid) == ("NVIDIA H100 80GB HBM3", "GPU-2f0b")
+        assert device.pcie_link_generation == 3
+        assert device.pcie_max_link_generation == 4
+        assert device.pcie_link_width == 8
+        assert device.pcie_max_link_width is None
+
+
 def test_nvml_gpu_info_nvlink_states():
     mock_handle = MagicMock()
     mock_memory = MagicMock()
@@ -103,9 +162,27 @@ def test_nvml_gpu_info_nvlink_states():
         patch("pynvml.nvmlDeviceGetCudaComputeCapability", return_value=(7, 5)),
         patch("pynvml.nvmlDeviceGetMemoryInfo", return_value=mock_memory),
         patch("pynvml.nvmlDeviceGetNvLinkState", side_effect=nvlink_side_effect),
+        patch(
+            "pynvml.nvmlDeviceGetNvLinkRemotePciInfo",
+            side_effect=[
+                MagicMock(busId="00000000:C1:00.0"),
+                pynvml.NVMLError_NotSupported(),
+            ],
+        ),
+        patch(
+            "pynvml.nvmlDeviceGetNvLinkRemoteDeviceType",
+            side_effect=[
+                pynvml.NVML_NVLINK_DEVICE_TYPE_SWITCH,
+                pynvml.NVMLError_NotSupported(),
+            ],
+        ),
     ):
         gpu_info = NvmlGpuInfo()
         assert gpu_info.devices[0].nvlink_states == [True, True]
+        assert gpu_info.devices[0].nvlink_remotes == {
+            0: NvLinkRemote(pci_bus_id="0000:c1:00.0", device_type="switch"),
+            1: NvLinkRemote(pci_bus_id=None, device_type="unknown"),
+        }
 
 
 def test_nvml_gpu_info_no_nvlink():
@@ -149,6 +226,50 @@ def test_default_system_info_cuda_runtime_path():
         assert sys_info.cuda_runtime_path == "/usr/local/cuda/include"
 
 
+def test_default_system_info_cgroup_limits(tmp_path, monkeypatch):
+    monkeypatch.setattr(cgroup, "PROC_SELF_CGROUP", tmp_path / "missing")
+    (tmp_path / "cgroup.controllers").write_text("cpu memory\n")
+    (tmp_path / "memory.max").write_text(f"{16 * 1024**3}\n")
+    (tmp_path / "cpu.max").write_text("400000 100000\n")
+    sys_info = DefaultSystemInfo(cgroup_root=tmp_path)
+    assert sys_info.memory_limit_bytes == 16 * 1024**3
+    assert sys_info.cpu_limit == 4.0
+
+
+def test_process_system_info(tmp_path, monkeypatch):
+    monkeypatch.setattr(cgroup, "CGROUP_ROOT", tmp_path)
+    (tmp_path / "cgroup.controllers").write_text("cpu memory\n")
+    (tmp_path / "memory.max").write_text(f"{16 * 1024**3}\n")
+    provider = FakeSystemInfo(
+        total_memory_bytes=64, cuda_runtime_path="/cuda", mps_pipe_directory="/mps"
+    )
+    with (
+        patch("os.sched_getaffinity", return_value={2, 3}, create=True) as affinity,
+        patch("resource.prlimit", return_value=(65536, 65536)) as prlimit,
+    ):
+        sys_info = ProcessSystemInfo(provider, os.getpid())
+        assert isinstance(sys_info, SystemInfoProvider)
+        assert sys_info.total_memory_bytes == 64
+        assert sys_info.cuda_runtime_path == "/cuda"
+        assert sys_info.mps_pipe_directory == "/mps"
+        assert sys_info.memory_limit_bytes == 16 * 1024**3
+        assert sys_info.cpu_limit is None
+        assert sys_info.cpu_affinity == {2, 3}
+        assert sys_info.memlock_limits == (65536, 65536)
+    affinity.assert_called_with(os.getpid())
+    prlimit.assert_called_with(os.getpid(), resource.RLIMIT_MEMLOCK)
+
+
+def test_default_system_info_mps_pipe_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("CUDA_MPS_PIPE_DIRECTORY", str(tmp_path))
+    sys_info = DefaultSystemInfo()
+    assert sys_info.mps_pipe_directory is None
+    (tmp_path / "control").touch()
+    assert sys_info.mps_pipe_directory == str(tmp_path)
+    (tmp_path / "control").unlink()
+    assert sys_info.mps_pipe_directory is None
+
+
 def test_default_system_info_caches():
     mock_vm = MagicMock()
     mock_vm.total = 64 * 1024**3
@@ -196,6 +317,9 @@ def test_fake_system_info_defaults():
     fake = FakeSystemInfo()
     assert fake.total_memory_bytes == 0
     assert fake.cuda_runtime_path is None
+    assert fake.memory_limit_bytes is None
+    assert fake.cpu_limit is None
+    assert fake.mps_pipe_directory is None
 
 
 def test_fake_system_info_satisfies_protocol():
@@ -236,3 +360,736 @@ def test_failing_system_info_total_memory():
 def test_failing_system_info_cuda_runtime_path():
     with pytest.raises(HardwareInfoError, match="System info unavailable"):
         _ = FailingSystemInfo().cuda_runtime_path
+
+
+def test_failing_system_info_limits():
+    with pytest.raises(HardwareInfoError, match="System info unavailable"):
+        _ = FailingSystemInfo().memory_limit_bytes
+    with pytest.raises(HardwareInfoError, match="System info unavailable"):
+        _ = FailingSystemInfo().cpu_limit
+    with pytest.raises(HardwareInfoError, match="System info unavailable"):
+        _ = FailingSystemInfo().mps_pipe_directory
+
+
+# --- Watchdog tests ---
+
+
+def test_nvml_gpu_info_times_out_on_wedged_driver():
+    release = threading.Event()
+    with patch("pynvml.nvmlInit", side_effect=lambda: release.wait()) as mock_init:
+        gpu_info = NvmlGpuInfo(timeout=0.05)
+        with pytest.raises(HardwareInfoError, match="timed out after 0.05s"):
+            _ = gpu_info.device_count
+        # Later accesses fail fast without touching the wedged driver again.
+        with pytest.raises(HardwareInfoError, match="timed out"):
+            _ = gpu_info.devices
+        mock_init.assert_called_once()
+    release.set()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, DEFAULT_PROBE_TIMEOUT),
+        ("2.5", 2.5),
+        ("0", None),
+        ("-1", None),
+        ("soon", DEFAULT_PROBE_TIMEOUT),
+    ],
+)
+def test_probe_timeout(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv("RAPIDS_CLI_PROBE_TIMEOUT", raising=False)
+    else:
+        monkeypatch.setenv("RAPIDS_CLI_PROBE_TIMEOUT", value)
+    assert probe_timeout() == expected
+
+
+def test_nvml_gpu_info_default_timeout(monkeypatch):
+    monkeypatch.setenv("RAPIDS_CLI_PROBE_TIMEOUT", "7")
+    assert NvmlGpuInfo()._timeout == 7.0
+
+
+# --- Snapshot tests ---
+
+
+def test_gpu_info_snapshot_copies_fields():
+    devices = [
+        DeviceInfo(index=0, compute_capability=(8, 0), memory_total_bytes=32 * 1024**3)
+    ]
+    snapshot = pickle.loads(
+        pickle.dumps(
+            GpuInfoSnapshot(
+                FakeGpuInfo(
+                    device_count=1,
+                    devices=devices,
+                    cuda_driver_version=12040,
+                    driver_version="550.0",
+                )
+            )
+        )
+    )
+    assert isinstance(snapshot, GpuInfoProvider)
+    assert snapshot.device_count == 1
+    assert snapshot.devices == devices
+    assert snapshot.cuda_driver_version == 12040
+    assert snapshot.driver_version == "550.0"
+    # A snapshot keeps what it was taken with.
+    snapshot.refresh_usage()
+    snapshot.refresh_health()
+    assert snapshot.devices == devices
+
+
+def test_gpu_info_snapshot_preserves_errors():
+    snapshot = pickle.loads(pickle.dumps(GpuInfoSnapshot(FailingGpuInfo())))
+    with pytest.raises(HardwareInfoError, match="No GPU available"):
+        _ = snapshot.device_count
+
+
+def test_system_info_snapshot():
+    snapshot = SystemInfoSnapshot(
+        FakeSystemInfo(
+            total_memory_bytes=64,
+            cuda_runtime_path="/cuda",
+            memory_limit_bytes=32,
+            cpu_limit=1.5,
+            cpu_affinity={0, 1},
+            memlock_limits=(65536, None),
+            mps_pipe_directory="/tmp/nvidia-mps",
+        )
+    )
+    assert snapshot.total_memory_bytes == 64
+    assert snapshot.cuda_runtime_path == "/cuda"
+    assert (snapshot.memory_limit_bytes, snapshot.cpu_limit) == (32, 1.5)
+    assert snapshot.cpu_affinity == {0, 1}
+    assert snapshot.memlock_limits == (65536, None)
+    assert snapshot.mps_pipe_directory == "/tmp/nvidia-mps"
+    with pytest.raises(HardwareInfoError, match="System info unavailable"):
+        _ = SystemInfoSnapshot(FailingSystemInfo()).total_memory_bytes
+
+
+def test_nvml_gpu_info_clocks_and_power():
+    mock_handle = MagicMock()
+    mock_memory = MagicMock()
+    mock_memory.total = 80 * 1024**3
+    clocks = {pynvml.NVML_CLOCK_SM: 1200, pynvml.NVML_CLOCK_MEM: 1593}
+
+    with (
+        patch("pynvml.nvmlInit"),
+        patch("pynvml.nvmlDeviceGetCount", return_value=1),
+        patch("pynvml.nvmlSystemGetCudaDriverVersion", return_value=12060),
+        patch("pynvml.nvmlSystemGetDriverVersion", return_value="560.10"),
+        patch("pynvml.nvmlDeviceGetHandleByIndex", return_value=mock_handle),
+        patch("pynvml.nvmlDeviceGetCudaComputeCapability", return_value=(8, 0)),
+        patch("pynvml.nvmlDeviceGetMemoryInfo", return_value=mock_memory),
+        patch(
+            "pynvml.nvmlDeviceGetNvLinkState", side_effect=pynvml.NVMLError_NotSupported
+        ),
+        patch("pynvml.nvmlDeviceGetCurrentClocksThrottleReasons", return_value=0x24),
+        patch(
+            "pynvml.nvmlDeviceGetClockInfo",
+            side_effect=lambda handle, kind: clocks[kind],
+        ),
+        patch("pynvml.nvmlDeviceGetMaxClockInfo", return_value=1410),
+        patch(
+            "pynvml.nvmlDeviceGetApplicationsClock",
+            side_effect=pynvml.NVMLError_NotSupported,
+        ),
+        patch("pynvml.nvmlDeviceGetDefaultApplicationsClock", return_value=1410),
+        patch("pynvml.nvmlDeviceGetPowerManagementLimit", return_value=300000),
+        patch("pynvml.nvmlDeviceGetPowerManagementDefaultLimit", return_value=400000),
+        patch("pynvml.nvmlDeviceGetTemperature", return_value=84),
+    ):
+        (device,) = NvmlGpuInfo().devices
+        assert device.clock_event_reasons == 0x24
+        assert (device.sm_clock_mhz, device.memory_clock_mhz) == (1200, 1593)
+        assert device.sm_max_clock_mhz == 1410
+        assert device.sm_application_clock_mhz is None
+        assert device.sm_default_application_clock_mhz == 1410
+        assert (device.power_limit_mw, device.default_power_limit_mw) == (
+            300000,
+            400000,
+        )
+        assert device.temperature_c == 84
+
+
+@pytest.mark.parametrize(
+    "bus_id", ["00000000:3B:00.0", b"00000000:3B:00.0", "0000:3b:00.0", "3B:00.0"]
+)
+def test_sysfs_pci_address(bus_id):
+    assert sysfs_pci_address(bus_id) == "0000:3b:00.0"
+
+
+def test_nvml_gpu_info_usage_and_processes():
+    mock_handle = MagicMock()
+    mock_memory = MagicMock(total=80 * 1024**3, used=30 * 1024**3, free=50 * 1024**3)
+    processes = [
+        MagicMock(pid=4242, usedGpuMemory=20 * 1024**3),
+        MagicMock(pid=99, usedGpuMemory=None),
+    ]
+
+    def process_name(pid):
+        if pid == 99:
+            raise pynvml.NVMLError_NotFound()
+        return b"python"
+
+    with (
+        patch("pynvml.nvmlInit"),
+        patch("pynvml.nvmlDeviceGetCount", return_value=1),
+        patch("pynvml.nvmlSystemGetCudaDriverVersion", return_value=12060),
+        patch("pynvml.nvmlSystemGetDriverVersion", return_value="560.10"),
+        patch("pynvml.nvmlDeviceGetHandleByIndex", return_value=mock_handle),
+        patch("pynvml.nvmlDeviceGetCudaComputeCapability", return_value=(8, 0)),
+        patch("pynvml.nvmlDeviceGetMemoryInfo", return_value=mock_memory),
+        patch(
+            "pynvml.nvmlDeviceGetNvLinkState", side_effect=pynvml.NVMLError_NotSupported
+        ),
+        patch(
+            "pynvml.nvmlDeviceGetUtilizationRates",
+            return_value=MagicMock(gpu=97, memory=40),
+        ),
+        patch("pynvml.nvmlDeviceGetComputeRunningProcesses", return_value=processes),
+        patch("pynvml.nvmlSystemGetProcessName", side_effect=process_name),
+    ):
+        (device,) = NvmlGpuInfo().devices
+        assert (device.memory_used_bytes, device.memory_free_bytes) == (
+            30 * 1024**3,
+            50 * 1024**3,
+        )
+        assert device.gpu_utilization_percent == 97
+        assert device.memory_utilization_percent == 40
+        assert device.processes == [
+            GpuProcess(pid=4242, name="python", used_memory_bytes=20 * 1024**3),
+            GpuProcess(pid=99),
+        ]
+
+
+def test_nvml_gpu_info_refresh_usage():
+    mock_memory = MagicMock(total=80 * 1024**3, used=0, free=80 * 1024**3)
+    with (
+        patch("pynvml.nvmlInit"),
+        patch("pynvml.nvmlDeviceGetCount", return_value=1),
+        patch("pynvml.nvmlSystemGetCudaDriverVersion", return_value=12060),
+        patch("pynvml.nvmlSystemGetDriverVersion", return_value="560.10"),
+        patch("pynvml.nvmlDeviceGetHandleByIndex", return_value=MagicMock()),
+        patch("pynvml.nvmlDeviceGetCudaComputeCapability", return_value=(8, 0)),
+        patch("pynvml.nvmlDeviceGetMemoryInfo", return_value=mock_memory),
+        patch(
+            "pynvml.nvmlDeviceGetNvLinkState", side_effect=pynvml.NVMLError_NotSupported
+        ) as nvlink_state,
+        patch("pynvml.nvmlDeviceGetComputeRunningProcesses", return_value=[]),
+        patch(
+            "pynvml.nvmlDeviceGetCurrentClocksThrottleReasons", return_value=0
+        ) as reasons,
+        patch("pynvml.nvmlDeviceGetClockInfo", return_value=1410) as clock,
+        patch(
+            "pynvml.nvmlDeviceGetCurrPcieLinkGeneration", return_value=1
+        ) as generation,
+        patch("pynvml.nvmlDeviceGetComputeMode", return_value=0) as compute_mode,
+    ):
+        gpu_info = NvmlGpuInfo()
+        gpu_info.refresh_usage()
+        assert gpu_info.devices[0].memory_free_bytes == 80 * 1024**3
+        assert gpu_info.devices[0].clock_event_reasons == 0
+        nvlink_queries = nvlink_state.call_count
+
+        mock_memory.used, mock_memory.free = 60 * 1024**3, 20 * 1024**3
+        reasons.return_value, clock.return_value = 0x20, 900
+        generation.return_value = 4
+        compute_mode.return_value = 3
+        gpu_info.refresh_usage()
+        assert gpu_info.devices[0].memory_free_bytes == 20 * 1024**3
+        assert gpu_info.devices[0].memory_used_bytes == 60 * 1024**3
+        assert gpu_info.devices[0].clock_event_reasons == 0x20
+        assert gpu_info.devices[0].sm_clock_mhz == 900
+        assert gpu_info.devices[0].pcie_link_generation == 4
+        assert gpu_info.devices[0].compute_mode == "exclusive_process"
+        # Links are not re-enumerated.
+        assert nvlink_state.call_count == nvlink_queries
+
+
+def _two_gpus():
+    return FakeGpuInfo(
+        device_count=2,
+        devices=[
+            DeviceInfo(
+                0,
+                (8, 0),
+                16 * 1024**3,
+                pci_bus_id="0000:b1:00.0",
+                uuid="GPU-aaaa",
+                mig_instances=[MigInstance(0, 5 * 1024**3, uuid="MIG-cccc")],
+            ),
+            DeviceInfo(
+                1, (8, 0), 16 * 1024**3, pci_bus_id="0000:3b:00.0", uuid="GPU-bbbb"
+            ),
+        ],
+    )
+
+
+def test_selected_gpu_info():
+    provider = _two_gpus()
+    selected = SelectedGpuInfo(provider, ["GPU-aa"])
+    assert isinstance(selected, GpuInfoProvider)
+    assert selected.device_count == 1
+    assert [dev.index for dev in selected.devices] == [0]
+    assert selected.cuda_driver_version == provider.cuda_driver_version
+    assert selected.driver_version == provider.driver_version
+    selected.refresh_usage()
+    assert provider.usage_refreshes == 1
+    selected.refresh_health()
+    assert provider.health_refreshes == 1
+
+
+def test_selected_gpu_info_mig_instances():
+    provider = _two_gpus()
+    provider.devices[0].mig_instances.append(
+        MigInstance(1, 5 * 1024**3, uuid="MIG-dddd")
+    )
+    (device,) = SelectedGpuInfo(provider, ["MIG-dddd"]).devices
+    assert [mig.uuid for mig in device.mig_instances] == ["MIG-dddd"]
+    # The provider's own device keeps all of its instances.
+    assert len(provider.devices[0].mig_instances) == 2
+    (device,) = SelectedGpuInfo(provider, ["GPU-aaaa"]).devices
+    assert device is provider.devices[0]
+
+
+def test_selected_gpu_info_missing_device():
+    assert [dev.index for dev in SelectedGpuInfo(_two_gpus(), ["0", "3"]).devices] == [
+        1
+    ]
+    selected = SelectedGpuInfo(_two_gpus(), ["0", "3"], strict=True)
+    with pytest.raises(HardwareInfoError, match="No single GPU matches '3'"):
+        _ = selected.devices
+
+
+@pytest.mark.parametrize(
+    "entries, expected",
+    [
+        # Ordinals count GPUs in PCI bus id order, not NVML index order.
+        (["0", "1"], [1, 0]),
+        (["GPU-bbbb", "1"], [1, 0]),
+        (["MIG-cccc"], [0]),
+        (["MIG-GPU-aaaa/1/0"], [0]),
+        (["1", "1"], [0]),
+        # Like CUDA, selection stops at the first entry matching no GPU.
+        (["1", "-1", "0"], [0]),
+        (["GPU-"], []),
+        ([], []),
+    ],
+)
+def test_resolve_devices(entries, expected):
+    gpus = [(0, "0000:b1:00.0", "GPU-aaaa"), (1, "0000:3b:00.0", "GPU-bbbb")]
+    assert resolve_devices(entries, gpus, {"MIG-cccc": 0}) == expected
+
+
+def test_resolve_devices_in_unknown_order():
+    gpus = [(0, "0000:b1:00.0", "GPU-aaaa"), (1, "0000:3b:00.0", "GPU-bbbb")]
+    assert resolve_devices(["GPU-bbbb", "0"], gpus, pci_bus_order=False) == [1]
+    with pytest.raises(HardwareInfoError, match="ordinal '0' is ambiguous"):
+        resolve_devices(["0"], gpus, strict=True, pci_bus_order=False)
+
+
+@pytest.mark.parametrize(
+    "device_order, models, expected",
+    [
+        ("PCI_BUS_ID", ["A100", "H100"], True),
+        (None, ["A100", "A100"], True),
+        (None, ["A100", "H100"], False),
+        ("FASTEST_FIRST", ["A100", "H100"], False),
+    ],
+)
+def test_ordinals_in_pci_bus_order(monkeypatch, device_order, models, expected):
+    if device_order is None:
+        monkeypatch.delenv("CUDA_DEVICE_ORDER", raising=False)
+    else:
+        monkeypatch.setenv("CUDA_DEVICE_ORDER", device_order)
+    assert ordinals_in_pci_bus_order(models) is expected
+
+
+def test_selected_gpu_info_follows_cuda_device_order(monkeypatch):
+    # NVML numbers GPUs differently from their PCI bus id order, and the
+    # models differ, so CUDA's default order is unknown.
+    provider = _two_gpus()
+    provider.devices[0].name, provider.devices[1].name = "H100", "A100"
+    monkeypatch.setenv("CUDA_DEVICE_ORDER", "PCI_BUS_ID")
+    assert [dev.index for dev in SelectedGpuInfo(provider, ["0", "1"]).devices] == [
+        1,
+        0,
+    ]
+    monkeypatch.delenv("CUDA_DEVICE_ORDER")
+    with pytest.raises(HardwareInfoError, match="CUDA_DEVICE_ORDER=PCI_BUS_ID"):
+        _ = SelectedGpuInfo(provider, ["0"], strict=True).devices
+    assert [dev.index for dev in SelectedGpuInfo(provider, ["GPU-aa"]).devices] == [0]
+
+
+@pytest.mark.parametrize(
+    "value, expected", [(None, None), ("", []), (" 0, 2", ["0", "2"])]
+)
+def test_cuda_visible_devices(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv("CUDA_VISIBLE_DEVICES", raising=False)
+    else:
+        monkeypatch.setenv("CUDA_VISIBLE_DEVICES", value)
+    assert cuda_visible_devices() == expected
+
+
+def test_nvml_gpu_info_loads_only_selected_devices():
+    handles = [MagicMock(name=f"gpu{i}") for i in range(4)]
+    bus_ids = ["0000:3b:00.0", "0000:5e:00.0", "0000:86:00.0", "0000:af:00.0"]
+    mig = MagicMock(name="mig")
+
+    def handle_by_index(i):
+        return handles[i]
+
+    def pci_info(handle):
+        return MagicMock(busId=bus_ids[handles.index(handle)].upper())
+
+    def uuid(handle):
+        return f"GPU-{handles.index(handle)}"
+
+    with (
+        patch("pynvml.nvmlInit"),
+        patch("pynvml.nvmlDeviceGetCount", return_value=4),
+        patch("pynvml.nvmlSystemGetCudaDriverVersion", return_value=12060),
+        patch("pynvml.nvmlSystemGetDriverVersion", return_value="560.10"),
+        patch(
+            "pynvml.nvmlDeviceGetHandleByIndex", side_effect=handle_by_index
+        ) as by_index,
+        patch("pynvml.nvmlDeviceGetPciInfo", side_effect=pci_info),
+        patch("pynvml.nvmlDeviceGetUUID", side_effect=uuid),
+        patch("pynvml.nvmlDeviceGetHandleByUUID", return_value=mig),
+        patch(
+            "pynvml.nvmlDeviceGetDeviceHandleFromMigDeviceHandle",
+            return_value=handles[2],
+        ),
+        patch("pynvml.nvmlDeviceGetIndex", return_value=2),
+        patch("pynvml.nvmlDeviceGetCudaComputeCapability", return_value=(8, 0)),
+        patch(
+            "pynvml.nvmlDeviceGetMemoryInfo",
+            return_value=MagicMock(total=40 * 1024**3),
+        ),
+        patch(
+            "pynvml.nvmlDeviceGetNvLinkState", side_effect=pynvml.NVMLError_NotSupported
+        ) as nvlink_state,
+    ):
+        gpu_info = NvmlGpuInfo(devices=["3", "MIG-abcd", "bogus", "0"])
+        assert gpu_info.device_count == 2
+        assert [dev.index for dev in gpu_info.devices] == [3, 2]
+        assert [dev.pci_bus_id for dev in gpu_info.devices] == [bus_ids[3], bus_ids[2]]
+        # Only the selected devices are loaded beyond their identity.
+        assert {call.args[0] for call in nvlink_state.call_args_list} == {
+            handles[3],
+            handles[2],
+        }
+        assert by_index.call_count == 4 + 2
+
+        with pytest.raises(HardwareInfoError, match="No single GPU matches 'bogus'"):
+            _ = NvmlGpuInfo(devices=["bogus"], strict=True).devices
+
+
+def test_nvml_gpu_info_mig_instances():
+    parent, mig = MagicMock(name="parent"), MagicMock(name="mig")
+    attributes = MagicMock(
+        multiprocessorCount=14,
+        gpuInstanceSliceCount=1,
+        computeInstanceSliceCount=1,
+        memorySizeMB=4864,
+    )
+
+    def mig_handle(handle, index):
+        if index != 0:
+            raise pynvml.NVMLError_NotFound()
+        return mig
+
+    def memory_info(handle):
+        if handle is mig:
+            raise pynvml.NVMLError_NotSupported()
+        return MagicMock(total=40 * 1024**3)
+
+    with (
+        patch("pynvml.nvmlInit"),
+        patch("pynvml.nvmlDeviceGetCount", return_value=1),
+        patch("pynvml.nvmlSystemGetCudaDriverVersion", return_value=12060),
+        patch("pynvml.nvmlSystemGetDriverVersion", return_value="560.10"),
+        patch("pynvml.nvmlDeviceGetHandleByIndex", return_value=parent),
+        patch("pynvml.nvmlDeviceGetCudaComputeCapability", return_value=(8, 0)),
+        patch("pynvml.nvmlDeviceGetMemoryInfo", side_effect=memory_info),
+        patch(
+            "pynvml.nvmlDeviceGetNvLinkState", side_effect=pynvml.NVMLError_NotSupported
+        ),
+        patch("pynvml.nvmlDeviceGetMigMode", return_value=[1, 1]),
+        patch("pynvml.nvmlDeviceGetMaxMigDeviceCount", return_value=7),
+        patch("pynvml.nvmlDeviceGetMigDeviceHandleByIndex", side_effect=mig_handle),
+        patch("pynvml.nvmlDeviceGetAttributes", return_value=attributes),
+        patch("pynvml.nvmlDeviceGetUUID", return_value="MIG-1234"),
+        patch("pynvml.nvmlDeviceGetGpuInstanceId", return_value=7),
+        patch("pynvml.nvmlDeviceGetComputeInstanceId", return_value=0),
+        patch("pynvml.nvmlDeviceGetComputeRunningProcesses", return_value=[]),
+    ):
+        gpu_info = NvmlGpuInfo()
+        (device,) = gpu_info.devices
+        assert device.mig_enabled is True
+        (instance,) = device.mig_instances
+        assert instance.memory_free_bytes is None
+        assert instance.index == 0
+        assert instance.uuid == "MIG-1234"
+        assert instance.memory_total_bytes == 4864 * 1024**2
+        assert (instance.gpu_instance_id, instance.compute_instance_id) == (7, 0)
+        assert instance.multiprocessor_count == 14
+        assert instance.gpu_instance_slice_count == 1
+
+        # Refreshing re-reads the memory and processes of each instance.
+        mig_memory = MagicMock(total=5 * 1024**3, used=3 * 1024**3, free=2 * 1024**3)
+        process = MagicMock(pid=4242, usedGpuMemory=3 * 1024**3)
+        with (
+            patch(
+                "pynvml.nvmlDeviceGetMemoryInfo",
+                side_effect=lambda h: mig_memory if h is mig else memory_info(h),
+            ),
+            patch(
+                "pynvml.nvmlDeviceGetComputeRunningProcesses",
+                side_effect=lambda h: [process] if h is mig else [],
+            ),
+            patch("pynvml.nvmlSystemGetProcessName", return_value="python"),
+        ):
+            gpu_info.refresh_usage()
+        assert instance.memory_free_bytes == 2 * 1024**3
+        assert instance.memory_used_bytes == 3 * 1024**3
+        assert instance.processes == [
+            GpuProcess(pid=4242, name="python", used_memory_bytes=3 * 1024**3)
+        ]
+        assert device.processes == []
+
+
+def test_nvml_gpu_info_keeps_only_selected_mig_instances():
+    parent = MagicMock(name="parent")
+    instances = [
+        MigInstance(0, 5 * 1024**3, uuid="MIG-a"),
+        MigInstance(1, 5 * 1024**3, uuid="MIG-b"),
+    ]
+    with (
+        patch("pynvml.nvmlInit"),
+        patch("pynvml.nvmlDeviceGetCount", return_value=1),
+        patch("pynvml.nvmlSystemGetCudaDriverVersion", return_value=12060),
+        patch("pynvml.nvmlSystemGetDriverVersion", return_value="560.10"),
+        patch("pynvml.nvmlDeviceGetHandleByIndex", return_value=parent),
+        patch("pynvml.nvmlDeviceGetUUID", return_value="GPU-0"),
+        patch("pynvml.nvmlDeviceGetHandleByUUID", return_value=MagicMock()),
+        patch(
+            "pynvml.nvmlDeviceGetDeviceHandleFromMigDeviceHandle",
+            return_value=parent,
+        ),
+        patch("pynvml.nvmlDeviceGetIndex", return_value=0),
+        patch("pynvml.nvmlDeviceGetCudaComputeCapability", return_value=(8, 0)),
+        patch(
+            "pynvml.nvmlDeviceGetMemoryInfo",
+            return_value=MagicMock(total=40 * 1024**3),
+        ),
+        patch(
+            "pynvml.nvmlDeviceGetNvLinkState", side_effect=pynvml.NVMLError_NotSupported
+        ),
+        patch.object(NvmlGpuInfo, "_mig_instances", return_value=(True, instances)),
+    ):
+        (device,) = NvmlGpuInfo(devices=["MIG-b"]).devices
+    assert [mig.uuid for mig in device.mig_instances] == ["MIG-b"]
+
+
+def test_nvml_gpu_info_mig_disabled():
+    with (
+        patch("pynvml.nvmlInit"),
+        patch("pynvml.nvmlDeviceGetCount", return_value=1),
+        patch("pynvml.nvmlSystemGetCudaDriverVersion", return_value=12060),
+        patch("pynvml.nvmlSystemGetDriverVersion", return_value="560.10"),
+        patch("pynvml.nvmlDeviceGetHandleByIndex", return_value=MagicMock()),
+        patch("pynvml.nvmlDeviceGetCudaComputeCapability", return_value=(8, 0)),
+        patch(
+            "pynvml.nvmlDeviceGetMemoryInfo",
+            return_value=MagicMock(total=40 * 1024**3),
+        ),
+        patch(
+            "pynvml.nvmlDeviceGetNvLinkState", side_effect=pynvml.NVMLError_NotSupported
+        ),
+        patch("pynvml.nvmlDeviceGetMigMode", return_value=[0, 0]),
+    ):
+        (device,) = NvmlGpuInfo().devices
+        assert device.mig_enabled is False
+        assert device.mig_instances == []
+
+
+def _mig_device():
+    return DeviceInfo(
+        index=0,
+        compute_capability=(8, 0),
+        memory_total_bytes=40 * 1024**3,
+        uuid="GPU-abc",
+        mig_enabled=True,
+        mig_instances=[
+            MigInstance(
+                0, 5 * 1024**3, "MIG-a", gpu_instance_id=1, compute_instance_id=0
+            ),
+            MigInstance(
+                1, 10 * 1024**3, "MIG-b", gpu_instance_id=2, compute_instance_id=0
+            ),
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "cuda_visible_devices, expected",
+    [
+        ("", ["MIG-a", "MIG-b"]),
+        ("0", ["MIG-a", "MIG-b"]),
+        ("MIG-b", ["MIG-b"]),
+        ("MIG-GPU-abc/1/0", ["MIG-a"]),
+        ("MIG-other", []),
+    ],
+)
+def test_visible_mig_instances(cuda_visible_devices, expected):
+    visible = visible_mig_instances(_mig_device(), cuda_visible_devices)
+    assert [mig.uuid for mig in visible] == expected
+
+
+def test_usable_memory_bytes(monkeypatch):
+    # Providers already dropped the instances not selected for this process.
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "MIG-b")
+    assert usable_memory_bytes(_mig_device()) == 15 * 1024**3
+    assert usable_memory_bytes(_mig_device(), "MIG-b") == 10 * 1024**3
+    whole = DeviceInfo(0, (8, 0), 40 * 1024**3, mig_enabled=False)
+    assert usable_memory_bytes(whole, "MIG-b") == 40 * 1024**3
+
+
+def test_nvml_gpu_info_memory_health():
+    ecc_errors = {
+        (pynvml.NVML_MEMORY_ERROR_TYPE_CORRECTED, pynvml.NVML_VOLATILE_ECC): 12,
+        (pynvml.NVML_MEMORY_ERROR_TYPE_UNCORRECTED, pynvml.NVML_VOLATILE_ECC): 1,
+        (pynvml.NVML_MEMORY_ERROR_TYPE_CORRECTED, pynvml.NVML_AGGREGATE_ECC): 340,
+        (pynvml.NVML_MEMORY_ERROR_TYPE_UNCORRECTED, pynvml.NVML_AGGREGATE_ECC): 2,
+    }
+    retired = {
+        pynvml.NVML_PAGE_RETIREMENT_CAUSE_MULTIPLE_SINGLE_BIT_ECC_ERRORS: [0x1000],
+        pynvml.NVML_PAGE_RETIREMENT_CAUSE_DOUBLE_BIT_ECC_ERROR: [0x2000, 0x3000],
+    }
+    with (
+        patch("pynvml.nvmlInit"),
+        patch("pynvml.nvmlDeviceGetCount", return_value=1),
+        patch("pynvml.nvmlSystemGetCudaDriverVersion", return_value=12060),
+        patch("pynvml.nvmlSystemGetDriverVersion", return_value="560.10"),
+        patch("pynvml.nvmlDeviceGetHandleByIndex", return_value=MagicMock()),
+        patch("pynvml.nvmlDeviceGetCudaComputeCapability", return_value=(8, 0)),
+        patch(
+            "pynvml.nvmlDeviceGetMemoryInfo",
+            return_value=MagicMock(total=40 * 1024**3),
+        ),
+        patch(
+            "pynvml.nvmlDeviceGetNvLinkState", side_effect=pynvml.NVMLError_NotSupported
+        ),
+        patch("pynvml.nvmlDeviceGetEccMode", return_value=[1, 1]),
+        patch(
+            "pynvml.nvmlDeviceGetTotalEccErrors",
+            side_effect=lambda handle, error, counter: ecc_errors[error, counter],
+        ),
+        patch(
+            "pynvml.nvmlDeviceGetRetiredPages",
+            side_effect=lambda handle, cause: retired[cause],
+        ),
+        patch(
+            "pynvml.nvmlDeviceGetRetiredPagesPendingStatus",
+            return_value=pynvml.NVML_FEATURE_DISABLED,
+        ),
+        patch(
+            "pynvml.nvmlDeviceGetRemappedRows", return_value=(3, 1, 1, 0)
+        ) as remapped_rows,
+    ):
+        gpu_info = NvmlGpuInfo()
+        gpu_info.refresh_health()
+        (device,) = gpu_info.devices
+        assert device.ecc_enabled is True
+        assert (device.ecc_corrected_volatile, device.ecc_uncorrected_volatile) == (
+            12,
+            1,
+        )
+        assert (device.ecc_corrected_aggregate, device.ecc_uncorrected_aggregate) == (
+            340,
+            2,
+        )
+        assert (device.retired_pages_sbe, device.retired_pages_dbe) == (1, 2)
+        assert device.retired_pages_pending is False
+        assert (
+            device.remapped_rows_correctable,
+            device.remapped_rows_uncorrectable,
+        ) == (3, 1)
+        assert device.row_remap_pending is True
+        assert device.row_remap_failed is False
+
+        # Refreshing re-reads the counters that grow as memory errors happen.
+        ecc_errors[
+            pynvml.NVML_MEMORY_ERROR_TYPE_CORRECTED, pynvml.NVML_VOLATILE_ECC
+        ] = 15
+        retired[pynvml.NVML_PAGE_RETIREMENT_CAUSE_DOUBLE_BIT_ECC_ERROR].append(0x4000)
+        remapped_rows.side_effect = pynvml.NVMLError_NotSupported
+        gpu_info.refresh_health()
+        assert device.ecc_corrected_volatile == 15
+        assert device.retired_pages_dbe == 3
+        assert device.remapped_rows_correctable is None
+        assert device.row_remap_pending is None
+
+
+def test_nvml_gpu_info_memory_health_unsupported():
+    with (
+        patch("pynvml.nvmlInit"),
+        patch("pynvml.nvmlDeviceGetCount", return_value=1),
+        patch("pynvml.nvmlSystemGetCudaDriverVersion", return_value=12060),
+        patch("pynvml.nvmlSystemGetDriverVersion", return_value="560.10"),
+        patch("pynvml.nvmlDeviceGetHandleByIndex", return_value=MagicMock()),
+        patch("pynvml.nvmlDeviceGetCudaComputeCapability", return_value=(7, 5)),
+        patch(
+            "pynvml.nvmlDeviceGetMemoryInfo",
+            return_value=MagicMock(total=16 * 1024**3),
+        ),
+        patch(
+            "pynvml.nvmlDeviceGetNvLinkState", side_effect=pynvml.NVMLError_NotSupported
+        ),
+        patch("pynvml.nvmlDeviceGetEccMode", return_value=[0, 0]),
+        patch(
+            "pynvml.nvmlDeviceGetTotalEccErrors",
+            side_effect=pynvml.NVMLError_NotSupported,
+        ) as ecc_errors,
+    ):
+        (device,) = NvmlGpuInfo().devices
+        assert device.ecc_enabled is False
+        assert device.ecc_uncorrected_volatile is None
+        assert device.row_remap_failed is None
+        ecc_errors.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "persistence, compute_mode, expected",
+    [
+        (pynvml.NVML_FEATURE_ENABLED, 0, (True, "default")),
+        (pynvml.NVML_FEATURE_DISABLED, 3, (False, "exclusive_process")),
+        (pynvml.NVML_FEATURE_DISABLED, 2, (False, "prohibited")),
+    ],
+)
+def test_nvml_gpu_info_persistence_and_compute_mode(
+    persistence, compute_mode, expected
+):
+    with (
+        patch("pynvml.nvmlInit"),
+        patch("pynvml.nvmlDeviceGetCount", return_value=1),
+        patch("pynvml.nvmlSystemGetCudaDriverVersion", return_value=12060),
+        patch("pynvml.nvmlSystemGetDriverVersion", return_value="560.10"),
+        patch("pynvml.nvmlDeviceGetHandleByIndex", return_value=MagicMock()),
+        patch("pynvml.nvmlDeviceGetCudaComputeCapability", return_value=(8, 0)),
+        patch(
+            "pynvml.nvmlDeviceGetMemoryInfo",
+            return_value=MagicMock(total=40 * 1024**3),
+        ),
+        patch(
+            "pynvml.nvmlDeviceGetNvLinkState", side_effect=pynvml.NVMLError_NotSupported
+        ),
+        patch("pynvml.nvmlDeviceGetPersistenceMode", return_value=persistence),
+        patch("pynvml.nvmlDeviceGetComputeMode", return_value=compute_mode),
+    ):
+        (device,) = NvmlGpuInfo().devices
+        assert (device.persistence_mode, device.compute_mode) == expected
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import resource
+from unittest.mock import patch
+
+import pytest
+
+from rapids_cli import host_memory
+from rapids_cli.doctor.checks.host_memory import check_host_memory_config
+from rapids_cli.tests.fakes import FakeSystemInfo
+
+MEMINFO = """\
+MemTotal:       263921376 kB
+HugePages_Total:      16
+HugePages_Free:        4
+Hugepagesize:       2048 kB
+"""
+
+
+def test_memlock_limits():
+    with patch(
+        "resource.getrlimit", return_value=(65536, resource.RLIM_INFINITY)
+    ) as getrlimit:
+        assert host_memory.memlock_limits() == (65536, None)
+    getrlimit.assert_called_once_with(resource.RLIMIT_MEMLOCK)
+    with patch("resource.prlimit", return_value=(0, 0)) as prlimit:
+        assert host_memory.memlock_limits(4242) == (0, 0)
+    prlimit.assert_called_once_with(4242, resource.RLIMIT_MEMLOCK)
+
+
+def test_shm_usage(tmp_path):
+    size, free = host_memory.shm_usage(tmp_path)
+    assert size >= free > 0
+    assert host_memory.shm_usage(tmp_path / "missing") is None
+
+
+@pytest.mark.parametrize(
+    "text, mode",
+    [("always [madvise] never\n", "madvise"), ("[always] madvise never", "always")],
+)
+def test_transparent_hugepage_mode(tmp_path, text, mode):
+    path = tmp_path / "enabled"
+    path.write_text(text)
+    assert host_memory.transparent_hugepage_mode(path) == mode
+    assert host_memory.transparent_hugepage_mode(tmp_path / "missing") is None
+
+
+def test_hugepages(tmp_path):
+    path = tmp_path / "meminfo"
+    path.write_text(MEMINFO)
+    assert host_memory.hugepages(path) == {
+        "total": 16,
+        "free": 4,
+        "page_size": 2 * 1024**2,
+    }
+    path.write_text("MemTotal: 1 kB\n")
+    assert host_memory.hugepages(path) == {}
+    assert host_memory.hugepages(tmp_path / "missing") == {}
+
+
+@pytest.fixture
+def host(monkeypatch, tmp_path, set_system_info):
+    """Fixture host with a 64 GiB /dev/shm, unlimited memlock and THP on madvise."""
+    thp = tmp_path / "enabled"
+    thp.write_text("always [madvise] never\n")
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_text("HugePages_Total: 0\n")
+    monkeypatch.setattr(host_memory, "THP_ENABLED_PATH", thp)
+    monkeypatch.setattr(host_memory, "MEMINFO_PATH", meminfo)
+    checks = "rapids_cli.doctor.checks.host_memory"
+    monkeypatch.setattr(f"{checks}.shm_usage", lambda: (64 * 1024**3, 60 * 1024**3))
+    set_system_info(FakeSystemInfo(memlock_limits=(None, None)))
+    return tmp_path
+
+
+def test_check_host_memory_config_ready(host, run_with_findings):
+    assert run_with_findings(check_host_memory_config, verbose=True, by_code=True) == (
+        "Shared memory, memlock and hugepage settings checked",
+        {},
+    )
+
+
+def test_check_host_memory_config_docker_defaults(
+    host, monkeypatch, set_system_info, run_with_findings
+):
+    checks = "rapids_cli.doctor.checks.host_memory"
+    monkeypatch.setattr(f"{checks}.shm_usage", lambda: (64 * 1024**2, 64 * 1024**2))
+    set_system_info(FakeSystemInfo(memlock_limits=(8 * 1024**2, 8 * 1024**2)))
+    (host / "enabled").write_text("always madvise [never]\n")
+    (host / "meminfo").write_text(MEMINFO)
+    result, findings = run_with_findings(check_host_memory_config, by_code=True)
+    assert result is True
+    assert "/dev/shm is only 0.06 GiB" in findings["small-dev-shm"].message
+    memlock = findings["low-memlock-limit"]
+    assert "8192 KiB" in memlock.message
+    assert "--ulimit memlock=-1" in memlock.message
+    assert findings["transparent-hugepages-disabled"].severity == "perf-advice"
+    assert findings["hugepage-pool"].metrics["free"] == 4
+
+
+def test_check_host_memory_config_shm_full(
+    host, monkeypatch, set_system_info, run_with_findings
+):
+    monkeypatch.setattr(
+        "rapids_cli.doctor.checks.host_memory.shm_usage",
+        lambda: (64 * 1024**3, 100 * 1024**2),
+    )
+    set_system_info(FakeSystemInfo(memlock_limits=(64 * 1024, None)))
+    _, findings = run_with_findings(check_host_memory_config, by_code=True)
+    assert findings["dev-shm-nearly-full"].severity == "warn"
+    assert "ulimit -l unlimited" in findings["low-memlock-limit"].message
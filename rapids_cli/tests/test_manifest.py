@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import json
+from unittest.mock import MagicMock
+
+from rapids_cli.doctor.manifest import CheckMetadata, read_manifest
+
+
+def _dist(files):
+    dist = MagicMock()
+    dist.read_text.side_effect = files.get
+    return dist
+
+
+def test_read_manifest_from_extra_metadata():
+    manifest = {
+        "gpu": {
+            "tags": ["nvml"],
+            "cost": 0.1,
+            "requires_gpu": True,
+            "volatile": False,
+            "requires": ["driver"],
+        }
+    }
+    dist = _dist({"extra_metadata/rapids_doctor_checks.json": json.dumps(manifest)})
+    assert read_manifest(dist) == {
+        "gpu": CheckMetadata(
+            tags=["nvml"],
+            cost=0.1,
+            requires_gpu=True,
+            volatile=False,
+            requires=["driver"],
+        )
+    }
+
+
+def test_read_manifest_fallback_location():
+    dist = _dist({"rapids_doctor_checks.json": '{"gpu": {}}'})
+    assert read_manifest(dist) == {"gpu": CheckMetadata()}
+
+
+def test_read_manifest_missing_or_invalid():
+    assert read_manifest(_dist({})) == {}
+    assert read_manifest(_dist({"rapids_doctor_checks.json": "not json"})) == {}
+    assert read_manifest(_dist({"rapids_doctor_checks.json": "[]"})) == {}
+
+    dist = MagicMock()
+    dist.read_text.side_effect = OSError
+    assert read_manifest(dist) == {}
+
+
+def test_metadata_ignores_malformed_fields():
+    metadata = CheckMetadata.from_dict(
+        {
+            "description": 1,
+            "tags": "gpu",
+            "cost": True,
+            "requires_gpu": "yes",
+            "volatile": "no",
+            "requires": ["gpu", 2],
+        }
+    )
+    assert metadata == CheckMetadata(requires=["gpu"])
+    assert metadata.volatile is True
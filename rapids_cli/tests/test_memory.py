@@ -3,11 +3,14 @@
 import pytest
 
 from rapids_cli.doctor.checks.memory import (
+    check_gpu_free_memory,
     check_memory_to_gpu_ratio,
     get_gpu_memory,
     get_system_memory,
+    min_free_gpu_memory,
 )
-from rapids_cli.hardware import DeviceInfo
+from rapids_cli.doctor.findings import FindingsCollector
+from rapids_cli.hardware import DeviceInfo, GpuProcess, MigInstance, SelectedGpuInfo
 from rapids_cli.tests.fakes import FailingGpuInfo, FakeGpuInfo, FakeSystemInfo
 
 
@@ -16,6 +19,13 @@ def test_get_system_memory(set_system_info):
     assert get_system_memory(verbose=False) == 32.0
 
 
+def test_get_system_memory_cgroup_limited(set_system_info):
+    set_system_info(
+        FakeSystemInfo(total_memory_bytes=512 * 1024**3, memory_limit_bytes=8 * 1024**3)
+    )
+    assert get_system_memory(verbose=False) == 8.0
+
+
 def test_get_gpu_memory_single_gpu(set_gpu_info):
     devices = [
         DeviceInfo(index=0, compute_capability=(7, 0), memory_total_bytes=16 * 1024**3)
@@ -33,6 +43,23 @@ def test_get_gpu_memory_multiple_gpus(set_gpu_info):
     assert get_gpu_memory(verbose=False) == 64.0  # 16 GB * 4 GPUs
 
 
+def test_get_gpu_memory_mig_instances(set_gpu_info):
+    device = DeviceInfo(
+        index=0,
+        compute_capability=(8, 0),
+        memory_total_bytes=80 * 1024**3,
+        mig_enabled=True,
+        mig_instances=[
+            MigInstance(0, 10 * 1024**3, uuid="MIG-a"),
+            MigInstance(1, 40 * 1024**3, uuid="MIG-b"),
+        ],
+    )
+    set_gpu_info(
+        SelectedGpuInfo(FakeGpuInfo(device_count=1, devices=[device]), ["MIG-a"])
+    )
+    assert get_gpu_memory() == 10.0
+
+
 def test_check_memory_to_gpu_ratio_good_ratio(set_gpu_info, set_system_info):
     devices = [
         DeviceInfo(index=0, compute_capability=(7, 0), memory_total_bytes=32 * 1024**3)
@@ -52,9 +79,203 @@ def test_check_memory_to_gpu_ratio_warning(set_gpu_info, set_system_info):
         assert check_memory_to_gpu_ratio(verbose=True) is True
 
 
+def test_check_memory_to_gpu_ratio_perf_advice(set_gpu_info, set_system_info):
+    devices = [
+        DeviceInfo(index=0, compute_capability=(7, 0), memory_total_bytes=32 * 1024**3)
+    ]
+    set_gpu_info(FakeGpuInfo(device_count=1, devices=devices))
+    set_system_info(FakeSystemInfo(total_memory_bytes=32 * 1024**3))
+    findings = FindingsCollector()
+    assert check_memory_to_gpu_ratio(verbose=True, findings=findings) is True
+    (finding,) = findings.findings
+    assert finding.severity == "perf-advice"
+    assert finding.code == "low-memory-to-gpu-ratio"
+    assert finding.metrics["ratio"] == 1.0
+
+
 def test_check_memory_to_gpu_ratio_no_gpu(set_gpu_info):
     set_gpu_info(FailingGpuInfo())
     with pytest.raises(
         ValueError, match="GPU not found. Please ensure GPUs are installed."
     ):
         check_memory_to_gpu_ratio(verbose=False)
+
+
+def test_check_memory_to_gpu_ratio_cgroup_limits(set_gpu_info, set_system_info):
+    devices = [
+        DeviceInfo(index=i, compute_capability=(8, 0), memory_total_bytes=40 * 1024**3)
+        for i in range(2)
+    ]
+    set_gpu_info(FakeGpuInfo(device_count=2, devices=devices))
+    set_system_info(
+        FakeSystemInfo(
+            total_memory_bytes=1024 * 1024**3,
+            memory_limit_bytes=64 * 1024**3,
+            cpu_limit=1.0,
+        )
+    )
+    findings = FindingsCollector()
+    assert check_memory_to_gpu_ratio(verbose=True, findings=findings) is True
+    ratio, cpus = findings.findings
+    assert ratio.code == "low-memory-to-gpu-ratio"
+    assert "limited to 64.0 GiB by the container's cgroup" in ratio.message
+    assert ratio.metrics["cgroup_limited"] is True
+    assert cpus.code == "low-cpu-limit-per-gpu"
+    assert cpus.metrics == {"cpu_limit": 1.0, "gpus": 2}
+
+
+@pytest.fixture
+def gpu_in_use(make_device):
+    """Build an 80 GiB GPU with the given free memory and compute processes."""
+
+    def _make(free_gib, processes=()):
+        return make_device(
+            memory_total_bytes=80 * 1024**3,
+            memory_free_bytes=free_gib * 1024**3,
+            processes=list(processes),
+        )
+
+    return _make
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(None, None), ("0.5", 0.5), ("2", 1.0), ("lots", None)],
+)
+def test_min_free_gpu_memory(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv("RAPIDS_CLI_MIN_FREE_GPU_MEMORY", raising=False)
+    else:
+        monkeypatch.setenv("RAPIDS_CLI_MIN_FREE_GPU_MEMORY", value)
+    assert min_free_gpu_memory() == expected
+
+
+def test_check_gpu_free_memory_idle(gpu_in_use, set_devices, run_with_findings):
+    gpu_info = set_devices(gpu_in_use(80))
+    assert run_with_findings(check_gpu_free_memory, verbose=True) == (
+        "Free memory checked on 1 GPU(s)",
+        [],
+    )
+    assert gpu_info.usage_refreshes == 1
+
+
+def test_check_gpu_free_memory_occupied(
+    gpu_in_use, set_devices, run_with_findings, monkeypatch
+):
+    monkeypatch.delenv("RAPIDS_CLI_MIN_FREE_GPU_MEMORY", raising=False)
+    holder = GpuProcess(pid=4242, name="python", used_memory_bytes=60 * 1024**3)
+    set_devices(gpu_in_use(20, [holder]))
+    result, (finding,) = run_with_findings(check_gpu_free_memory)
+    assert result is True
+    # Without an explicit threshold a GPU in use is no reason to fail.
+    assert finding.severity == "warn"
+    assert finding.code == "gpu-memory-occupied"
+    assert "only 25%" in finding.message
+    assert "PID 4242 (python) holding 60.0 GiB" in finding.message
+    assert finding.metrics["pids"] == [4242]
+    assert finding.metrics["required_free_fraction"] is None
+
+    monkeypatch.setenv("RAPIDS_CLI_MIN_FREE_GPU_MEMORY", "0.9")
+    _, (finding,) = run_with_findings(check_gpu_free_memory)
+    assert finding.severity == "error"
+    assert "only 25% of its memory free (20.0 GiB), below the required 90%." in (
+        finding.message
+    )
+
+
+def test_check_gpu_free_memory_threshold(
+    gpu_in_use, set_devices, run_with_findings, monkeypatch
+):
+    monkeypatch.setenv("RAPIDS_CLI_MIN_FREE_GPU_MEMORY", "0.2")
+    set_devices(gpu_in_use(20, [GpuProcess(pid=7)]))
+    _, (finding,) = run_with_findings(check_gpu_free_memory)
+    assert (finding.severity, finding.code) == ("warn", "gpu-in-use")
+    assert "PID 7." in finding.message
+
+
+def test_check_gpu_free_memory_mig(
+    make_device, set_devices, set_gpu_info, run_with_findings, monkeypatch
+):
+    monkeypatch.delenv("RAPIDS_CLI_MIN_FREE_GPU_MEMORY", raising=False)
+    holder = GpuProcess(pid=4242, name="python", used_memory_bytes=8 * 1024**3)
+    instances = [
+        MigInstance(0, 10 * 1024**3, uuid="MIG-aaaa", memory_free_bytes=10 * 1024**3),
+        MigInstance(
+            1,
+            10 * 1024**3,
+            uuid="MIG-bbbb",
+            memory_free_bytes=2 * 1024**3,
+            processes=[holder],
+        ),
+    ]
+    # The parent GPU has most of its memory free, which says nothing about
+    # the instances.
+    gpu_info = set_devices(
+        make_device(
+            memory_total_bytes=80 * 1024**3,
+            memory_free_bytes=62 * 1024**3,
+            uuid="GPU-0",
+            mig_enabled=True,
+            mig_instances=instances,
+        )
+    )
+    # Selecting one instance, as with --devices, ignores its full sibling and
+    # overrides CUDA_VISIBLE_DEVICES.
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "MIG-bbbb")
+    set_gpu_info(SelectedGpuInfo(gpu_info, ["MIG-aaaa"], strict=True))
+    assert run_with_findings(check_gpu_free_memory, verbose=True) == (
+        "Free memory checked on 1 GPU(s)",
+        [],
+    )
+    assert gpu_info.usage_refreshes == 1
+
+    set_gpu_info(gpu_info)
+    _, (finding,) = run_with_findings(check_gpu_free_memory)
+    assert finding.code == "gpu-memory-occupied"
+    assert finding.message.startswith(
+        "GPU 0 MIG instance 1 has only 20% of its memory free (2.0 GiB)"
+    )
+    assert "PID 4242 (python) holding 8.0 GiB" in finding.message
+    assert finding.metrics["mig_instance"] == 1
+
+
+def test_check_gpu_free_memory_no_usage_data(make_device, set_devices):
+    set_devices(make_device(memory_total_bytes=80 * 1024**3))
+    assert check_gpu_free_memory() is False
+
+
+def test_check_gpu_free_memory_no_gpu(set_gpu_info):
+    set_gpu_info(FailingGpuInfo())
+    with pytest.raises(ValueError, match="GPU not found"):
+        check_gpu_free_memory()
+
+
+def test_check_memory_to_gpu_ratio_mig(set_gpu_info, set_system_info, monkeypatch):
+    monkeypatch.delenv("CUDA_VISIBLE_DEVICES", raising=False)
+    # 64 GiB of RAM is too little for a whole 80 GiB card, but plenty for the
+    # two 10 GiB MIG slices this process can use.
+    device = DeviceInfo(
+        index=0,
+        compute_capability=(8, 0),
+        memory_total_bytes=80 * 1024**3,
+        mig_enabled=True,
+        mig_instances=[MigInstance(i, 10 * 1024**3) for i in range(2)],
+    )
+    set_gpu_info(FakeGpuInfo(device_count=1, devices=[device]))
+    set_system_info(FakeSystemInfo(total_memory_bytes=64 * 1024**3))
+    findings = FindingsCollector()
+    assert check_memory_to_gpu_ratio(findings=findings) is True
+    assert findings.findings == []
+
+    set_system_info(FakeSystemInfo(total_memory_bytes=16 * 1024**3))
+    check_memory_to_gpu_ratio(findings=findings)
+    (finding,) = findings.findings
+    assert "counts the 2 MIG instance(s)" in finding.message
+    assert finding.metrics["mig_instances"] == 2
+
+
+def test_check_memory_to_gpu_ratio_no_usable_memory(set_gpu_info, set_system_info):
+    device = DeviceInfo(0, (8, 0), 80 * 1024**3, mig_enabled=True)
+    set_gpu_info(FakeGpuInfo(device_count=1, devices=[device]))
+    set_system_info(FakeSystemInfo(total_memory_bytes=64 * 1024**3))
+    assert check_memory_to_gpu_ratio() is False
@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import functools
+
+import pytest
+
+from rapids_cli.doctor.checks.numa import check_numa_affinity
+from rapids_cli.tests.fakes import FailingGpuInfo, FakeSystemInfo
+
+GPU0, GPU1 = "0000:3b:00.0", "0000:af:00.0"
+
+
+@pytest.fixture
+def make_device(make_device):
+    """Build GPUs with 80 GiB of memory."""
+    return functools.partial(make_device, memory_total_bytes=80 * 1024**3)
+
+
+@pytest.fixture
+def two_gpus(make_device, set_devices):
+    set_devices(make_device(0, pci_bus_id=GPU0), make_device(1, pci_bus_id=GPU1))
+
+
+@pytest.fixture
+def dual_socket(sysfs, two_gpus):
+    sysfs.add_numa_node(0, "0-27", 256 * 1024**2)
+    sysfs.add_numa_node(1, "28-55", 256 * 1024**2)
+    sysfs.add_pci_device(GPU0, 0, "0-27")
+    sysfs.add_pci_device(GPU1, 1, "28-55")
+    return sysfs
+
+
+@pytest.fixture
+def affinity(set_system_info):
+    """Set the CPUs this process may run on, ``None`` for unknown."""
+
+    def _set(cpus):
+        set_system_info(FakeSystemInfo(cpu_affinity=cpus))
+
+    return _set
+
+
+def test_check_numa_affinity_all_cpus(dual_socket, affinity, run_with_findings):
+    affinity(set(range(56)))
+    result, findings = run_with_findings(check_numa_affinity, verbose=True)
+    assert result == "NUMA placement checked on 2 GPU(s)"
+    assert [(f.severity, f.code) for f in findings] == [("info", "gpu-numa-node")] * 2
+    assert "GPU 1 (0000:af:00.0) is on NUMA node 1 with local CPUs 28-55" in (
+        findings[1].message
+    )
+
+
+def test_check_numa_affinity_remote_cpus(dual_socket, affinity, run_with_findings):
+    affinity(set(range(28, 56)))
+    result, findings = run_with_findings(check_numa_affinity)
+    assert result is True
+    (advice,) = [f for f in findings if f.severity == "perf-advice"]
+    assert advice.code == "gpu-cpu-affinity-remote"
+    assert advice.metrics == {
+        "gpu": 0,
+        "numa_node": 0,
+        "affinity": "28-55",
+        "local_cpus": "0-27",
+    }
+
+
+def test_check_numa_affinity_low_node_memory(
+    sysfs, two_gpus, affinity, run_with_findings
+):
+    sysfs.add_numa_node(0, "0-27", 64 * 1024**2)
+    sysfs.add_pci_device(GPU0, 0, "0-27")
+    sysfs.add_pci_device(GPU1, 0, "0-27")
+    affinity(None)
+    _, findings = run_with_findings(check_numa_affinity)
+    (advice,) = [f for f in findings if f.severity == "perf-advice"]
+    assert advice.code == "low-numa-memory-to-gpu-ratio"
+    assert "NUMA node 0 has 64.0 GiB of memory for 160.0 GiB of GPU memory" in (
+        advice.message
+    )
+
+
+def test_check_numa_affinity_unknown_topology(
+    sysfs, make_device, set_devices, affinity, run_with_findings
+):
+    set_devices(make_device(0, pci_bus_id=GPU0), make_device(1))
+    assert check_numa_affinity() is False
+
+    sysfs.add_pci_device(GPU0, -1, "")
+    affinity(set(range(4)))
+    assert run_with_findings(check_numa_affinity) == (True, [])
+
+
+def test_check_numa_affinity_no_gpu(set_gpu_info):
+    set_gpu_info(FailingGpuInfo())
+    with pytest.raises(ValueError, match="GPU not found"):
+        check_numa_affinity()
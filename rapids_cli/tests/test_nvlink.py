@@ -2,8 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 import pytest
 
-from rapids_cli.doctor.checks.nvlink import check_nvlink_status
-from rapids_cli.hardware import DeviceInfo
+from rapids_cli.doctor.checks.nvlink import check_nvlink_status, check_nvlink_topology
+from rapids_cli.hardware import DeviceInfo, NvLinkRemote
 from rapids_cli.tests.fakes import FailingGpuInfo, FakeGpuInfo
 
 
@@ -79,3 +79,103 @@ def test_check_nvlink_status_mixed_link_counts(set_gpu_info):
     devices = [_make_device(0, [True] * 12), _make_device(1, [True] * 12)]
     set_gpu_info(FakeGpuInfo(device_count=2, devices=devices))
     assert check_nvlink_status(verbose=True) == "All NVLinks active across 2 GPUs"
+
+
+def _bus_id(index: int) -> str:
+    return f"0000:{index + 1:02x}:00.0"
+
+
+def _gpu(index: int) -> NvLinkRemote:
+    return NvLinkRemote(pci_bus_id=_bus_id(index), device_type="gpu")
+
+
+def _switch(address: str | None) -> NvLinkRemote:
+    return NvLinkRemote(pci_bus_id=address, device_type="switch")
+
+
+@pytest.fixture
+def set_links(make_device, set_devices):
+    """Install GPUs whose NVLinks reach the given endpoints, keyed by GPU index."""
+
+    def _set(links: dict[int, list[NvLinkRemote]]):
+        set_devices(
+            *(
+                make_device(
+                    i,
+                    compute_capability=(9, 0),
+                    nvlink_states=[True] * len(remotes),
+                    nvlink_remotes=dict(enumerate(remotes)),
+                    pci_bus_id=_bus_id(i),
+                )
+                for i, remotes in links.items()
+            )
+        )
+
+    return _set
+
+
+def test_check_nvlink_topology_switch_fabric(set_links, run_with_findings):
+    """Every GPU links to the same NVSwitch fabric — one group, nothing to report."""
+    links = {i: [_switch(None)] * 4 for i in range(4)}
+    set_links(links)
+    result, findings = run_with_findings(
+        check_nvlink_topology, verbose=True, by_code=True
+    )
+    assert result == "NVLink graph connects 4 GPUs in 1 group(s)"
+    assert list(findings) == ["nvlink-topology"]
+    assert findings["nvlink-topology"].metrics["switch_links"] == {
+        0: 4,
+        1: 4,
+        2: 4,
+        3: 4,
+    }
+
+
+def test_check_nvlink_topology_islands(set_links, run_with_findings):
+    """Two switches each serving half the GPUs — reported as separate islands."""
+    switch_a, switch_b = _switch("0000:a0:00.0"), _switch("0000:b0:00.0")
+    links = {0: [switch_a], 1: [switch_a], 2: [switch_b], 3: [switch_b], 4: []}
+    set_links(links)
+    result, findings = run_with_findings(check_nvlink_topology, by_code=True)
+    assert result is True
+    warning = findings["nvlink-partitioned"]
+    assert warning.severity == "warn"
+    assert "3 NVLink islands (GPUs 0, 1; GPUs 2, 3; GPUs 4)" in warning.message
+    assert warning.metrics["components"] == [[0, 1], [2, 3], [4]]
+
+
+def test_check_nvlink_topology_direct_mesh_asymmetry(set_links, run_with_findings):
+    """Direct GPU links with uneven pair and per-GPU link counts."""
+    links = {
+        0: [_gpu(1), _gpu(1), _gpu(2)],
+        1: [_gpu(0), _gpu(0), _gpu(2)],
+        # GPU 2 only reports its link to GPU 0; GPU 1 still sees the 1-2 link.
+        2: [_gpu(0)],
+    }
+    set_links(links)
+    _, findings = run_with_findings(check_nvlink_topology, by_code=True)
+    assert "nvlink-partitioned" not in findings
+    assert findings["nvlink-topology"].metrics["pair_links"] == {
+        "0-1": 2,
+        "0-2": 1,
+        "1-2": 1,
+    }
+    advice = findings["nvlink-bandwidth-asymmetry"]
+    assert advice.severity == "perf-advice"
+    assert advice.message.startswith(
+        "GPU 2 has 1 active NVLinks where other GPUs have 3"
+    )
+    assert findings["nvlink-pair-asymmetry"].severity == "info"
+
+
+def test_check_nvlink_topology_not_applicable(set_gpu_info):
+    """No remote endpoints reported — nothing to build a graph from."""
+    devices = [_make_device(0, [True] * 4), _make_device(1, [True] * 4)]
+    set_gpu_info(FakeGpuInfo(device_count=2, devices=devices))
+    assert check_nvlink_topology() is False
+
+
+def test_check_nvlink_topology_no_gpu(set_gpu_info):
+    set_gpu_info(FailingGpuInfo())
+    with pytest.raises(ValueError, match="GPU not found"):
+        check_nvlink_topology()
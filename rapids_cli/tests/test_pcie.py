@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import functools
+
+import pytest
+
+from rapids_cli.doctor.checks.pcie import check_pcie_link
+from rapids_cli.tests.fakes import FailingGpuInfo
+
+
+@pytest.fixture
+def make_device(make_device):
+    """Build GPUs whose PCIe link runs at Gen4 x16, its maximum."""
+    return functools.partial(
+        make_device,
+        pcie_link_generation=4,
+        pcie_max_link_generation=4,
+        pcie_link_width=16,
+        pcie_max_link_width=16,
+    )
+
+
+def test_check_pcie_link_full_speed(make_device, set_devices, run_with_findings):
+    gpu_info = set_devices(make_device(0), make_device(1))
+    assert run_with_findings(check_pcie_link, verbose=True) == (
+        "PCIe links checked on 2 GPU(s)",
+        [],
+    )
+    assert run_with_findings(check_pcie_link) == (True, [])
+    assert gpu_info.usage_refreshes == 2
+
+
+def test_check_pcie_link_width_degraded(make_device, set_devices, run_with_findings):
+    set_devices(
+        make_device(0), make_device(1, pcie_link_generation=3, pcie_link_width=8)
+    )
+    result, (finding,) = run_with_findings(check_pcie_link)
+    assert result is True
+    assert finding.severity == "warn"
+    assert finding.code == "pcie-width-degraded"
+    assert "GPU 1 PCIe link is running at Gen3 x8 instead of Gen4 x16" in (
+        finding.message
+    )
+    assert finding.metrics["width"] == 8
+
+
+def test_check_pcie_link_generation_below_max_is_informational(
+    make_device, set_devices, run_with_findings
+):
+    set_devices(make_device(0, pcie_link_generation=1))
+    result, (finding,) = run_with_findings(check_pcie_link)
+    assert result is True
+    assert (finding.severity, finding.code) == ("info", "pcie-generation-below-max")
+
+
+def test_check_pcie_link_unreported(make_device, set_devices):
+    set_devices(make_device(0, pcie_link_width=None))
+    assert check_pcie_link() is False
+
+
+def test_check_pcie_link_no_gpu(set_gpu_info):
+    set_gpu_info(FailingGpuInfo())
+    with pytest.raises(ValueError, match="GPU not found"):
+        check_pcie_link()
@@ -0,0 +1,265 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import os
+import signal
+import time
+from unittest.mock import MagicMock, patch
+
+import psutil
+import pytest
+
+from rapids_cli.doctor import pool
+from rapids_cli.doctor.doctor import (
+    CancellationToken,
+    CheckSpec,
+    doctor_check,
+    load_timings,
+)
+from rapids_cli.doctor.manifest import CheckMetadata
+from rapids_cli.doctor.pool import CheckProcessError, iter_checks_isolated
+from rapids_cli.providers import get_gpu_info
+from rapids_cli.tests.fakes import FakeGpuInfo, FakeSystemInfo
+
+
+def passing_check(verbose=False, **kwargs):
+    """Check that passes."""
+    return f"pid {os.getpid()}"
+
+
+def failing_check(verbose=False, **kwargs):
+    """Check that fails."""
+    raise ValueError("Check failed")
+
+
+def crashing_check(verbose=False, **kwargs):
+    """Check that segfaults."""
+    os.kill(os.getpid(), signal.SIGSEGV)
+
+
+def hanging_check(verbose=False, **kwargs):
+    """Check that never returns."""
+    time.sleep(60)
+
+
+def leaking_check(verbose=False, **kwargs):
+    """Check that allocates a lot of memory and holds on to it."""
+    data = bytearray(400 * 2**20)
+    for i in range(0, len(data), 4096):
+        data[i] = 1
+    time.sleep(60)
+
+
+def cooperative_check(verbose=False, cancel_token=None, **kwargs):
+    """Check that waits until its run is cancelled."""
+    cancel_token.wait(60)
+    cancel_token.raise_if_cancelled()
+
+
+def slow_check(verbose=False, **kwargs):
+    """Check that takes a while to pass."""
+    time.sleep(0.5)
+
+
+def gpu_provider_check(verbose=False, **kwargs):
+    """Check that reports which GPU provider it sees."""
+    gpu_info = get_gpu_info()
+    return f"{type(gpu_info).__name__} with {gpu_info.device_count} GPUs"
+
+
+def expensive_check(verbose=False, **kwargs):
+    """Check that declares a high cost."""
+    return True
+
+
+expensive_check.cost = 10.0  # type: ignore[attr-defined]
+
+
+@pytest.fixture(autouse=True)
+def _fake_providers(set_gpu_info, set_system_info):
+    set_gpu_info(FakeGpuInfo(device_count=2))
+    set_system_info(FakeSystemInfo())
+
+
+def _spec(name, check_fn, **metadata):
+    return CheckSpec(
+        name, f"m:{name}", metadata=CheckMetadata(**metadata), check_fn=check_fn
+    )
+
+
+def _by_name(results):
+    return {result.name: result for result in results}
+
+
+def test_isolated_results_in_worker_processes():
+    results = _by_name(
+        iter_checks_isolated(
+            [_spec("passing", passing_check), _spec("failing", failing_check)],
+            workers=2,
+        )
+    )
+    assert results["passing_check"].status is True
+    assert results["passing_check"].value != f"pid {os.getpid()}"
+    assert results["failing_check"].status is False
+    assert str(results["failing_check"].error) == "Check failed"
+    assert "m:passing" in load_timings()
+
+
+def test_isolated_checks_read_provider_snapshot():
+    (result,) = iter_checks_isolated([_spec("gpu", gpu_provider_check)])
+    assert result.value == "GpuInfoSnapshot with 2 GPUs"
+
+
+def test_isolated_crash_fails_only_that_check():
+    results = _by_name(
+        iter_checks_isolated(
+            [_spec("crash", crashing_check), _spec("passing", passing_check)], workers=1
+        )
+    )
+    assert isinstance(results["crashing_check"].error, CheckProcessError)
+    assert "killed by SIGSEGV" in str(results["crashing_check"].error)
+    assert results["passing_check"].status is True
+
+
+def test_isolated_check_timeout():
+    start = time.monotonic()
+    (result,) = iter_checks_isolated([_spec("hang", hanging_check)], check_timeout=0.2)
+    assert time.monotonic() - start < 5
+    assert result.status is False
+    assert "did not finish within 0.2s" in str(result.error)
+
+
+def test_isolated_rss_limit():
+    limit = psutil.Process().memory_info().rss + 200 * 2**20
+    (result,) = iter_checks_isolated([_spec("leak", leaking_check)], max_rss=limit)
+    assert result.status is False
+    assert "exceeded the RSS limit" in str(result.error)
+
+
+def test_isolated_budget():
+    results = _by_name(
+        iter_checks_isolated(
+            [_spec("expensive", expensive_check), _spec("hang", hanging_check)],
+            budget=0.3,
+        )
+    )
+    assert results["expensive_check"].skip_reason == "not run (budget)"
+    assert results["hanging_check"].skip_reason == "cancelled (budget)"
+
+
+def test_isolated_budget_bounds_provider_snapshot():
+    def snapshot_providers():
+        time.sleep(2)
+
+    start = time.monotonic()
+    with patch.object(pool.providers, "snapshot_providers", snapshot_providers):
+        results = list(
+            iter_checks_isolated([_spec("passing", passing_check)], budget=0.2)
+        )
+    assert time.monotonic() - start < 1
+    assert [r.skip_reason for r in results] == ["not run (budget)"]
+
+
+def test_isolated_no_checks():
+    assert list(iter_checks_isolated([])) == []
+
+
+def test_doctor_check_isolate(capsys):
+    mock_ep = MagicMock()
+    mock_ep.name = "crash"
+    mock_ep.value = "test.module:crash"
+    mock_ep.load.return_value = crashing_check
+
+    with (
+        patch("rapids_cli.doctor.doctor.entry_points", return_value=[mock_ep]),
+        patch("rapids_cli.doctor.doctor.NvmlGpuInfo", FakeGpuInfo),
+        patch("rapids_cli.doctor.doctor.DefaultSystemInfo", FakeSystemInfo),
+    ):
+        assert doctor_check(verbose=False, dry_run=False, isolate=True) is False
+
+    captured = capsys.readouterr()
+    assert "crashing_check failed" in captured.out
+    assert "SIGSEGV" in captured.out
+
+
+def test_isolated_prerequisites():
+    results = _by_name(
+        iter_checks_isolated(
+            [
+                _spec("dependent", passing_check, requires=["failing"]),
+                _spec("failing", failing_check),
+            ],
+            workers=2,
+        )
+    )
+    assert results["failing_check"].status is False
+    assert results["passing_check"].skip_reason == "not run (requires failing)"
+
+
+def test_isolated_prerequisites_do_not_hold_up_other_checks():
+    started = []
+    results = list(
+        iter_checks_isolated(
+            [
+                _spec("slow", slow_check),
+                _spec("dependent", passing_check, requires=["slow"]),
+                _spec("failing", failing_check),
+            ],
+            workers=2,
+            on_start=lambda index, total, name: started.append(name),
+        )
+    )
+    assert started == ["slow_check", "failing_check", "passing_check"]
+    assert [r.name for r in results] == ["failing_check", "slow_check", "passing_check"]
+
+
+def test_isolated_replaces_worker_that_died_while_idle():
+    def kill_idle_workers(index, total, name):
+        if index == 1:
+            for child in psutil.Process().children():
+                os.kill(child.pid, signal.SIGKILL)
+                while child.status() != psutil.STATUS_ZOMBIE:
+                    time.sleep(0.01)
+
+    results = _by_name(
+        iter_checks_isolated(
+            [_spec("failing", failing_check), _spec("passing", passing_check)],
+            workers=1,
+            on_start=kill_idle_workers,
+        )
+    )
+    assert results["failing_check"].status is False
+    assert results["passing_check"].status is True
+
+
+def test_isolated_fail_fast(monkeypatch):
+    monkeypatch.setattr(pool, "_CANCEL_GRACE", 0.2)
+    start = time.monotonic()
+    results = _by_name(
+        iter_checks_isolated(
+            [
+                _spec("cooperative", cooperative_check),
+                _spec("hang", hanging_check),
+                _spec("failing", failing_check),
+                _spec("passing", passing_check),
+            ],
+            workers=3,
+            fail_fast=True,
+        )
+    )
+    assert time.monotonic() - start < 5
+    assert results["failing_check"].status is False
+    assert results["failing_check"].skip_reason is None
+    assert results["cooperative_check"].skip_reason == "cancelled (fail-fast)"
+    assert results["cooperative_check"].error is None
+    assert results["hanging_check"].skip_reason == "cancelled (fail-fast)"
+    assert results["passing_check"].skip_reason == "cancelled (fail-fast)"
+    assert set(load_timings()) == {"m:failing"}
+
+
+def test_isolated_external_cancellation():
+    token = CancellationToken()
+    token.cancel()
+    results = list(
+        iter_checks_isolated([_spec("passing", passing_check)], cancel_token=token)
+    )
+    assert [r.skip_reason for r in results] == ["cancelled"]
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+from unittest.mock import patch
+
+import pytest
+
+from rapids_cli.topology import (
+    GpuTopology,
+    format_cpulist,
+    gpu_topology,
+    numa_nodes,
+    parse_cpulist,
+    process_affinity,
+)
+
+
+@pytest.mark.parametrize(
+    "text, cpus",
+    [
+        ("0-3,8,10-11\n", {0, 1, 2, 3, 8, 10, 11}),
+        ("5", {5}),
+        ("", set()),
+    ],
+)
+def test_cpulist_round_trip(text, cpus):
+    assert parse_cpulist(text) == cpus
+    assert format_cpulist(cpus) == text.strip()
+
+
+def test_numa_nodes(sysfs):
+    sysfs.add_numa_node(1, "28-55", 128 * 1024**2)
+    sysfs.add_numa_node(0, "0-27", 64 * 1024**2)
+    nodes = numa_nodes()
+    assert [n.node for n in nodes] == [0, 1]
+    assert nodes[0].cpus == set(range(28))
+    assert nodes[1].memory_total_bytes == 128 * 1024**3
+
+
+def test_numa_nodes_missing(tmp_path):
+    assert numa_nodes(tmp_path) == []
+
+
+def test_gpu_topology(sysfs):
+    sysfs.add_pci_device("0000:3b:00.0", 1, "28-55")
+    assert gpu_topology(0, "0000:3b:00.0") == GpuTopology(
+        index=0, pci_bus_id="0000:3b:00.0", numa_node=1, local_cpus=set(range(28, 56))
+    )
+    assert gpu_topology(1, "0000:af:00.0") is None
+
+
+def test_gpu_topology_without_numa(sysfs):
+    sysfs.add_pci_device("0000:3b:00.0", -1, "")
+    topology = gpu_topology(0, "0000:3b:00.0", sysfs.root)
+    assert (topology.numa_node, topology.local_cpus) == (None, set())
+
+
+def test_process_affinity():
+    with patch(
+        "os.sched_getaffinity", return_value={0, 1}, create=True
+    ) as sched_getaffinity:
+        assert process_affinity() == {0, 1}
+        assert process_affinity(4242) == {0, 1}
+    assert [c.args for c in sched_getaffinity.call_args_list] == [(0,), (4242,)]
@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+import threading
+
+import pytest
+
+from rapids_cli._watchdog import WatchdogTimeoutError, call_with_timeout
+
+
+def test_call_with_timeout_returns_value():
+    assert call_with_timeout(lambda x, y=0: x + y, 1.0, 1, y=2) == 3
+
+
+def test_call_with_timeout_without_timeout_calls_directly():
+    assert (
+        call_with_timeout(threading.current_thread, None) is threading.current_thread()
+    )
+
+
+def test_call_with_timeout_reraises_errors():
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        call_with_timeout(fail, 1.0)
+
+
+def test_call_with_timeout_abandons_blocked_call():
+    release = threading.Event()
+
+    def blocked():
+        release.wait()
+
+    with pytest.raises(
+        WatchdogTimeoutError, match="blocked did not finish within 0.01s"
+    ):
+        call_with_timeout(blocked, 0.01)
+    release.set()
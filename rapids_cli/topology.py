@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""GPU to NUMA node topology read from Linux sysfs.
+
+Every function takes an optional ``root`` standing in for ``/sys`` so it can be
+pointed at a fixture tree. Missing or unreadable files are treated as unknown
+rather than as errors, since containers and non-Linux systems often hide them.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+SYSFS_ROOT = Path("/sys")
+
+_MEMTOTAL = re.compile(r"MemTotal:\s+(\d+)\s*kB")
+
+
+@dataclass
+class NumaNode:
+    """A NUMA node and the CPUs and memory local to it."""
+
+    node: int
+    cpus: set[int] = field(default_factory=set)
+    memory_total_bytes: int | None = None
+
+
+@dataclass
+class GpuTopology:
+    """Where a GPU sits relative to the NUMA nodes.
+
+    Attributes:
+        index: NVML device index.
+        pci_bus_id: The GPU's sysfs PCI address.
+        numa_node: The NUMA node the GPU is attached to, or ``None`` when the
+            platform does not report one.
+        local_cpus: CPUs on the GPU's NUMA node. Empty when unknown.
+    """
+
+    index: int
+    pci_bus_id: str
+    numa_node: int | None = None
+    local_cpus: set[int] = field(default_factory=set)
+
+
+def parse_cpulist(text: str) -> set[int]:
+    """Parse a kernel CPU list such as ``"0-3,8,10-11"`` into a set of CPUs."""
+    cpus: set[int] = set()
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        cpus.update(range(int(start), int(end or start) + 1))
+    return cpus
+
+
+def format_cpulist(cpus: set[int]) -> str:
+    """Format a set of CPUs in the kernel's compact ``"0-3,8"`` form."""
+    ranges: list[list[int]] = []
+    for cpu in sorted(cpus):
+        if ranges and cpu == ranges[-1][1] + 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(
+        str(start) if start == end else f"{start}-{end}" for start, end in ranges
+    )
+
+
+def _read(path: Path) -> str | None:
+    try:
+        return path.read_text()
+    except OSError:
+        return None
+
+
+def numa_nodes(root: Path | None = None) -> list[NumaNode]:
+    """Return the system's NUMA nodes, or an empty list when sysfs has none."""
+    node_dir = (root or SYSFS_ROOT) / "devices" / "system" / "node"
+    nodes = []
+    for path in node_dir.glob("node[0-9]*"):
+        cpulist = _read(path / "cpulist")
+        meminfo = _read(path / "meminfo") or ""
+        match = _MEMTOTAL.search(meminfo)
+        nodes.append(
+            NumaNode(
+                node=int(path.name[len("node") :]),
+                cpus=parse_cpulist(cpulist) if cpulist else set(),
+                memory_total_bytes=int(match.group(1)) * 1024 if match else None,
+            )
+        )
+    return sorted(nodes, key=lambda n: n.node)
+
+
+def gpu_topology(
+    index: int, pci_bus_id: str, root: Path | None = None
+) -> GpuTopology | None:
+    """Return the NUMA placement of the GPU at ``pci_bus_id``.
+
+    Returns ``None`` when sysfs has no such PCI device.
+    """
+    device = (root or SYSFS_ROOT) / "bus" / "pci" / "devices" / pci_bus_id
+    if not device.exists():
+        return None
+    try:
+        node: int | None = int(_read(device / "numa_node") or "")
+    except ValueError:
+        node = None
+    # The kernel reports -1 when the platform has no NUMA information.
+    if node is not None and node < 0:
+        node = None
+    cpulist = _read(device / "local_cpulist")
+    return GpuTopology(
+        index=index,
+        pci_bus_id=pci_bus_id,
+        numa_node=node,
+        local_cpus=parse_cpulist(cpulist) if cpulist else set(),
+    )
+
+
+def process_affinity(pid: int | None = None) -> set[int] | None:
+    """Return the CPUs a process may run on, or ``None`` where unsupported.
+
+    Args:
+        pid: The process to look at. Defaults to this one.
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        return None
+    return set(os.sched_getaffinity(pid or 0))